@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Cold-start import benchmark for the CLI and the package.
+
+Runs each startup path in fresh interpreters, reports its wall time over a
+bare interpreter, and checks it does not import heavy modules (pdfplumber,
+pydantic, asyncio, the LLM SDKs) before their stage runs. Exits with status
+1 when a path imports a module it must not, or is slower than the budget,
+so it can guard the deferred imports in CI.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 --budget-ms 150
+    python benchmarks/import_time.py -o import_times.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that belong to a later stage (PDF parsing, validation, LLM requests, OCR)
+HEAVY_MODULES = (
+    'pdfplumber', 'pdfminer', 'pypdfium2', 'pydantic', 'asyncio', 'httpx',
+    'openai', 'anthropic', 'pytesseract', 'pdf2image',
+)
+
+# Modules that only the LLM stage may import
+LLM_MODULES = ('asyncio', 'httpx', 'openai', 'anthropic')
+
+# (name, statement run with `python -c`, modules it must not import)
+CASES = [
+    ('import extractor', 'import extractor', HEAVY_MODULES),
+    ('import main', 'import main', HEAVY_MODULES),
+    ('pdfx --help', "import sys, main; sys.argv = ['pdfx', '--help']; main.main()", HEAVY_MODULES),
+    ('pdfx batch --help', "import main; main.main(['batch', '--help'])", HEAVY_MODULES),
+    ('pdfx serve --help', "import main; main.main(['serve', '--help'])", HEAVY_MODULES),
+    ('construction service (no LLM)',
+     'from extractor.services import ExtractionServiceFactory; '
+     'ExtractionServiceFactory.create_construction_service()', LLM_MODULES),
+]
+
+# Default budget for a CLI startup path, in milliseconds over a bare interpreter
+DEFAULT_BUDGET_MS = 200.0
+
+
+def _run(statement: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', statement]
+    # --help exits through SystemExit; that is a normal end here
+    return subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+
+
+def _best_wall(statement: str, repeat: int) -> float:
+    """Fastest wall time of `repeat` fresh interpreters running statement, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        _run(statement)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def imported_modules(statement: str) -> Set[str]:
+    """Names of every module a fresh interpreter imports while running statement."""
+    result = _run(statement, importtime=True)
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and line.count('|') == 2:
+            name = line.rsplit('|', 1)[1].strip()
+            if name != 'package':
+                modules.add(name)
+    return modules
+
+
+def _violations(modules: Set[str], forbidden: tuple) -> List[str]:
+    return sorted(
+        name for name in modules
+        if any(name == root or name.startswith(root + '.') for root in forbidden)
+    )
+
+
+def run_import_benchmarks(repeat: int = 5) -> Dict[str, Any]:
+    """Time every case and collect the forbidden modules each one imports."""
+    baseline = _best_wall('pass', repeat)
+    cases = []
+    for name, statement, forbidden in CASES:
+        modules = imported_modules(statement)
+        violations = _violations(modules, forbidden)
+        wall = _best_wall(statement, repeat)
+        cases.append({
+            'name': name,
+            'ms': round((wall - baseline) * 1000, 1),
+            'modules': len(modules),
+            # Only the roots, e.g. 'pdfplumber' rather than every pdfplumber submodule
+            'forbidden_imported': sorted({violation.split('.')[0] for violation in violations}),
+        })
+    return {
+        'python': sys.version.split()[0],
+        'interpreter_ms': round(baseline * 1000, 1),
+        'repeat': repeat,
+        'cases': cases,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold-start import benchmark for pdf-extractor')
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per case, fastest is reported (default: 5)')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Fail when a CLI startup path takes longer (default: {DEFAULT_BUDGET_MS:.0f} ms '
+                             'over a bare interpreter; the service case is not budgeted)')
+    parser.add_argument('-o', '--output', type=str, default=None, help='Write results JSON to this path')
+    args = parser.parse_args()
+
+    results = run_import_benchmarks(args.repeat)
+    failures = []
+    print(f"Python {results['python']}, bare interpreter {results['interpreter_ms']} ms (best of {args.repeat})\n")
+    print(f"{'case':<32} {'ms':>8} {'modules':>8}  forbidden imports")
+    for case in results['cases']:
+        print(f"{case['name']:<32} {case['ms']:>8.1f} {case['modules']:>8}  {', '.join(case['forbidden_imported']) or '-'}")
+        if case['forbidden_imported']:
+            failures.append(f"{case['name']}: imports {', '.join(case['forbidden_imported'])}")
+        if not case['name'].startswith('construction service') and case['ms'] > args.budget_ms:
+            failures.append(f"{case['name']}: {case['ms']} ms > budget {args.budget_ms} ms")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"\nResults written to {args.output}")
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nOK: no heavy module is imported before its stage runs")
+
+
+if __name__ == '__main__':
+    main()
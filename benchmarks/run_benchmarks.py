@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Offline throughput benchmarks for the extraction pipeline.
+
+Generates a synthetic construction PDF, then times each stage separately:
+PDF text extraction, regex item extraction, table parsing, regex/LLM merge
+and JSON serialization. Results can be saved as a baseline JSON file and
+later runs compared against it to catch regressions.
+
+Usage:
+    python benchmarks/run_benchmarks.py --pages 100
+    python benchmarks/run_benchmarks.py --pages 100 --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --pages 100 --compare benchmarks/baseline.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Run from a source checkout without installing
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_pdf import generate_pdf
+
+
+# Settings used to pull the ruled schedules out of the synthetic PDF (benchmark setup only)
+SCHEDULE_TABLE_SETTINGS = {
+    "vertical_strategy": "lines_strict",
+    "horizontal_strategy": "lines_strict",
+}
+
+
+def _best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Run func `repeat` times and return the fastest wall time in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+def _schedule_tables(pdf_path: Path) -> List[List[List[List[str]]]]:
+    """Extract the ruled schedules of every page (untimed benchmark input for parse_tables)."""
+    import pdfplumber
+
+    tables = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            tables.append(page.extract_tables(SCHEDULE_TABLE_SETTINGS) or [])
+    return tables
+
+
+def _simulated_llm_items(regex_items: List[Dict[str, Any]], seed: int) -> List[Dict[str, Any]]:
+    """
+    Build an LLM-like item list from the regex items.
+
+    Most regex items reappear with small differences (casing, missing
+    fields, extra dimensions); some are dropped and some new ones are added,
+    which exercises every branch of the merge.
+    """
+    rng = random.Random(seed)
+    llm_items = []
+    for item in regex_items:
+        roll = rng.random()
+        if roll < 0.15:
+            continue
+        llm_item = {key: item.get(key) for key in ('fixture_type', 'model_number', 'quantity', 'page_number')}
+        if roll < 0.5 and llm_item['fixture_type']:
+            llm_item['fixture_type'] = llm_item['fixture_type'].upper()
+        if roll > 0.8:
+            llm_item['model_number'] = None
+        llm_item['dimensions'] = item.get('dimensions') or "2' -6\""
+        llm_items.append(llm_item)
+    for idx in range(len(regex_items) // 10):
+        llm_items.append({
+            'fixture_type': f'Expansion Tank {idx}',
+            'model_number': f'ET-{idx}',
+            'quantity': rng.randint(1, 9),
+            'page_number': rng.randint(1, 10),
+        })
+    rng.shuffle(llm_items)
+    return llm_items
+
+
+def run_benchmarks(pages: int, seed: int = 0, repeat: int = 3, workdir: Path = None) -> Dict[str, Any]:
+    """
+    Generate a synthetic PDF and time every pipeline stage.
+
+    Args:
+        pages: Number of pages in the synthetic PDF
+        seed: Random seed for the PDF content
+        repeat: Runs per stage (the fastest run is reported)
+        workdir: Directory for the generated PDF and JSON output
+
+    Returns:
+        Results dictionary with 'meta' and per-stage 'results'
+    """
+    from extractor.extractors import PDFTextExtractor
+    from extractor.parsers import ConstructionParser
+    from extractor.services import ExtractionServiceFactory
+    from extractor.utils.helpers import save_json
+
+    workdir = Path(workdir or tempfile.mkdtemp(prefix='pdfx-bench-'))
+    pdf_path = generate_pdf(workdir / f'synthetic_{pages}p.pdf', pages=pages, seed=seed)
+
+    extractor = PDFTextExtractor()
+    parser = ConstructionParser()
+    service = ExtractionServiceFactory.create_construction_service()
+    strategy = service.strategy
+
+    results = {}
+
+    # 1. PDF text extraction
+    pages_data = []
+
+    def extract_text():
+        pages_data[:] = extractor.extract_text(pdf_path, show_progress=False)
+    seconds = _best_of(extract_text, repeat)
+    results['extract_text'] = {'seconds': seconds, 'pages_per_sec': _rate(len(pages_data), seconds)}
+
+    # 2. Regex item extraction
+    total_lines = sum(len(page['text'].split('\n')) for page in pages_data)
+    regex_items = []
+
+    def extract_items():
+        regex_items[:] = [
+            item for page in pages_data
+            for item in parser.extract_items(page['text'], page['page_num'])
+        ]
+    seconds = _best_of(extract_items, repeat)
+    results['extract_items'] = {
+        'seconds': seconds,
+        'pages_per_sec': _rate(len(pages_data), seconds),
+        'lines_per_sec': _rate(total_lines, seconds),
+        'items': len(regex_items),
+    }
+
+    # 3. Table parsing (schedules extracted once, untimed)
+    tables_per_page = _schedule_tables(pdf_path)
+    table_rows = sum(len(table) for tables in tables_per_page for table in tables)
+    table_items = []
+
+    def parse_tables():
+        table_items[:] = [
+            item for page_num, tables in enumerate(tables_per_page, start=1) if tables
+            for item in parser.parse_tables(tables, page_num)
+        ]
+    seconds = _best_of(parse_tables, repeat)
+    results['parse_tables'] = {
+        'seconds': seconds,
+        'rows_per_sec': _rate(table_rows, seconds),
+        'items': len(table_items),
+    }
+
+    # 4. Regex/LLM merge
+    all_regex_items = regex_items + table_items
+    llm_items = _simulated_llm_items(all_regex_items, seed)
+    merged = []
+
+    def merge():
+        merged[:] = strategy._merge_regex_and_llm_items(all_regex_items, llm_items)
+    seconds = _best_of(merge, repeat)
+    results['merge'] = {
+        'seconds': seconds,
+        'regex_items': len(all_regex_items),
+        'llm_items': len(llm_items),
+        'items_per_sec': _rate(len(all_regex_items) + len(llm_items), seconds),
+    }
+
+    # 5. JSON serialization of the full result
+    output = strategy.extract(pages_data, str(pdf_path))
+    output_path = workdir / 'output.json'
+    seconds = _best_of(lambda: save_json(output, output_path), repeat)
+    results['save_json'] = {
+        'seconds': seconds,
+        'bytes': output_path.stat().st_size,
+        'mb_per_sec': round(output_path.stat().st_size / seconds / 1e6, 2) if seconds > 0 else 0.0,
+    }
+
+    for stage in results.values():
+        stage['seconds'] = round(stage['seconds'], 6)
+
+    return {
+        'meta': {
+            'pages': pages,
+            'seed': seed,
+            'repeat': repeat,
+            'lines': total_lines,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compare stage timings against a baseline.
+
+    Args:
+        current: Results of this run
+        baseline: Previously saved results
+        threshold: Allowed slowdown ratio (e.g. 1.2 = 20% slower)
+
+    Returns:
+        List of regression descriptions (empty if none)
+    """
+    regressions = []
+    print(f"\n{'Stage':<16}{'Baseline (s)':>14}{'Current (s)':>14}{'Ratio':>9}")
+    print('-' * 53)
+    for stage, stats in current['results'].items():
+        base = baseline.get('results', {}).get(stage)
+        if not base or not base.get('seconds'):
+            print(f"{stage:<16}{'-':>14}{stats['seconds']:>14.4f}{'new':>9}")
+            continue
+        ratio = stats['seconds'] / base['seconds']
+        flag = '  ⚠️' if ratio > threshold else ''
+        print(f"{stage:<16}{base['seconds']:>14.4f}{stats['seconds']:>14.4f}{ratio:>8.2f}x{flag}")
+        if ratio > threshold:
+            regressions.append(f"{stage}: {ratio:.2f}x slower than baseline")
+    if baseline.get('meta', {}).get('pages') != current['meta']['pages']:
+        print("\n⚠️  Baseline was recorded with a different page count - ratios are not comparable")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline throughput benchmarks for pdf-extractor')
+    parser.add_argument('--pages', type=int, default=50, help='Pages in the synthetic PDF (default: 50)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the synthetic PDF (default: 0)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per stage, fastest is reported (default: 3)')
+    parser.add_argument('--workdir', type=str, default=None, help='Directory for generated files (default: temp dir)')
+    parser.add_argument('-o', '--output', type=str, default=None, help='Write results JSON to this path')
+    parser.add_argument('--save-baseline', type=str, default=None, metavar='PATH',
+                        help='Write results as the baseline JSON for later comparisons')
+    parser.add_argument('--compare', type=str, default=None, metavar='PATH',
+                        help='Compare against a baseline JSON; exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='Slowdown ratio counted as a regression (default: 1.2)')
+    args = parser.parse_args()
+
+    print(f"⏱️  Benchmarking {args.pages} synthetic page(s) (best of {args.repeat})...", flush=True)
+    report = run_benchmarks(args.pages, seed=args.seed, repeat=args.repeat, workdir=args.workdir)
+
+    print(f"\n{'Stage':<16}{'Seconds':>10}  Throughput")
+    print('-' * 60)
+    for stage, stats in report['results'].items():
+        rates = ', '.join(f"{key}={value}" for key, value in stats.items() if key != 'seconds')
+        print(f"{stage:<16}{stats['seconds']:>10.4f}  {rates}")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"\n💾 Results saved to: {path}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print("\n❌ Regressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
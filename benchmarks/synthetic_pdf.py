@@ -0,0 +1,146 @@
+"""
+Synthetic construction PDF generator for offline benchmarks.
+
+Writes small, valid PDF files without any third-party dependency. Pages mix
+free-text spec notes, fixture lines with model numbers (OM-141 style) and
+feet-inch dimensions, and ruled fixture schedules drawn with real line
+operators so pdfplumber's table finder has something to work on.
+"""
+import random
+from pathlib import Path
+from typing import List, Tuple
+
+PAGE_WIDTH = 792   # 11" x 8.5" landscape sheet
+PAGE_HEIGHT = 612
+
+FIXTURES = [
+    'VALVE PACKAGE', 'CIRCULATING PUMP', 'EYE WASH STATION', 'BOOSTER PUMP',
+    'FLOOR DRAIN', 'WALL HUNG TOILET', 'SERVICE SINK', 'COOLING TOWER',
+    'PAINT BOOTH', 'BODY REPAIR SHOP FIXTURES', 'BACKFLOW PREVENTER', 'WATER HEATER',
+]
+MOUNTINGS = ['wall-mounted', 'floor-mounted', 'ceiling mounted', 'recessed', 'surface mount']
+SPEC_SENTENCES = [
+    'All piping shall conform to ASTM B88 Type L copper unless noted otherwise.',
+    'Contractor shall coordinate sleeve locations with structural drawings.',
+    'Provide isolation valves at each branch connection to equipment.',
+    'Insulate domestic hot water piping per specification section 22 07 19.',
+    'Hangers shall be spaced at maximum 10 feet on center for steel pipe.',
+    'Copyright reserved. Use in whole or in part is strictly prohibited.',
+    'SEE DRAWING M-501 FOR CONTINUATION.',
+    'Note: verify all dimensions in field prior to fabrication.',
+]
+
+
+def _escape(text: str) -> str:
+    """Escape a string for use inside a PDF literal string."""
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _dimension(rng: random.Random) -> str:
+    return f"{rng.randint(1, 40)}' -{rng.randint(0, 11)} {rng.choice(['1/2', '3/8', '5/8', '3/4'])}\""
+
+
+def _model(rng: random.Random) -> str:
+    return f"{rng.choice(['OM', 'HUH', 'MAU', 'CP', 'EW'])}-{rng.randint(1, 299)}"
+
+
+def _fixture_line(rng: random.Random) -> str:
+    return (f"{rng.choice(FIXTURES)} {_model(rng)} QTY: {rng.randint(1, 40)} "
+            f"{_dimension(rng)} {rng.choice(MOUNTINGS)}")
+
+
+def _text_ops(lines: List[str], x: float, y: float, size: float = 8, leading: float = 10) -> List[str]:
+    ops = []
+    for line in lines:
+        ops.append(f"BT /F1 {size} Tf {x:.1f} {y:.1f} Td ({_escape(line)}) Tj ET")
+        y -= leading
+    return ops
+
+
+def _schedule_ops(rows: List[List[str]], x: float, y: float, col_width: float = 110,
+                  row_height: float = 14) -> List[str]:
+    """Draw a ruled table with its grid lines and cell text."""
+    n_rows = len(rows)
+    n_cols = len(rows[0])
+    width = n_cols * col_width
+    height = n_rows * row_height
+    ops = ['0.5 w']
+    for r in range(n_rows + 1):
+        ry = y - r * row_height
+        ops.append(f"{x:.1f} {ry:.1f} m {x + width:.1f} {ry:.1f} l S")
+    for c in range(n_cols + 1):
+        cx = x + c * col_width
+        ops.append(f"{cx:.1f} {y:.1f} m {cx:.1f} {y - height:.1f} l S")
+    for r, row in enumerate(rows):
+        for c, cell in enumerate(row):
+            ops.extend(_text_ops([cell], x + c * col_width + 3, y - (r + 1) * row_height + 4, size=7))
+    return ops
+
+
+def _page_content(page_num: int, rng: random.Random, schedule_every: int) -> str:
+    ops = _text_ops([f"PLUMBING SUBMITTAL - SHEET P-{page_num:03d}"], 36, PAGE_HEIGHT - 36, size=12)
+    body = []
+    for _ in range(rng.randint(14, 22)):
+        body.append(_fixture_line(rng) if rng.random() < 0.45 else rng.choice(SPEC_SENTENCES))
+    ops.extend(_text_ops(body, 36, PAGE_HEIGHT - 60))
+    if schedule_every and page_num % schedule_every == 0:
+        rows = [['ITEM', 'MODEL', 'QTY', 'SIZE', 'MOUNTING']]
+        for _ in range(rng.randint(4, 10)):
+            rows.append([rng.choice(FIXTURES).title()[:18], _model(rng), str(rng.randint(1, 24)),
+                         rng.choice(['1 1/2"', '2"', '3/4"', '4"']), rng.choice(MOUNTINGS)])
+        ops.extend(_schedule_ops(rows, 36, 240))
+    return '\n'.join(ops)
+
+
+def generate_pdf(path: str | Path, pages: int = 10, seed: int = 0, schedule_every: int = 2) -> Path:
+    """
+    Write a synthetic construction PDF.
+
+    Args:
+        path: Output PDF path
+        pages: Number of pages to generate
+        seed: Random seed (same seed gives byte-identical output)
+        schedule_every: Draw a ruled fixture schedule on every Nth page (0 disables)
+
+    Returns:
+        Path to the written PDF
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+
+    # Object numbering: 1 catalog, 2 pages tree, 3 font, then (page, content) pairs
+    objects: List[Tuple[int, bytes]] = []
+    page_ids = []
+    for i in range(pages):
+        page_id = 4 + 2 * i
+        content_id = page_id + 1
+        page_ids.append(page_id)
+        content = _page_content(i + 1, rng, schedule_every).encode('latin-1', 'replace')
+        objects.append((page_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode()))
+        objects.append((content_id, b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"))
+
+    kids = ' '.join(f"{pid} 0 R" for pid in page_ids)
+    objects[:0] = [
+        (1, b"<< /Type /Catalog /Pages 2 0 R >>"),
+        (2, f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode()),
+        (3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"),
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id, body in objects:
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n" % obj_id + body + b"\nendobj\n"
+    xref_pos = len(out)
+    count = len(objects) + 1
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % count
+    for obj_id in range(1, count):
+        out += b"%010d 00000 n \n" % offsets[obj_id]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (count, xref_pos)
+
+    path.write_bytes(bytes(out))
+    return path
@@ -15,6 +15,28 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from extractor.services.extraction_service import ExtractionServiceFactory
 from extractor.utils.helpers import save_json
+from extractor.utils import events
+
+
+class StreamlitProgress:
+    """Event subscriber that drives a Streamlit progress bar and status line."""
+    
+    def __init__(self):
+        self.bar = st.progress(0.0)
+        self.status = st.empty()
+    
+    def __call__(self, event):
+        if event.type == events.PAGE_FINISHED and event.total_pages:
+            self.bar.progress(event.page_num / event.total_pages)
+            self.status.caption(f"Processed page {event.page_num}/{event.total_pages}")
+        elif event.type == events.ITEMS_FOUND:
+            self.status.caption(f"Found {event.count} items")
+        elif event.type == events.LLM_STARTED:
+            self.status.caption("Running LLM enhancement...")
+        elif event.type == events.LLM_FINISHED:
+            self.status.caption(f"LLM enhancement: {event.data.get('status')} ({event.duration:.1f}s)")
+        elif event.type == events.MESSAGE and event.data.get('level') == 'warning':
+            st.warning(event.message.strip())
 
 
 def main():
@@ -96,8 +118,8 @@ def main():
                     else:
                         service = ExtractionServiceFactory.create_standard_service(use_ocr=False)
                     
-                    # Perform extraction
-                    result = service.extract(str(temp_pdf_path), show_progress=False)
+                    # Perform extraction (progress events drive the progress bar)
+                    result = service.extract(str(temp_pdf_path), on_event=StreamlitProgress())
                     
                     # Store in session state
                     st.session_state['extraction_result'] = result
@@ -15,10 +15,22 @@ Main Components:
 
 __version__ = "1.0.0"
 
-# Convenience imports for common use cases
-from extractor.extractors import PDFTextExtractor
-from extractor.parsers import ConstructionParser, ParserRules
-from extractor.services import ExtractionServiceFactory
+from typing import TYPE_CHECKING
+
+from extractor.utils.lazy import lazy_exports
+
+# Convenience imports for common use cases (loaded on first access)
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'PDFTextExtractor': '.extractors',
+    'ConstructionParser': '.parsers',
+    'ParserRules': '.parsers',
+    'ExtractionServiceFactory': '.services',
+})
+
+if TYPE_CHECKING:
+    from extractor.extractors import PDFTextExtractor
+    from extractor.parsers import ConstructionParser, ParserRules
+    from extractor.services import ExtractionServiceFactory
 
 __all__ = [
     'PDFTextExtractor',
@@ -1,7 +1,17 @@
 """
 PDF extractors for extracting text and tables from PDF files.
 """
-from .pdf_text_extractor import PDFTextExtractor
+from typing import TYPE_CHECKING
+
+from extractor.utils.lazy import lazy_exports
+
+# pdfplumber is imported with the extractor, on first access
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'PDFTextExtractor': '.pdf_text_extractor',
+})
+
+if TYPE_CHECKING:
+    from .pdf_text_extractor import PDFTextExtractor
 
 __all__ = ['PDFTextExtractor']
 
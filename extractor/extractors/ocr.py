@@ -0,0 +1,457 @@
+"""
+Pipelined OCR for scanned PDFs.
+
+Pages are rasterized a few at a time (poppler `first_page`/`last_page`
+windows written to a temporary directory) and recognized by a pool of
+tesseract worker processes. Only a bounded number of page images exist at
+any moment, so memory stays flat regardless of document length, and OCR
+throughput scales with the number of workers.
+
+The resolution is chosen per page from its size (and, in region mode, from
+the measured text height), and region mode OCRs only the text blocks of a
+page instead of the whole sheet. Results can be cached per page content.
+"""
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from extractor.utils.cache import hash_settings
+from .tables import _merge_overlapping
+
+
+# Bump when OCR output for the same page and settings changes, to invalidate cached pages
+OCR_VERSION = 1
+
+# Pages rasterized per poppler invocation
+OCR_WINDOW_PAGES = 4
+
+# Rasterized page images waiting for or in OCR, per worker
+IMAGES_PER_WORKER = 2
+
+# Adaptive resolution: render text glyphs about this tall (tesseract reads 20-30 px text best)
+TARGET_GLYPH_PX = 28
+# Assumed glyph height when the page gives no better estimate (8-10 pt text)
+DEFAULT_GLYPH_HEIGHT_PT = 7.0
+MIN_DPI = 150
+MAX_DPI = 400
+# Pixel cap per rendered image (a 36x48" E-size sheet at 300 DPI would be ~155 MP)
+MAX_IMAGE_PIXELS = 50_000_000
+
+# Region mode: resolution of the layout pass that finds text blocks
+DETECT_DPI = 100
+# Margin added around detected text blocks, in PDF points
+REGION_MARGIN_PT = 4.0
+# Tesseract options for one text block
+REGION_CONFIG = '--psm 6'
+
+# A page with at least this many visible characters in a font has a text layer
+MIN_TEXT_CHARS = 50
+# Share of the page covered by images above which a page without text layer is a scan
+MIN_IMAGE_COVERAGE = 0.3
+
+# Page routes chosen by classify_page()
+PAGE_VECTOR = 'vector'  # Use the text layer (or the page has nothing to OCR)
+PAGE_SCANNED = 'scanned'  # No text layer, mostly image: OCR it
+
+
+def adaptive_dpi(width_pt: float, height_pt: float, glyph_height_pt: Optional[float] = None) -> int:
+    """
+    Choose a rasterization resolution for a page or region.
+
+    Args:
+        width_pt: Width of the rendered area in PDF points
+        height_pt: Height of the rendered area in PDF points
+        glyph_height_pt: Estimated text height in points (None = DEFAULT_GLYPH_HEIGHT_PT)
+
+    Returns:
+        DPI that renders glyphs at about TARGET_GLYPH_PX, clamped to
+        [MIN_DPI, MAX_DPI] and lowered further if the image would exceed
+        MAX_IMAGE_PIXELS
+    """
+    dpi = TARGET_GLYPH_PX * 72 / (glyph_height_pt or DEFAULT_GLYPH_HEIGHT_PT)
+    dpi = max(MIN_DPI, min(MAX_DPI, dpi))
+    area_sq_in = max(width_pt, 1.0) / 72 * max(height_pt, 1.0) / 72
+    return int(min(dpi, (MAX_IMAGE_PIXELS / area_sq_in) ** 0.5))
+
+
+def _init_ocr_worker() -> None:
+    """Pool initializer: one tesseract thread per process (the pool provides the parallelism)."""
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+
+def _ocr_image(image_path: str, config: str = '') -> Tuple[str, int, int, float]:
+    """
+    Worker entry point: OCR one rasterized page image and delete it.
+
+    Args:
+        image_path: Path of the page image written by poppler
+        config: Extra tesseract command-line options
+
+    Returns:
+        Tuple of (text, image width, image height, seconds spent in tesseract)
+    """
+    import pytesseract
+    from PIL import Image
+
+    try:
+        started = time.perf_counter()
+        with Image.open(image_path) as image:
+            text = pytesseract.image_to_string(image, config=config)
+            width, height = image.width, image.height
+        return text, width, height, time.perf_counter() - started
+    finally:
+        try:
+            os.remove(image_path)
+        except OSError:
+            pass
+
+
+def _text_blocks(data: Dict[str, List[Any]], scale: float) -> Tuple[List[Tuple[float, float, float, float]], Optional[float]]:
+    """
+    Turn a tesseract layout pass into text block boxes.
+
+    Args:
+        data: pytesseract.image_to_data() dictionary of the low-resolution render
+        scale: Pixels per PDF point of that render
+
+    Returns:
+        Tuple of (boxes (x0, top, x1, bottom) in points of the blocks that contain
+        at least one recognized word, median word height in points or None)
+    """
+    text_blocks = set()
+    word_heights = []
+    for idx, level in enumerate(data['level']):
+        if level == 5 and str(data['text'][idx]).strip() and float(data['conf'][idx]) > 0:
+            text_blocks.add(data['block_num'][idx])
+            word_heights.append(data['height'][idx] / scale)
+
+    blocks = []
+    for idx, level in enumerate(data['level']):
+        if level == 2 and data['block_num'][idx] in text_blocks:
+            left, top = data['left'][idx] / scale, data['top'][idx] / scale
+            blocks.append((
+                left - REGION_MARGIN_PT,
+                top - REGION_MARGIN_PT,
+                left + data['width'][idx] / scale + REGION_MARGIN_PT,
+                top + data['height'][idx] / scale + REGION_MARGIN_PT,
+            ))
+    glyph_height = sorted(word_heights)[len(word_heights) // 2] if word_heights else None
+    return blocks, glyph_height
+
+
+def _ocr_page_regions(pdf_path: str, page_num: int, config: str = REGION_CONFIG) -> Tuple[str, float, float, float]:
+    """
+    Worker entry point: OCR only the text blocks of one page.
+
+    A layout pass at DETECT_DPI finds the text blocks (schedule boxes, note
+    columns, title block text) and measures the text height; each block is
+    then rendered on its own at the adaptive resolution for that height and
+    OCR'd, skipping linework and empty sheet area. Rendering uses pypdfium2
+    (a pdfplumber dependency), which can render a cropped area directly.
+
+    Returns:
+        Tuple of (text in reading order, page width, page height (points),
+        seconds spent in tesseract)
+    """
+    import pypdfium2
+    import pytesseract
+
+    document = pypdfium2.PdfDocument(pdf_path)
+    try:
+        page = document[page_num - 1]
+        width, height = page.get_size()
+        started = time.perf_counter()
+        scale = DETECT_DPI / 72
+        preview = page.render(scale=scale, grayscale=True).to_pil()
+        data = pytesseract.image_to_data(preview, output_type=pytesseract.Output.DICT)
+        blocks, glyph_height = _text_blocks(data, scale)
+
+        texts = []
+        for x0, top, x1, bottom in sorted(_merge_overlapping(blocks), key=lambda box: (box[1], box[0])):
+            x0, top, x1, bottom = max(0.0, x0), max(0.0, top), min(width, x1), min(height, bottom)
+            if x1 <= x0 or bottom <= top:
+                continue
+            dpi = adaptive_dpi(x1 - x0, bottom - top, glyph_height)
+            image = page.render(
+                scale=dpi / 72,
+                crop=(x0, height - bottom, width - x1, top),  # Points cut off left, bottom, right, top
+                grayscale=True,
+            ).to_pil()
+            text = pytesseract.image_to_string(image, config=config).strip()
+            if text:
+                texts.append(text)
+        return '\n'.join(texts), width, height, time.perf_counter() - started
+    finally:
+        document.close()
+
+
+def _page_windows(page_numbers: List[int], window: int, dpi_of: Callable[[int], int]) -> List[Tuple[int, int, int]]:
+    """Split sorted page numbers into contiguous (first, last, dpi) runs of at most `window` same-DPI pages."""
+    windows = []
+    for page_num in page_numbers:
+        dpi = dpi_of(page_num)
+        if windows:
+            first, last, window_dpi = windows[-1]
+            if page_num == last + 1 and page_num - first < window and dpi == window_dpi:
+                windows[-1] = (first, page_num, dpi)
+                continue
+        windows.append((page_num, page_num, dpi))
+    return windows
+
+
+def image_coverage(page) -> float:
+    """Return the share of the page area covered by images (overlaps counted once per image, capped at 1)."""
+    x_min, top_min, x_max, bottom_max = page.bbox
+    page_area = (x_max - x_min) * (bottom_max - top_min)
+    if page_area <= 0:
+        return 0.0
+    covered = 0.0
+    for image in page.images:
+        width = min(image['x1'], x_max) - max(image['x0'], x_min)
+        height = min(image['bottom'], bottom_max) - max(image['top'], top_min)
+        if width > 0 and height > 0:
+            covered += width * height
+    return min(1.0, covered / page_area)
+
+
+def classify_page(page) -> str:
+    """
+    Decide whether a page should be OCR'd.
+
+    A page with at least MIN_TEXT_CHARS visible characters set in a font
+    has a text layer and is never OCR'd. Otherwise it is a scan when images
+    cover at least MIN_IMAGE_COVERAGE of it; sparse vector pages (blank
+    sheets, drawings with a few labels) have nothing for OCR to find.
+
+    Args:
+        page: pdfplumber Page object
+
+    Returns:
+        PAGE_VECTOR or PAGE_SCANNED
+    """
+    text_chars = 0
+    for char in page.chars:
+        if char.get('fontname') and not char['text'].isspace():
+            text_chars += 1
+            if text_chars >= MIN_TEXT_CHARS:
+                return PAGE_VECTOR
+    return PAGE_SCANNED if image_coverage(page) >= MIN_IMAGE_COVERAGE else PAGE_VECTOR
+
+
+def poppler_error(error: Exception) -> Exception:
+    """Turn poppler 'not found' errors into an actionable FileNotFoundError (other errors unchanged)."""
+    error_msg = str(error)
+    if "poppler" in error_msg.lower() or "pdfinfo" in error_msg.lower():
+        return FileNotFoundError(
+            "Poppler not installed. Required for OCR.\n"
+            "Install with: brew install poppler (macOS) or apt-get install poppler-utils (Linux)"
+        )
+    return error
+
+
+class OCREngine:
+    """
+    Rasterize and OCR PDF pages with bounded memory.
+
+    The calling process renders page windows with poppler straight to PNG
+    files (no images are decoded in the parent); workers load one image
+    each, run tesseract and delete the file. New windows are rendered only
+    while fewer than `max_in_flight` images are pending, so rendering runs
+    ahead of OCR by a fixed amount and never holds the whole document.
+
+    In region mode workers render and OCR the text blocks of their page
+    themselves (see _ocr_page_regions), so no full-page image exists at all.
+    """
+
+    def __init__(
+        self,
+        dpi: Optional[int] = None,
+        workers: int = 1,
+        window: int = OCR_WINDOW_PAGES,
+        max_in_flight: Optional[int] = None,
+        config: str = '',
+        regions: bool = False,
+        cache=None
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            dpi: Fixed rasterization resolution (None = adaptive per page, see adaptive_dpi)
+            workers: Tesseract worker processes (1 = OCR in this process)
+            window: Pages rasterized per poppler call
+            max_in_flight: Cap on rasterized images (pages, in region mode) not yet OCR'd
+                           (default: IMAGES_PER_WORKER per worker, at least one window)
+            config: Extra tesseract command-line options (e.g. '--psm 6')
+            regions: If True, OCR only the detected text blocks of each page
+            cache: Optional DiskCache for per-page results (keyed by page fingerprint)
+        """
+        self.dpi = dpi
+        self.workers = max(1, workers)
+        self.window = max(1, window)
+        self.max_in_flight = max(max_in_flight or self.workers * IMAGES_PER_WORKER, self.window)
+        self.config = config or (REGION_CONFIG if regions else '')
+        self.regions = regions
+        self.cache = cache
+
+    def settings(self) -> Dict[str, Any]:
+        """OCR settings that affect page results (part of cache keys)."""
+        return {
+            'version': OCR_VERSION,
+            'dpi': self.dpi or 'adaptive',
+            'regions': self.regions,
+            'config': self.config,
+        }
+
+    def page_sizes(self, pdf_path: str | Path) -> List[Tuple[float, float]]:
+        """Return (width, height) in points of every page, without rendering anything."""
+        import pypdfium2
+
+        document = pypdfium2.PdfDocument(str(pdf_path))
+        try:
+            return [document[idx].get_size() for idx in range(len(document))]
+        finally:
+            document.close()
+
+    def page_count(self, pdf_path: str | Path) -> int:
+        """Return the number of pages."""
+        return len(self.page_sizes(pdf_path))
+
+    def iter_pages(
+        self,
+        pdf_path: str | Path,
+        pages: Optional[List[int]] = None,
+        fingerprints: Optional[Dict[int, str]] = None
+    ) -> Iterator[Tuple[Dict[str, any], float]]:
+        """
+        OCR pages in page order.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: Sorted 1-indexed page numbers to OCR (None = all pages)
+            fingerprints: Optional page number -> content fingerprint mapping; with a
+                          cache, pages whose content was OCR'd before are not OCR'd again
+
+        Yields:
+            (page dictionary, seconds spent in tesseract) pairs; page dictionaries
+            have 'page_num', 'text', 'width' and 'height' keys (image pixels for
+            full-page OCR, points in region mode)
+        """
+        sizes = self.page_sizes(pdf_path)
+        if pages is None:
+            pages = list(range(1, len(sizes) + 1))
+        fingerprints = fingerprints if self.cache is not None else None
+        settings_hash = hash_settings(self.settings())
+
+        def cache_key(page_num: int) -> Optional[str]:
+            if fingerprints and page_num in fingerprints:
+                return f"ocr:{fingerprints[page_num]}:{settings_hash}"
+            return None
+
+        # Cached entries hold the OCR result without the page number (the same content
+        # can appear on another page, or another document)
+        cached = {}
+        for page_num in pages:
+            key = cache_key(page_num)
+            result = self.cache.get(key) if key else None
+            if result is not None:
+                cached[page_num] = result
+
+        results = self._iter_ocr(pdf_path, [page_num for page_num in pages if page_num not in cached], sizes)
+        try:
+            for page_num in pages:
+                if page_num in cached:
+                    yield {'page_num': page_num, **cached[page_num]}, 0.0
+                    continue
+                page_data, seconds = next(results)
+                key = cache_key(page_num)
+                if key:
+                    self.cache.set(key, {field: value for field, value in page_data.items() if field != 'page_num'})
+                yield page_data, seconds
+        finally:
+            results.close()
+
+    def _iter_ocr(
+        self,
+        pdf_path: str | Path,
+        page_numbers: List[int],
+        sizes: List[Tuple[float, float]]
+    ) -> Iterator[Tuple[Dict[str, any], float]]:
+        """OCR the given (uncached) pages, in order."""
+        if not page_numbers:
+            return
+
+        with tempfile.TemporaryDirectory(prefix='pdfx-ocr-') as image_dir:
+            # Batches of (page count, function producing (page_num, worker function, args) tasks)
+            if self.regions:
+                # Workers render their own page's text blocks; nothing is rasterized here
+                batches = deque(
+                    (1, lambda page_num=page_num: [(page_num, _ocr_page_regions, (str(pdf_path), page_num, self.config))])
+                    for page_num in page_numbers
+                )
+            else:
+                def dpi_of(page_num: int) -> int:
+                    return self.dpi or adaptive_dpi(*sizes[page_num - 1])
+
+                batches = deque(
+                    (last - first + 1, lambda first=first, last=last, dpi=dpi: [
+                        (page_num, _ocr_image, (image_path, self.config))
+                        for page_num, image_path in self._rasterize(pdf_path, first, last, dpi, image_dir)
+                    ])
+                    for first, last, dpi in _page_windows(page_numbers, self.window, dpi_of)
+                )
+
+            if self.workers == 1:
+                while batches:
+                    for page_num, func, args in batches.popleft()[1]():
+                        yield self._page(page_num, *func(*args))
+                return
+
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_ocr_worker) as executor:
+                pending = deque()
+                try:
+                    while batches or pending:
+                        # Render ahead while the in-flight cap allows another batch
+                        while batches and len(pending) + batches[0][0] <= self.max_in_flight:
+                            for page_num, func, args in batches.popleft()[1]():
+                                pending.append((page_num, executor.submit(func, *args)))
+                        page_num, future = pending.popleft()
+                        yield self._page(page_num, *future.result())
+                finally:
+                    for _, future in pending:
+                        future.cancel()
+
+    @staticmethod
+    def _page(page_num: int, text: str, width: float, height: float, seconds: float) -> Tuple[Dict[str, any], float]:
+        return {'page_num': page_num, 'text': text, 'width': width, 'height': height}, seconds
+
+    def _rasterize(
+        self,
+        pdf_path: str | Path,
+        first_page: int,
+        last_page: int,
+        dpi: int,
+        image_dir: str
+    ) -> List[Tuple[int, str]]:
+        """Render an inclusive page window to PNG files; returns (page number, path) pairs."""
+        from pdf2image import convert_from_path
+
+        try:
+            paths = convert_from_path(
+                str(pdf_path),
+                dpi=dpi,
+                first_page=first_page,
+                last_page=last_page,
+                output_folder=image_dir,
+                output_file=f'p{first_page:06d}',
+                fmt='png',
+                paths_only=True,
+            )
+        except Exception as e:
+            raise poppler_error(e)
+        # poppler names files <output_file>-<page>.png, so sorting keeps page order
+        return list(zip(range(first_page, last_page + 1), sorted(paths)))
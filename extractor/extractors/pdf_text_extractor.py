@@ -15,26 +15,256 @@ if sys.stdout.isatty():
             pass
 
 import pdfplumber
+import hashlib
 import time
-import threading
-from typing import List, Dict, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Dict, Optional
 from pathlib import Path
 
+from extractor.utils.cache import DiskCache, DEFAULT_MAX_BYTES, hash_file, hash_settings
+from extractor.utils.events import (
+    EventCallback,
+    EventEmitter,
+    PAGE_STARTED,
+    PAGE_FINISHED,
+    TABLES_EXTRACTED,
+    MESSAGE,
+    timed,
+)
+from extractor.utils.progress import ConsoleProgress
+from .ocr import PAGE_SCANNED, OCREngine, classify_page
+from .tables import (
+    TABLE_BUDGET_SECONDS,
+    TABLES_FAILED,
+    TABLES_NONE,
+    TABLES_SKIPPED,
+    TABLES_TEXT,
+    detect_table_regions,
+    extract_tables_with_budget,
+)
+
+
+# Fastest possible pdfplumber table settings (only existing ruling lines are used)
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines_strict",  # Fastest - only existing lines
+    "horizontal_strategy": "lines_strict",
+    "explicit_vertical_lines": [],  # Critical: don't search for lines
+    "explicit_horizontal_lines": [],
+    "snap_tolerance": 5,  # Higher = faster (less precise)
+    "join_tolerance": 5,
+    "intersection_tolerance": 5
+}
+
+# Bump when the page dictionary format or extraction logic changes, to invalidate cached pages
+CACHE_VERSION = 4
+
+# Number of page ranges handed to each worker process (more ranges = better load balancing)
+CHUNKS_PER_WORKER = 4
+
+# Low-text pages collected before one batched OCR run
+AUTO_OCR_BATCH_PAGES = 16
+
+# Pages held back behind a pending OCR batch before it runs anyway (bounds memory and
+# streaming latency when scanned pages are sparse)
+AUTO_OCR_MAX_HELD_PAGES = 4 * AUTO_OCR_BATCH_PAGES
+
+
+def _extract_page(
+    page,
+    page_num: int,
+    timings: Optional[Dict[str, float]] = None,
+    table_budget: Optional[float] = TABLE_BUDGET_SECONDS
+) -> Dict[str, any]:
+    """
+    Extract text and tables from a single pdfplumber page.
+
+    Args:
+        page: pdfplumber Page object
+        page_num: Page number (1-indexed)
+        timings: Optional dict that receives per-stage seconds ('text', 'table_detect', 'tables')
+        table_budget: Seconds allowed for table extraction on this page (None = no limit)
+
+    Returns:
+        Page dictionary with 'page_num', 'text', 'width', 'height', 'tables' and
+        'metadata' keys; metadata['page_type'] is the OCR route (see classify_page) and
+        metadata['table_extraction'] records how tables were obtained
+    """
+    if timings is None:
+        timings = {}
+    started = time.perf_counter()
+    text = page.extract_text()
+    # Route the page: scanned pages (no text layer, mostly image) are OCR'd later in batches
+    page_type = classify_page(page)
+    timings['text'] = time.perf_counter() - started
+
+    # Extract tables only where the page actually draws a ruled grid
+    # Table extraction is VERY slow, so a cheap look at the page's lines and rects
+    # decides whether to run it at all and limits it to the detected grid regions
+    # A dense sheet cannot stall the run: past the budget, extraction falls back to the
+    # text strategy and then skips the page's tables (the path taken goes into metadata)
+    tables = []
+    table_extraction = TABLES_NONE
+    try:
+        started = time.perf_counter()
+        regions = detect_table_regions(page)
+        timings['table_detect'] = time.perf_counter() - started
+
+        if regions:
+            started = time.perf_counter()
+            page_tables, table_extraction = extract_tables_with_budget(page, regions, TABLE_SETTINGS, table_budget)
+            timings['tables'] = time.perf_counter() - started
+            if page_tables:
+                tables = page_tables
+    except Exception:
+        # If table extraction fails, continue without tables
+        # Don't let table extraction block the entire process
+        table_extraction = TABLES_FAILED
+
+    return {
+        'page_num': page_num,
+        'text': text or '',
+        'width': page.width,
+        'height': page.height,
+        'tables': tables,
+        'metadata': {'page_type': page_type, 'table_extraction': table_extraction}
+    }
+
+
+def _extract_page_range(
+    pdf_path: str,
+    first_page: int,
+    last_page: int,
+    table_budget: Optional[float] = TABLE_BUDGET_SECONDS
+) -> List[tuple]:
+    """
+    Worker entry point: open the PDF and extract an inclusive, 1-indexed page range.
+
+    Runs in a separate process, so each call opens its own pdfplumber handle.
+    Returns (page dictionary, stage timings) pairs so the parent process can
+    report progress events without the workers writing to the console.
+    """
+    pdf_path = Path(pdf_path)
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in range(first_page, last_page + 1):
+            page = pdf.pages[page_num - 1]
+            timings = {}
+            results.append((_extract_page(page, page_num, timings, table_budget), timings))
+            _release_page(page)
+    return results
+
+
+def _needs_ocr(page_data: Dict[str, any]) -> bool:
+    """Return True for a page classified as scanned that has not been OCR'd yet."""
+    metadata = page_data.get('metadata', {})
+    return metadata.get('page_type') == PAGE_SCANNED and not metadata.get('ocr')
+
+
+def _release_page(page) -> None:
+    """Drop pdfplumber's cached layout objects for a page that is no longer needed."""
+    close = getattr(page, 'close', None) or getattr(page, 'flush_cache', None)
+    if close:
+        try:
+            close()
+        except Exception:
+            pass
+
+
+def _split_page_range(total_pages: int, chunks: int) -> List[tuple]:
+    """Split pages 1..total_pages into at most `chunks` contiguous (first, last) ranges."""
+    chunks = max(1, min(chunks, total_pages))
+    size, remainder = divmod(total_pages, chunks)
+    ranges = []
+    first = 1
+    for i in range(chunks):
+        last = first + size - 1 + (1 if i < remainder else 0)
+        ranges.append((first, last))
+        first = last + 1
+    return ranges
+
+
+def _split_page_selection(page_numbers: List[int], chunks: int) -> List[tuple]:
+    """
+    Split a sorted page selection into contiguous (first, last) ranges.
+
+    Runs of consecutive pages stay together (one PDF open per range in the
+    workers); runs longer than len(page_numbers) / chunks are cut so the work
+    still spreads over roughly `chunks` ranges.
+    """
+    if not page_numbers:
+        return []
+    max_size = max(1, -(-len(page_numbers) // max(1, chunks)))
+    ranges = []
+    first = last = page_numbers[0]
+    for page_num in page_numbers[1:]:
+        if page_num == last + 1 and page_num - first < max_size:
+            last = page_num
+        else:
+            ranges.append((first, last))
+            first = last = page_num
+    ranges.append((first, last))
+    return ranges
+
+
+def _page_fingerprint(page) -> str:
+    """
+    Hash what determines a page's extraction result: its content streams,
+    the XObjects (images / forms) it draws, its media box and rotation.
+    """
+    from pdfminer.pdftypes import resolve1, PDFStream
+
+    page_obj = page.page_obj
+    digest = hashlib.sha256()
+    digest.update(repr((page_obj.mediabox, page_obj.rotate)).encode('utf-8'))
+    for stream in page_obj.contents or []:
+        stream = resolve1(stream)
+        if isinstance(stream, PDFStream):
+            digest.update(stream.get_data())
+
+    resources = resolve1(page_obj.resources) or {}
+    xobjects = resolve1(resources.get('XObject')) if isinstance(resources, dict) else None
+    for name in sorted(xobjects or {}, key=str):
+        xobject = resolve1(xobjects[name])
+        if isinstance(xobject, PDFStream):
+            digest.update(str(name).encode('utf-8'))
+            digest.update(xobject.get_rawdata() or xobject.get_data())
+    return digest.hexdigest()
+
 
 class PDFTextExtractor:
     """Extract text from PDF files using pdfplumber or OCR."""
-    
-    def __init__(self, use_ocr: bool = False):
+
+    def __init__(
+        self,
+        use_ocr: bool = False,
+        workers: int = 1,
+        cache_dir: Optional[str | Path] = None,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        table_budget: Optional[float] = TABLE_BUDGET_SECONDS,
+        ocr_regions: bool = False
+    ):
         """
         Initialize the PDF extractor.
-        
+
         Args:
             use_ocr: If True, use OCR for scanned PDFs (requires pytesseract and poppler)
+            workers: Number of worker processes for page extraction (1 = sequential,
+                     0 = one per CPU core)
+            cache_dir: Directory for the on-disk page cache (None disables caching)
+            cache_max_bytes: Size limit of the page cache (least recently used pages are evicted)
+            table_budget: Per-page time limit for table extraction in seconds (None or 0 = no limit);
+                          enforced with SIGALRM, so only in a process's main thread on Unix
+            ocr_regions: If True, OCR only the detected text blocks of scanned pages
+                         (schedules, notes, title blocks) instead of the whole sheet
         """
         self.use_ocr = use_ocr
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.cache = DiskCache(cache_dir, max_bytes=cache_max_bytes) if cache_dir else None
+        self.table_budget = table_budget or None
+        self.ocr_regions = ocr_regions
+        self._ocr_fell_back = False
         self._ocr_available = False
-        self._stop_spinner = threading.Event()
-        self._spinner_thread = None
         
         if use_ocr:
             # Check if OCR dependencies are available
@@ -55,234 +285,431 @@ class PDFTextExtractor:
             except ImportError:
                 self._ocr_available = False
     
-    def extract_text(self, pdf_path: str | Path, show_progress: bool = True) -> List[Dict[str, any]]:
+    def extract_text(
+        self,
+        pdf_path: str | Path,
+        show_progress: bool = True,
+        workers: Optional[int] = None,
+        on_event: Optional[EventCallback] = None
+    ) -> List[Dict[str, any]]:
         """
         Extract text from PDF file.
-        
+
         Args:
             pdf_path: Path to PDF file
             show_progress: If True, display progress messages
-            
+            workers: Override the number of worker processes for this call
+            on_event: Optional callback receiving ExtractionEvents (replaces console output)
+
         Returns:
             List of page dictionaries with 'page_num' and 'text' keys
         """
+        return list(self.iter_pages(pdf_path, show_progress=show_progress, workers=workers, on_event=on_event))
+
+    def iter_pages(
+        self,
+        pdf_path: str | Path,
+        show_progress: bool = True,
+        workers: Optional[int] = None,
+        pages: Optional[Iterable[int]] = None,
+        on_event: Optional[EventCallback] = None
+    ) -> Iterator[Dict[str, any]]:
+        """
+        Extract a PDF page by page, yielding each page dictionary as soon as it is ready.
+
+        Pages are yielded in page order and are not retained by the extractor, so
+        memory stays bounded by the page currently being processed (plus the
+        in-flight chunks when running with worker processes).
+
+        Args:
+            pdf_path: Path to PDF file
+            show_progress: If True, display progress messages
+            workers: Override the number of worker processes for this call
+            pages: Optional 1-indexed page numbers to extract (default: all pages)
+            on_event: Optional callback receiving ExtractionEvents. When given, progress
+                      is reported only through it; otherwise show_progress renders
+                      events to the console.
+
+        Yields:
+            Page dictionaries with 'page_num', 'text', 'width', 'height' and 'tables' keys
+        """
         pdf_path = Path(pdf_path)
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        workers = self.workers if workers is None else (workers if workers > 0 else (os.cpu_count() or 1))
+        pages = sorted(set(pages)) if pages is not None else None
+        
+        console = ConsoleProgress() if on_event is None and show_progress else None
+        events = EventEmitter(on_event or console)
+        try:
+            yield from self._iter_cached(pdf_path, events, workers, pages)
+        finally:
+            if console:
+                console.close()
+    
+    def _iter_cached(
+        self,
+        pdf_path: Path,
+        events: EventEmitter,
+        workers: int,
+        pages: Optional[List[int]] = None
+    ) -> Iterator[Dict[str, any]]:
+        """Serve pages from the on-disk cache where possible, extracting the rest."""
+        if self.cache is None:
+            yield from self._iter_extracted(pdf_path, events, workers, pages=pages)
+            return
+        
+        # Content-addressed cache: same file bytes + same extractor settings = same pages
+        doc_key = self._document_cache_key(pdf_path)
+        manifest = self.cache.get(doc_key) if pages is None else None
+        if manifest:
+            total_pages = manifest.get('total_pages', 0)
+            page_keys = [f"{doc_key}:{page_num}" for page_num in range(1, total_pages + 1)]
+            if all(self.cache.contains(key) for key in page_keys):
+                events.message(f"  ⚡ Loaded {total_pages} page(s) from cache")
+                for page_num, key in enumerate(page_keys, start=1):
+                    page_data = self.cache.get(key)
+                    if page_data is None:
+                        # Evicted between the check and the read - extract just this page
+                        with pdfplumber.open(pdf_path) as pdf:
+                            page_data = _extract_page(pdf.pages[page_num - 1], page_num,
+                                                      table_budget=self.table_budget)
+                    events.emit(PAGE_FINISHED, page_num=page_num, total_pages=total_pages,
+                                duration=0.0, data={'cached': True})
+                    yield page_data
+                return
+        
+        cache_hits = set()
         
+        def cached_page(page_num: int) -> Optional[Dict[str, any]]:
+            page_data = self.cache.get(f"{doc_key}:{page_num}")
+            if page_data is not None:
+                cache_hits.add(page_num)
+            return page_data
+        
+        total_pages = 0
+        any_degraded = False
+        for page_data in self._iter_extracted(pdf_path, events, workers, cached_page, pages):
+            total_pages += 1
+            # Never cache degraded results
+            degraded = self.is_degraded(page_data)
+            any_degraded = any_degraded or degraded
+            if not degraded and page_data['page_num'] not in cache_hits:
+                self.cache.set(f"{doc_key}:{page_data['page_num']}", page_data)
+            yield page_data
+        
+        # A degraded page is missing from the cache, so the document is not complete there
+        if not any_degraded and pages is None:
+            self.cache.set(doc_key, {'total_pages': total_pages, 'source': pdf_path.name})
+    
+    def is_degraded(self, page_data: Dict[str, any]) -> bool:
+        """
+        Whether a page extracted by this run must not be stored for reuse.
+        
+        True when OCR was requested but fell back, when a scanned page's auto-OCR
+        failed, or when the table budget ran out (text strategy or skipped). All
+        depend on this run's environment and load, and none of them is part of
+        the cache key or page fingerprint, so a later run should retry the page.
+        """
+        table_extraction = page_data.get('metadata', {}).get('table_extraction')
+        return (self._ocr_fell_back or _needs_ocr(page_data)
+                or table_extraction in (TABLES_TEXT, TABLES_SKIPPED))
+    
+    def _cache_settings(self) -> Dict[str, any]:
+        """Extractor settings that affect page results (part of every cache key)."""
+        return {
+            'version': CACHE_VERSION,
+            'ocr': self.use_ocr and self._ocr_available,
+            'ocr_engine': self._ocr_engine().settings(),
+            'table_settings': TABLE_SETTINGS,
+        }
+    
+    def _document_cache_key(self, pdf_path: Path) -> str:
+        """Cache key for a document: content hash plus settings hash."""
+        return f"{hash_file(pdf_path)}-{hash_settings(self._cache_settings())}"
+    
+    def page_fingerprints(self, pdf_path: str | Path) -> List[str]:
+        """
+        Hash every page of a PDF without extracting it.
+        
+        A page's fingerprint covers its content streams, drawn images/forms,
+        page box and the extractor settings, so an unchanged fingerprint means
+        re-extracting the page would give the same result. Only the PDF's
+        object structure is parsed, which is far cheaper than text layout.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            One hex digest per page, in page order
+        """
+        settings_hash = hash_settings(self._cache_settings())
+        with pdfplumber.open(pdf_path) as pdf:
+            return [f"{_page_fingerprint(page)}-{settings_hash}" for page in pdf.pages]
+    
+    def _iter_extracted(
+        self,
+        pdf_path: Path,
+        events: EventEmitter,
+        workers: int,
+        cached_page: Optional[Callable[[int], Optional[Dict[str, any]]]] = None,
+        pages: Optional[List[int]] = None
+    ) -> Iterator[Dict[str, any]]:
+        """
+        Run the actual extraction (OCR or pdfplumber), yielding pages in order.
+        
+        Args:
+            pdf_path: Path to PDF file
+            events: Emitter for progress events
+            workers: Number of worker processes
+            cached_page: Optional lookup returning an already extracted page (or None);
+                         used by the sequential path to skip pages that are cached
+            pages: Sorted 1-indexed page numbers to extract (None = all pages)
+        """
+        self._ocr_fell_back = False
         pages_data = []
         
         if self.use_ocr:
             if not self._ocr_available:
                 # OCR was requested but dependencies not available
-                if show_progress:
-                    print("  ⚠️  OCR requested but dependencies missing (poppler/tesseract)", flush=True)
-                    print("  ℹ️  Falling back to regular PDF extraction...", flush=True)
-                    print("  💡 To enable OCR: install poppler (brew install poppler) and tesseract", flush=True)
+                events.message("  ⚠️  OCR requested but dependencies missing (poppler/tesseract)", 'warning')
+                events.message("  ℹ️  Falling back to regular PDF extraction...")
+                events.message("  💡 To enable OCR: install poppler (brew install poppler) and tesseract")
                 # Fall through to regular extraction
             else:
                 try:
-                    pages_data = self._extract_with_ocr(pdf_path, show_progress)
+                    pages_data = self._extract_with_ocr(pdf_path, events, pages)
                 except Exception as e:
                     # If OCR fails (e.g., poppler not found), fall back to regular extraction
-                    if show_progress:
-                        error_msg = str(e)
-                        if "poppler" in error_msg.lower() or "pdfinfo" in error_msg.lower():
-                            print(f"\r  ⚠️  OCR failed: poppler not installed", flush=True)
-                            print(f"  💡 Install with: brew install poppler (macOS) or apt-get install poppler-utils (Linux)", flush=True)
-                        else:
-                            print(f"\r  ⚠️  OCR failed: {error_msg[:50]}", flush=True)
-                        print(f"  ℹ️  Falling back to regular PDF extraction...", flush=True)
+                    error_msg = str(e)
+                    if "poppler" in error_msg.lower() or "pdfinfo" in error_msg.lower():
+                        events.message("  ⚠️  OCR failed: poppler not installed", 'warning')
+                        events.message("  💡 Install with: brew install poppler (macOS) or apt-get install poppler-utils (Linux)")
+                    else:
+                        events.message(f"  ⚠️  OCR failed: {error_msg[:50]}", 'warning')
+                    events.message("  ℹ️  Falling back to regular PDF extraction...")
+                    self._ocr_fell_back = True
                     # Fall through to regular extraction below
         
+        if pages_data:
+            yield from pages_data
+            return
+        
         # If OCR wasn't used or failed, use regular extraction
-        if not pages_data:
-            with pdfplumber.open(pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                
-                def animate_spinner(page_num, total_pages):
-                    """Animate spinner while processing."""
-                    spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-                    i = 0
-                    while not self._stop_spinner.is_set():
-                        spinner = spinner_chars[i % len(spinner_chars)]
-                        # Use print with flush=True - this works correctly with python3 -u
-                        print(f"\r  {spinner} Processing page {page_num}/{total_pages}...", end="", flush=True)
-                        i += 1
-                        time.sleep(0.1)
-                
-                # Quick check if PDF is image-based (sample first page only for speed)
-                auto_ocr_needed = False
-                if total_pages > 0:
-                    try:
-                        first_page_text = pdf.pages[0].extract_text()
-                        if first_page_text and len(first_page_text.strip()) < 50:
-                            # Very little text - likely image-based
-                            auto_ocr_needed = True
-                            if show_progress:
-                                print(f"  ⚠️  Detected image-based PDF - enabling OCR...", flush=True)
-                    except:
-                        pass
-                
-                # Start processing pages with spinner
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    if show_progress:
-                        # Stop any previous spinner
-                        self._stop_spinner.set()
-                        if self._spinner_thread and self._spinner_thread.is_alive():
-                            self._spinner_thread.join(timeout=0.1)
-                        
-                        # Start new spinner
-                        self._stop_spinner.clear()
-                        self._spinner_thread = threading.Thread(
-                            target=animate_spinner, 
-                            args=(page_num, total_pages),
-                            daemon=True
-                        )
-                        self._spinner_thread.start()
-                        # Critical: Give spinner time to actually render first frame
-                        time.sleep(0.08)
-                    
-                    text = page.extract_text()
-                    
-                    # If text is very short and we detected image-based, try OCR for this page
-                    if auto_ocr_needed and (not text or len(text.strip()) < 50):
-                        try:
-                            import pytesseract
-                            from pdf2image import convert_from_path
-                            from PIL import Image
-                            
-                            # Convert just this page to image and OCR
-                            images = convert_from_path(pdf_path, first_page=page_num, last_page=page_num, dpi=300)
-                            if images:
-                                ocr_text = pytesseract.image_to_string(images[0], config='--psm 6')
-                                if ocr_text and len(ocr_text.strip()) > len(text.strip() if text else ''):
-                                    text = ocr_text
-                        except:
-                            # If OCR fails, continue with whatever text we have
-                            pass
-                    
-                    # Extract tables if available (OPTIMIZED: only when needed)
-                    # Table extraction is VERY slow (1-2 min per page), so we skip it unless needed
-                    tables = []
-                    try:
-                        # Quick heuristic: only extract tables if page has clear table indicators
-                        # This saves 1-2 minutes per page on most pages
-                        has_table_indicators = False
-                        
-                        if text:
-                            # Strong indicators: tabs (most reliable)
-                            if '\t' in text:
-                                has_table_indicators = True
-                            # Check for table border characters
-                            elif text.count('|') > 15 or text.count('│') > 8:
-                                has_table_indicators = True
-                        
-                        # Only run expensive table extraction if we have strong indicators
-                        if has_table_indicators:
-                            # Use fastest possible settings to minimize time
-                            page_tables = page.extract_tables(table_settings={
-                                "vertical_strategy": "lines_strict",  # Fastest - only existing lines
-                                "horizontal_strategy": "lines_strict",
-                                "explicit_vertical_lines": [],  # Critical: don't search for lines
-                                "explicit_horizontal_lines": [],
-                                "snap_tolerance": 5,  # Higher = faster (less precise)
-                                "join_tolerance": 5,
-                                "edge_tolerance": 5
-                            })
-                            if page_tables:
-                                tables = page_tables
-                    except Exception as e:
-                        # If table extraction fails or times out, continue without tables
-                        # Don't let table extraction block the entire process
-                        pass
-                    
-                    pages_data.append({
-                        'page_num': page_num,
-                        'text': text or '',
-                        'width': page.width,
-                        'height': page.height,
-                        'tables': tables
-                    })
-                    
-                    if show_progress:
-                        self._stop_spinner.set()
-                        if self._spinner_thread:
-                            self._spinner_thread.join(timeout=0.3)  # Give spinner thread time to finish
-                        # Clear spinner line and show completion (newline to ensure visibility)
-                        import sys
-                        print(f"\r  ✓ Processed page {page_num}/{total_pages}        ", flush=True)
-                        sys.stdout.flush()  # Force immediate flush
+        with pdfplumber.open(pdf_path) as pdf:
+            total_pages = len(pdf.pages)
+            if pages is None:
+                selected = list(range(1, total_pages + 1))
+            else:
+                selected = [page_num for page_num in pages if 1 <= page_num <= total_pages]
+            
+            if workers > 1 and len(selected) > 1:
+                parallel = True
+            else:
+                parallel = False
+                sequential = self._iter_sequential(pdf, total_pages, events, selected, cached_page)
+                yield from self._with_auto_ocr(pdf_path, sequential, events)
         
-        return pages_data
-    
-    def _extract_with_ocr(self, pdf_path: Path, show_progress: bool = True) -> List[Dict[str, any]]:
-        """Extract text using OCR for scanned PDFs."""
-        import pytesseract
-        from pdf2image import convert_from_path
+        if parallel:
+            yield from self._with_auto_ocr(
+                pdf_path, self._iter_parallel(pdf_path, total_pages, workers, events, selected), events
+            )
+
+    def _iter_sequential(
+        self,
+        pdf,
+        total_pages: int,
+        events: EventEmitter,
+        selected: List[int],
+        cached_page: Optional[Callable[[int], Optional[Dict[str, any]]]] = None
+    ) -> Iterator[Dict[str, any]]:
+        """Extract the selected pages of an open pdfplumber document in this process."""
+        for page_num in selected:
+            page = pdf.pages[page_num - 1]
+            events.emit(PAGE_STARTED, page_num=page_num, total_pages=total_pages)
+            started = time.perf_counter()
+            
+            timings = {}
+            page_data = cached_page(page_num) if cached_page else None
+            if page_data is None:
+                page_data = _extract_page(page, page_num, timings, self.table_budget)
+            _release_page(page)
+            
+            self._emit_page_finished(events, page_data, total_pages, time.perf_counter() - started, timings)
+            yield page_data
+
+    def _with_auto_ocr(
+        self,
+        pdf_path: Path,
+        pages_iter: Iterator[Dict[str, any]],
+        events: EventEmitter
+    ) -> Iterator[Dict[str, any]]:
+        """
+        OCR the pages classified as scanned, in batches.
         
-        if show_progress:
-            print("  Converting PDF to images...", end="", flush=True)
+        Every page is routed on its own (see classify_page), so a scanned cover
+        does not send a vector set to OCR and scans behind a vector cover are
+        still OCR'd. Pages stream through untouched until one needs OCR; from
+        then on pages are held back until AUTO_OCR_BATCH_PAGES scanned pages are collected,
+        AUTO_OCR_MAX_HELD_PAGES pages are held (so a mostly digital document with a
+        few scans still streams in bounded memory) or the document ends. The batch is then rasterized in contiguous
+        page windows and OCR'd in parallel by one OCREngine run, instead of
+        one poppler process per page. Pages are still yielded in order.
         
-        try:
-            # Higher DPI for better OCR accuracy on small text and tables
-            images = convert_from_path(pdf_path, dpi=300)
-        except Exception as e:
-            # Catch poppler-related errors
-            error_msg = str(e)
-            if "poppler" in error_msg.lower() or "pdfinfo" in error_msg.lower():
-                raise FileNotFoundError(
-                    "Poppler not installed. Required for OCR.\n"
-                    "Install with: brew install poppler (macOS) or apt-get install poppler-utils (Linux)"
-                )
-            raise
-        total_pages = len(images)
+        Args:
+            pdf_path: Path to PDF file
+            pages_iter: Extracted pages, in order
+            events: Emitter for progress events
+        """
+        held = []
+        scanned = []
+        ocr_works = True
+        for page_data in pages_iter:
+            if _needs_ocr(page_data):
+                scanned.append(page_data)
+            if not scanned:
+                yield page_data
+                continue
+            held.append(page_data)
+            if len(scanned) >= AUTO_OCR_BATCH_PAGES or len(held) >= AUTO_OCR_MAX_HELD_PAGES:
+                ocr_works = ocr_works and self._auto_ocr(pdf_path, scanned, events)
+                yield from held
+                held, scanned = [], []
+        if scanned and ocr_works:
+            self._auto_ocr(pdf_path, scanned, events)
+        yield from held
+
+    def _auto_ocr(self, pdf_path: Path, pages_data: List[Dict[str, any]], events: EventEmitter) -> bool:
+        """
+        OCR a batch of scanned pages in place (OCR text replaces the text layer when longer).
         
-        if show_progress:
-            print(f"\r  Running OCR on {total_pages} page(s)...", end="", flush=True)
+        Returns:
+            False if OCR is unavailable or failed (later batches are not attempted)
+        """
+        by_page = {page_data['page_num']: page_data for page_data in pages_data}
+        engine = self._ocr_engine(config='--psm 6')
+        events.message(f"  🔍 Running OCR on {len(by_page)} scanned page(s)...")
+        try:
+            with timed(events, 'auto_ocr', count=len(by_page)):
+                page_numbers = sorted(by_page)
+                fingerprints = self._ocr_fingerprints(pdf_path, page_numbers)
+                for ocr_page, _ in engine.iter_pages(pdf_path, page_numbers, fingerprints):
+                    page_data = by_page[ocr_page['page_num']]
+                    ocr_text = ocr_page['text']
+                    if ocr_text and len(ocr_text.strip()) > len(page_data['text'].strip()):
+                        page_data['text'] = ocr_text
+                    page_data.setdefault('metadata', {})['ocr'] = True
+        except Exception:
+            # If OCR fails, continue with whatever text we have
+            events.message("  ⚠️  Scanned pages found but OCR failed or is not installed (poppler/tesseract)", 'warning')
+            return False
+        return True
+
+    def _iter_parallel(
+        self,
+        pdf_path: Path,
+        total_pages: int,
+        workers: int,
+        events: Optional[EventEmitter] = None,
+        selected: Optional[List[int]] = None
+    ) -> Iterator[Dict[str, any]]:
+        """
+        Extract pages with a process pool.
+
+        The page range is split into contiguous chunks; each worker opens the PDF
+        itself and returns the same page dictionaries as the sequential path.
+        Chunks are yielded in page order, and at most two chunks per worker are
+        in flight so memory does not grow with document size. Workers never
+        report progress themselves; PAGE_FINISHED events (with the worker-side
+        timings) are emitted here as chunks arrive.
+        """
+        events = events or EventEmitter()
+        page_count = total_pages if selected is None else len(selected)
+        workers = min(workers, page_count)
+        if selected is None or page_count == total_pages:
+            ranges = deque(_split_page_range(total_pages, workers * CHUNKS_PER_WORKER))
+        else:
+            ranges = deque(_split_page_selection(selected, workers * CHUNKS_PER_WORKER))
+
+        events.message(f"  ⚙️  Extracting {page_count} page(s) with {workers} worker processes...")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            in_flight = deque()
+            try:
+                while ranges or in_flight:
+                    while ranges and len(in_flight) < workers * 2:
+                        first, last = ranges.popleft()
+                        in_flight.append(executor.submit(
+                            _extract_page_range, str(pdf_path), first, last, self.table_budget
+                        ))
+                    for page_data, timings in in_flight.popleft().result():
+                        self._emit_page_finished(events, page_data, total_pages, sum(timings.values()), timings)
+                        yield page_data
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    @staticmethod
+    def _emit_page_finished(
+        events: EventEmitter,
+        page_data: Dict[str, any],
+        total_pages: int,
+        duration: float,
+        timings: Dict[str, float]
+    ) -> None:
+        """Emit TABLES_EXTRACTED (when table extraction ran) and PAGE_FINISHED for a page."""
+        if not events:
+            return
+        page_num = page_data['page_num']
+        if 'tables' in timings:
+            events.emit(TABLES_EXTRACTED, page_num=page_num, total_pages=total_pages,
+                        count=len(page_data.get('tables') or []), duration=timings['tables'])
+        events.emit(PAGE_FINISHED, page_num=page_num, total_pages=total_pages,
+                    duration=duration, data={'timings': timings, 'cached': not timings})
+    
+    def _ocr_engine(self, config: str = '') -> OCREngine:
+        """Create the OCR engine for this extractor (adaptive DPI, shared worker count and cache)."""
+        return OCREngine(workers=self.workers, config=config, regions=self.ocr_regions, cache=self.cache)
+
+    def _ocr_fingerprints(self, pdf_path: Path, pages: List[int]) -> Optional[Dict[int, str]]:
+        """Content fingerprints of the pages to OCR, for the per-page OCR cache (None without a cache)."""
+        if self.cache is None:
+            return None
+        with pdfplumber.open(pdf_path) as pdf:
+            return {page_num: _page_fingerprint(pdf.pages[page_num - 1]) for page_num in pages}
+
+    def _extract_with_ocr(
+        self,
+        pdf_path: Path,
+        events: Optional[EventEmitter] = None,
+        pages: Optional[List[int]] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Extract text using OCR for scanned PDFs (optionally only the given pages).
+
+        Pages are rasterized in small windows and OCR'd by `self.workers`
+        tesseract processes (see OCREngine), so memory does not grow with
+        the number of pages.
+        """
+        events = events or EventEmitter()
+        engine = self._ocr_engine()
+        if pages is None:
+            pages = list(range(1, engine.page_count(pdf_path) + 1))
+        total_pages = len(pages)
         
-        def animate_spinner_ocr(page_num, total_pages):
-            """Animate spinner while processing OCR."""
-            spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-            i = 0
-            while not self._stop_spinner.is_set():
-                spinner = spinner_chars[i % len(spinner_chars)]
-                # Use print with flush=True - this works correctly with python3 -u
-                print(f"\r  {spinner} Running OCR on page {page_num}/{total_pages}...", end="", flush=True)
-                i += 1
-                time.sleep(0.1)
+        events.emit(MESSAGE, message=f"  Running OCR on {total_pages} page(s)...", data={'inline': True})
         
         pages_data = []
-        for page_num, image in enumerate(images, start=1):
-            if show_progress:
-                self._stop_spinner.clear()
-                self._spinner_thread = threading.Thread(
-                    target=animate_spinner_ocr,
-                    args=(page_num, total_pages),
-                    daemon=True
-                )
-                self._spinner_thread.start()
-                # Give spinner time to start displaying
-                time.sleep(0.05)
-            
-            text = pytesseract.image_to_string(image)
-            pages_data.append({
-                'page_num': page_num,
-                'text': text,
-                'width': image.width,
-                'height': image.height
-            })
-            
-            if show_progress:
-                self._stop_spinner.set()
-                if self._spinner_thread:
-                    self._spinner_thread.join(timeout=0.3)  # Give spinner thread time to finish
-                import sys
-                print(f"\r  ✓ OCR completed page {page_num}/{total_pages}        ", flush=True)
-                sys.stdout.flush()  # Force immediate flush
+        started = time.perf_counter()
+        for page_data, seconds in engine.iter_pages(pdf_path, pages, self._ocr_fingerprints(pdf_path, pages)):
+            page_num = page_data['page_num']
+            events.emit(PAGE_STARTED, page_num=page_num, total_pages=total_pages, message="Running OCR on page")
+            pages_data.append(page_data)
+            events.emit(PAGE_FINISHED, page_num=page_num, total_pages=total_pages,
+                        duration=time.perf_counter() - started, data={'ocr': True, 'timings': {'ocr': seconds}})
+            started = time.perf_counter()
         
-        if show_progress:
-            print(f"\r  ✓ OCR completed on {total_pages} page(s)        ", flush=True)
+        events.message(f"  ✓ OCR completed on {total_pages} page(s)        ")
         
         return pages_data
-
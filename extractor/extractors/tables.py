@@ -0,0 +1,349 @@
+"""
+Cheap geometric table detection.
+
+pdfplumber's `extract_tables` is by far the slowest step of page extraction.
+This module looks only at the page's vector graphics (`page.lines` and
+`page.rects`) to decide whether a ruled grid exists and where it is, so the
+expensive table pass can be skipped on pages without a grid and limited to
+the grid's bounding box on pages that have one. Table extraction inside those
+regions can also be given a time budget (see extract_tables_with_budget).
+"""
+import signal
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+BBox = Tuple[float, float, float, float]  # (x0, top, x1, bottom) in PDF points
+
+# Segments thinner than this are treated as ruling lines (rect outlines, hairlines)
+LINE_THICKNESS = 2.0
+# Tolerance for endpoints meeting / positions counting as the same
+SNAP = 3.0
+# Shorter segments are ignored (hatching, arrow heads, text underline fragments)
+MIN_SEGMENT_LENGTH = 8.0
+# Minimum grid: 3 row rules (2 rows) and 2 column rules (1 column)
+MIN_ROW_RULES = 3
+MIN_COLUMN_RULES = 2
+# Spatial hash cell size for endpoint lookups
+BUCKET = 48.0
+# Padding added around detected regions before cropping
+REGION_PADDING = 2.0
+
+# Default per-page time budget for table extraction, in seconds
+TABLE_BUDGET_SECONDS = 10.0
+# Share of the budget given to the ruling-line pass before falling back to the text strategy
+PRIMARY_BUDGET_SHARE = 0.7
+
+# Fallback settings: infer cell boundaries from word alignment instead of ruling lines,
+# which avoids intersecting thousands of drawing edges on dense sheets
+TEXT_TABLE_SETTINGS = {
+    "vertical_strategy": "text",
+    "horizontal_strategy": "text",
+    "snap_tolerance": 5,
+    "join_tolerance": 5,
+    "intersection_tolerance": 5
+}
+
+# How a page's tables were obtained (recorded in page metadata)
+TABLES_NONE = 'none'  # No ruled grid detected, table extraction not run
+TABLES_REGIONS = 'regions'  # Ruling-line extraction cropped to the detected regions
+TABLES_TEXT = 'text'  # Budget exceeded; text-strategy extraction in the regions
+TABLES_SKIPPED = 'skipped'  # Budget exceeded by both passes; no tables
+TABLES_FAILED = 'failed'  # Table extraction raised an error
+
+
+class TableExtractionTimeout(BaseException):
+    """
+    Raised inside a table extraction pass when its time limit expires.
+
+    A BaseException so the `except Exception` handlers inside pdfplumber and
+    pdfminer (e.g. `Page.layout` re-raising as PdfminerException) let it through.
+    """
+
+
+def _segments(page) -> Tuple[List[BBox], List[BBox]]:
+    """Collect horizontal and vertical ruling segments from lines and rect edges."""
+    horizontals = []
+    verticals = []
+
+    def add(x0: float, top: float, x1: float, bottom: float) -> None:
+        width = x1 - x0
+        height = bottom - top
+        if height <= LINE_THICKNESS and width >= MIN_SEGMENT_LENGTH:
+            mid = (top + bottom) / 2
+            horizontals.append((x0, mid, x1, mid))
+        elif width <= LINE_THICKNESS and height >= MIN_SEGMENT_LENGTH:
+            mid = (x0 + x1) / 2
+            verticals.append((mid, top, mid, bottom))
+
+    for line in page.lines:
+        add(line['x0'], line['top'], line['x1'], line['bottom'])
+    for rect in page.rects:
+        x0, top, x1, bottom = rect['x0'], rect['top'], rect['x1'], rect['bottom']
+        if (x1 - x0) <= LINE_THICKNESS or (bottom - top) <= LINE_THICKNESS:
+            add(x0, top, x1, bottom)  # Rect drawn as a thick rule
+        else:
+            # Cell/box outline: its four edges are ruling lines
+            add(x0, top, x1, top)
+            add(x0, bottom, x1, bottom)
+            add(x0, top, x0, bottom)
+            add(x1, top, x1, bottom)
+    return _join(horizontals, vertical=False), _join(verticals, vertical=True)
+
+
+def _join(segments: List[BBox], vertical: bool) -> List[BBox]:
+    """
+    Merge collinear segments that touch or overlap into single rules.
+
+    Tables drawn cell by cell (one rect per cell) become the same long row
+    and column rules as tables drawn with full-width lines.
+    """
+    if vertical:
+        spans = sorted((x0, top, bottom) for x0, top, _, bottom in segments)
+    else:
+        spans = sorted((top, x0, x1) for x0, top, x1, _ in segments)
+
+    # Collapse positions closer than SNAP into one line of spans
+    lines = []
+    for position, start, end in spans:
+        if not lines or position - lines[-1][0] > SNAP:
+            lines.append((position, []))
+        lines[-1][1].append((start, end))
+
+    rules = []
+    for position, line_spans in lines:
+        line_spans.sort()
+        start, end = line_spans[0]
+        for next_start, next_end in line_spans[1:]:
+            if next_start <= end + SNAP:
+                end = max(end, next_end)
+                continue
+            rules.append((position, start, end))
+            start, end = next_start, next_end
+        rules.append((position, start, end))
+
+    if vertical:
+        return [(position, start, position, end) for position, start, end in rules]
+    return [(start, position, end, position) for position, start, end in rules]
+
+
+def _bucket_index(segments: List[BBox]) -> Dict[Tuple[int, int], List[int]]:
+    """Spatial hash: every BUCKET-sized cell a segment (grown by SNAP) passes through."""
+    index = defaultdict(list)
+    for idx, (x0, top, x1, bottom) in enumerate(segments):
+        for bx in range(int((x0 - SNAP) // BUCKET), int((x1 + SNAP) // BUCKET) + 1):
+            for by in range(int((top - SNAP) // BUCKET), int((bottom + SNAP) // BUCKET) + 1):
+                index[(bx, by)].append(idx)
+    return index
+
+
+def _touches(x: float, y: float, segments: List[BBox], index: Dict[Tuple[int, int], List[int]]) -> bool:
+    """Return True if the point lies on (within SNAP of) one of the indexed segments."""
+    for idx in index.get((int(x // BUCKET), int(y // BUCKET)), ()):
+        x0, top, x1, bottom = segments[idx]
+        if x0 - SNAP <= x <= x1 + SNAP and top - SNAP <= y <= bottom + SNAP:
+            return True
+    return False
+
+
+def _row_rule_groups(horizontals: List[BBox], verticals: List[BBox]) -> List[List[BBox]]:
+    """
+    Group anchored row rules that share the same left and right ends.
+
+    A row rule is anchored when both of its ends sit on a vertical rule, as
+    the borders of a ruled table do; free-standing drawing geometry (pipe
+    runs, dimension and leader lines) rarely does. The rows of one table end
+    on the same outer column rules, so they share their x-extent.
+    """
+    index = _bucket_index(verticals)
+    anchored = sorted(
+        (
+            rule for rule in horizontals
+            if _touches(rule[0], rule[1], verticals, index) and _touches(rule[2], rule[1], verticals, index)
+        ),
+        key=lambda rule: (rule[0], rule[2], rule[1])
+    )
+    groups = []
+    for rule in anchored:
+        for group in groups:
+            if abs(group[0][0] - rule[0]) <= SNAP and abs(group[0][2] - rule[2]) <= SNAP:
+                group.append(rule)
+                break
+        else:
+            groups.append([rule])
+    return groups
+
+
+def _column_rule_count(region: BBox, verticals: List[BBox]) -> int:
+    """Count distinct vertical rules inside the region that run between its row rules."""
+    x0, top, x1, bottom = region
+    positions = sorted(
+        vx for vx, vtop, _, vbottom in verticals
+        if x0 - SNAP <= vx <= x1 + SNAP and min(vbottom, bottom) - max(vtop, top) > SNAP
+    )
+    count = 0
+    previous = None
+    for position in positions:
+        if previous is None or position - previous > SNAP:
+            count += 1
+        previous = position
+    return count
+
+
+def _merge_overlapping(regions: List[BBox]) -> List[BBox]:
+    """Union regions that overlap (e.g. a header grid drawn across the body grid)."""
+    merged = []
+    for region in regions:
+        for idx, other in enumerate(merged):
+            if region[0] <= other[2] and other[0] <= region[2] and region[1] <= other[3] and other[1] <= region[3]:
+                merged[idx] = (
+                    min(region[0], other[0]), min(region[1], other[1]),
+                    max(region[2], other[2]), max(region[3], other[3]),
+                )
+                break
+        else:
+            merged.append(region)
+    return merged if len(merged) == len(regions) else _merge_overlapping(merged)
+
+
+def detect_table_regions(page) -> List[BBox]:
+    """
+    Find ruled grids on a page from its vector graphics alone.
+
+    A grid is at least 3 row rules that end on vertical rules and share the
+    same left/right ends, with at least 2 vertical rules running between
+    them. Only `page.lines` and `page.rects` are inspected (no text, no
+    pdfplumber table finder), so pages without a grid cost almost nothing.
+
+    Args:
+        page: pdfplumber Page object
+
+    Returns:
+        Bounding boxes (x0, top, x1, bottom) of detected grids, top to bottom,
+        padded slightly and clipped to the page
+    """
+    horizontals, verticals = _segments(page)
+    if len(horizontals) < MIN_ROW_RULES or len(verticals) < MIN_COLUMN_RULES:
+        return []
+
+    regions = []
+    for rows in _row_rule_groups(horizontals, verticals):
+        tops = sorted(rule[1] for rule in rows)
+        distinct_rows = 1 + sum(1 for a, b in zip(tops, tops[1:]) if b - a > SNAP)
+        if distinct_rows < MIN_ROW_RULES:
+            continue
+        region = (min(rule[0] for rule in rows), tops[0], max(rule[2] for rule in rows), tops[-1])
+        if _column_rule_count(region, verticals) >= MIN_COLUMN_RULES:
+            regions.append(region)
+
+    x_min, top_min, x_max, bottom_max = page.bbox
+    padded = [
+        (
+            max(x_min, x0 - REGION_PADDING), max(top_min, top - REGION_PADDING),
+            min(x_max, x1 + REGION_PADDING), min(bottom_max, bottom + REGION_PADDING),
+        )
+        for x0, top, x1, bottom in _merge_overlapping(regions)
+    ]
+    return sorted(padded, key=lambda region: (region[1], region[0]))
+
+
+def extract_tables_in_regions(page, regions: List[BBox], table_settings: Dict) -> List[List[List[str]]]:
+    """
+    Run pdfplumber table extraction only inside the given regions.
+
+    Args:
+        page: pdfplumber Page object
+        regions: Bounding boxes from detect_table_regions()
+        table_settings: pdfplumber table settings
+
+    Returns:
+        Tables (lists of rows of cells), in region order
+    """
+    tables = []
+    for region in regions:
+        tables.extend(page.crop(region).extract_tables(table_settings=table_settings) or [])
+    return tables
+
+
+def _can_interrupt() -> bool:
+    """SIGALRM timers only work on Unix and only in a process's main thread."""
+    return hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def _time_limit(seconds: float) -> Iterator[None]:
+    """
+    Raise TableExtractionTimeout in the block once `seconds` have passed.
+
+    Uses a SIGALRM interval timer, so pdfplumber is interrupted wherever it
+    is. Worker processes run pages in their main thread; where no timer is
+    available (Windows, non-main threads) the block runs without a limit.
+    """
+    if not _can_interrupt():
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise TableExtractionTimeout()
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        except TableExtractionTimeout:
+            # Fired just as the block ended: there is nothing left to interrupt
+            pass
+        signal.signal(signal.SIGALRM, previous)
+
+
+def extract_tables_with_budget(
+    page,
+    regions: List[BBox],
+    table_settings: Dict,
+    budget: Optional[float] = TABLE_BUDGET_SECONDS
+) -> Tuple[List[List[List[str]]], str]:
+    """
+    Extract tables in the given regions within a bounded time.
+
+    Falls back progressively: ruling-line extraction cropped to the regions
+    gets PRIMARY_BUDGET_SHARE of the budget; if it runs out, the text
+    strategy gets the rest; if that also runs out, the page's tables are
+    skipped.
+
+    Args:
+        page: pdfplumber Page object
+        regions: Bounding boxes from detect_table_regions()
+        table_settings: pdfplumber table settings for the first pass
+        budget: Seconds allowed for the whole page (None or 0 = no limit)
+
+    Returns:
+        Tuple of (tables, path taken: TABLES_REGIONS, TABLES_TEXT or TABLES_SKIPPED)
+    """
+    if not budget or budget <= 0:
+        return extract_tables_in_regions(page, regions, table_settings), TABLES_REGIONS
+
+    deadline = time.perf_counter() + budget
+    attempts = (
+        (TABLES_REGIONS, table_settings, budget * PRIMARY_BUDGET_SHARE),
+        (TABLES_TEXT, TEXT_TABLE_SETTINGS, budget),
+    )
+    for path, settings, limit in attempts:
+        seconds = min(limit, deadline - time.perf_counter())
+        if seconds <= 0:
+            break
+        tables = None
+        try:
+            with _time_limit(seconds):
+                tables = extract_tables_in_regions(page, regions, settings)
+        except TableExtractionTimeout:
+            # The alarm may also fire after the pass finished, before the timer is disarmed
+            if tables is None:
+                continue
+        return tables, path
+    return [], TABLES_SKIPPED
@@ -27,6 +27,18 @@ class PageInfo(BaseModel):
         False,
         description="Whether this page contains tables"
     )
+    table_extraction: Optional[str] = Field(
+        None,
+        description="How tables were extracted: 'none', 'regions', 'text' (time budget exceeded), "
+                    "'skipped' (budget exceeded twice) or 'failed'"
+    )
+    confidence: Optional[float] = Field(
+        None,
+        ge=0,
+        le=1,
+        description="How completely the regex pass covered the page (construction mode); "
+                    "pages below the LLM threshold are sent to the LLM"
+    )
 
 
 class PageData(BaseModel):
@@ -40,6 +52,11 @@ class PageData(BaseModel):
         default=None,
         description="Extracted tables (if any, cells may be null or empty strings)"
     )
+    table_extraction: Optional[str] = Field(
+        None,
+        description="How tables were extracted: 'none', 'regions', 'text' (time budget exceeded), "
+                    "'skipped' (budget exceeded twice) or 'failed'"
+    )
 
 
 class BaseExtractionResult(BaseModel):
@@ -1,9 +1,28 @@
 """
 Parsers for extracting structured data from PDF text.
 """
-from .construction import ConstructionParser
-from .standard import ParserRules
-from .llm import LLMParserBase, OpenAIParser, ClaudeParser
+from typing import TYPE_CHECKING
+
+from extractor.utils.lazy import lazy_exports
+
+# Submodules load on first access: the LLM modules (asyncio, provider SDKs) only when used
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'ConstructionParser': '.construction',
+    'ParserRules': '.standard',
+    'LLMParserBase': '.llm',
+    'OpenAIParser': '.llm',
+    'ClaudeParser': '.llm',
+    'LocalParser': '.llm',
+    'CachedLLMParser': '.llm',
+    'LLMTransport': '.llm_transport',
+    'LLMError': '.llm_transport',
+})
+
+if TYPE_CHECKING:
+    from .construction import ConstructionParser
+    from .standard import ParserRules
+    from .llm import LLMParserBase, OpenAIParser, ClaudeParser, LocalParser, CachedLLMParser
+    from .llm_transport import LLMTransport, LLMError
 
 __all__ = [
     'ConstructionParser',
@@ -11,5 +30,9 @@ __all__ = [
     'LLMParserBase',
     'OpenAIParser',
     'ClaudeParser',
+    'LocalParser',
+    'CachedLLMParser',
+    'LLMTransport',
+    'LLMError',
 ]
 
@@ -6,6 +6,80 @@ import re
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from .patterns import (
+    PatternRegistry,
+    LineClassifier,
+    LINE_EXCLUDED,
+    LINE_INSTRUCTION,
+    LINE_DRAWING_REF,
+    LINE_CANDIDATE,
+)
+
+
+# Inline helper patterns used while classifying a single line (compiled once at import)
+CAPITALIZED_PHRASE_RE = re.compile(r'\b([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)')
+DIMENSION_LIKE_RE = re.compile(r'\d+\s*["\']\s*[-–]?\s*\d+')
+NUMERIC_ONLY_RE = re.compile(r'^[\d\s\'\"\-\/\.]+$')
+DIGITS_ONLY_RE = re.compile(r'^\d+$')
+SHORT_CODE_RE = re.compile(r'^[A-Z]\d+$')
+KNOWN_MODEL_FORMAT_RE = re.compile(r'^[A-Z]{2,}-\d+')
+HAS_LETTER_RE = re.compile(r'[A-Z]')
+HAS_DIGIT_RE = re.compile(r'\d')
+DECIMAL_RE = re.compile(r'^\d+\.\d+$')
+FIRST_NUMBER_RE = re.compile(r'\d+')
+# Model number shapes inside a line (MAU-11, OM-141 / CH30, VP1234)
+MODEL_IN_LINE_RES = [
+    re.compile(r'[A-Z]{2,}-\d+', re.IGNORECASE),
+    re.compile(r'[A-Z]{1,3}\d{2,}', re.IGNORECASE),
+]
+MODEL_IN_LINE_RE = re.compile(r'[A-Z]{2,}-\d+|[A-Z]{1,3}\d{2,}', re.IGNORECASE)
+EXPLICIT_DECIMAL_QTY_RE = re.compile(r'\b(qty|quantity)[:\s]*\d+\.\d+', re.IGNORECASE)
+SPEC_CONTEXT_RE = re.compile(r'\d+\s*["\']|OM-|MAU-|CH\d+|model|part\s*#', re.IGNORECASE)
+MODEL_LABEL_RE = re.compile(r'\b(model|part|pn|sku|cat|item\s*#)', re.IGNORECASE)
+DIMENSION_WORD_RE = re.compile(r'(diameter|dia|OD|ID|size|dimension|inch|inches|x\s*\d)', re.IGNORECASE)
+DIMENSION_CONTEXT_RE = re.compile(r'["\']|inch|inches|in|feet|ft|cm|mm|diameter|dia|ø|"|\'|x\s*\d', re.IGNORECASE)
+UNITS_IN_DIMENSION_RE = re.compile(r'["\']|ø|inch|in|ft|cm|mm', re.IGNORECASE)
+QTY_WITH_UNITS_RE = re.compile(r'\b(\d+)\s*(ea|each|pcs|pieces|qty|quantity)', re.IGNORECASE)
+ENRICH_UNITS_RE = re.compile(r'["\']|ø|inch|inches|in|ft|feet|cm|mm|diameter|dia', re.IGNORECASE)
+ENRICH_CONTEXT_RE = re.compile(r'(diameter|dia|OD|ID|inch|in|"|\'|ø|x\s*\d)', re.IGNORECASE)
+MOUNTING_SEPARATORS_RE = re.compile(r'[-\s]+')
+
+# Full dimension strings to prefer over the captured parts (most specific first)
+FULL_DIMENSION_RES = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    # Diameter formats with ø symbol (check FIRST - most specific)
+    r'(\d+\s+\d+\/\d+\s*["\']?\s*ø)',  # "1 1/2\"ø" or "1 1/2 ø"
+    r'(\d+[- ]\d+\/\d+\s*["\']?\s*ø)',  # "1-1/2\"ø"
+    r'(\d+\/\d+\s*["\']?\s*ø)',  # "1/2\"ø"
+    r'(\d+\s*["\']?\s*ø)',  # "1\"ø" or "1 ø"
+    # Length dimensions with feet and inches
+    r'(\d+\s*["\']\s*[-–]\s*\d+\s+\d+\/\d+\s*["\'])',  # "25' -1 5/8\""
+    r'(\d+\s*["\']\s*[-–]\s*\d+\s*["\'])',  # "25' -1""
+    r'(\d+\s*["\']\s+\d+\s+\d+\/\d+\s*["\'])',  # "25' 1 5/8\""
+    r'(\d+\s*["\']\s+\d+\s*["\'])',  # "25' 6\""
+    r'(\d+\s*["\']\s*[-–]?\s*\d+\s*\d+\/\d+)',  # "25'-1 5/8" (no trailing quote)
+    r'(\d+\s*["\']\s*[-–]?\s*\d+\s*\d+\/\d+\s*["\']?)',  # Flexible feet-inches
+    # Also catch patterns like "BE= 25' -1 5/8\"" where dimension follows "=" or ":"
+    r'(?:[=:]\s*)(\d+\s*["\']\s*[-–]?\s*\d+\s*\d+\/\d+\s*["\']?)',  # "BE= 25' -1 5/8\""
+    r'(?:[=:]\s*)(\d+\s*["\']\s*[-–]?\s*\d+\s*["\']?)',  # "BE= 25' -1\""
+]]
+
+# Lines that start with action verbs are instructions, not items
+ACTION_VERB_PATTERN = r'^\s*(up\s+to|see|refer|use|install|mount|connect|note|notice|warning)\s+'
+# References anywhere in a line that mark it as an instruction
+INSTRUCTION_SUBSTRINGS = ['SEE PAGE', 'SEE DRAWING', 'SEE SPEC', 'REFER TO']
+# Drawing/line references (e.g., "L01-MP-P.1A", "LINE 1", "DWG-123") - matched against the upper-cased line
+DRAWING_REFERENCE_PATTERNS = [
+    r'^[A-Z]\d+[-\.][A-Z]+[-\.]',  # L01-MP-P.1A, A123-DWG-1
+    r'^LINE\s+\d+',  # LINE 1, LINE 2
+    r'^DWG[-\.]\d+',  # DWG-123, DWG.456
+    r'^[A-Z]+\d*[-\.]MP[-\.]',  # L01-MP-P.1A pattern
+]
+
+LEGAL_WORDS = ['PROHIBITED', 'COPYRIGHT', 'RESERVED', 'CONFIDENTIAL', 'USE IN']
+
+# Weights of the fields that make an extracted item complete (page confidence score)
+CONFIDENCE_FIELD_WEIGHTS = {'quantity': 0.4, 'model_number': 0.4, 'dimensions': 0.2}
+
 
 class ConstructionParser:
     """Parse construction-related data from PDF text."""
@@ -149,6 +223,66 @@ class ConstructionParser:
             r'\b(see\s+)?(?:page|pg|p)\.?\s*(\d+)',
             r'\b(\d+)[\s\-]+(?:page|pg)\b',
         ]
+        
+        self.compile_patterns()
+    
+    def compile_patterns(self) -> None:
+        """
+        Compile the pattern lists into the parser's pattern registry.
+        
+        Called once from __init__; call again after modifying any of the
+        pattern lists so the changes take effect.
+        """
+        # One-scan rejection of boilerplate, notes and instructions before any extraction
+        self.line_classifier = LineClassifier(
+            exclude_patterns=self.exclude_patterns,
+            instruction_prefixes=self.instruction_phrases,
+            instruction_patterns=[ACTION_VERB_PATTERN],
+            instruction_substrings=INSTRUCTION_SUBSTRINGS,
+            drawing_reference_patterns=DRAWING_REFERENCE_PATTERNS,
+        )
+        self.patterns = PatternRegistry({
+            'fixture': self.fixture_patterns,
+            'quantity': self.quantity_patterns,
+            'model': self.model_patterns,
+            'dimension': self.dimension_patterns,
+            'mounting': self.mounting_patterns,
+            'spec': self.spec_patterns,
+        }, requirements={
+            # Every quantity and dimension pattern contains a mandatory digit
+            'quantity': r'\d',
+            'dimension': r'\d',
+        })
+        # "Full item" prefix patterns depend on the matched fixture text - compile lazily, once each
+        self._full_item_res = {}
+        # Which spec patterns are page references (their number also updates page_number)
+        self._spec_is_page_ref = [
+            'page' in pattern.lower() or 'pg' in pattern.lower()
+            for pattern in self.spec_patterns
+        ]
+    
+    def classify_line(self, line: str) -> str:
+        """
+        Classify a line as excluded, instruction, drawing reference or item candidate.
+        
+        Args:
+            line: Text line
+            
+        Returns:
+            One of 'excluded', 'instruction', 'drawing_ref' or 'candidate'
+        """
+        return self.line_classifier.classify(line)
+    
+    def _full_item_re(self, fixture_match: str):
+        """Return the compiled "capitalized phrase before fixture" pattern for a fixture match."""
+        compiled = self._full_item_res.get(fixture_match)
+        if compiled is None:
+            compiled = re.compile(
+                r'\b([A-Z][A-Za-z\s]+?)\s*(?:' + re.escape(fixture_match) + r'|package|equipment|fixture|station|connection)',
+                re.IGNORECASE
+            )
+            self._full_item_res[fixture_match] = compiled
+        return compiled
     
     def extract_items(self, text: str, page_num: int) -> List[Dict[str, Any]]:
         """
@@ -167,6 +301,9 @@ class ConstructionParser:
         # Context-aware extraction: look at surrounding lines
         # Look for table-like structures and item descriptions
         current_item = None
+        # Each line is used as enrichment context up to three times (previous/current/next),
+        # so remember its first match per category for the duration of this page
+        match_cache = {}
         
         for line_num, line in enumerate(lines):
             line = line.strip()
@@ -205,7 +342,7 @@ class ConstructionParser:
                 # Enrich with all context lines
                 for ctx_line in context_lines:
                     if ctx_line:
-                        self._enrich_item(current_item, ctx_line)
+                        self._enrich_item(current_item, ctx_line, match_cache)
         
         # Add last item if exists (check for any meaningful data)
         if current_item and (current_item.get('fixture_type') or current_item.get('model_number') or current_item.get('quantity')):
@@ -213,29 +350,68 @@ class ConstructionParser:
         
         return items
     
+    def page_confidence(self, text: str, items: List[Dict[str, Any]]) -> float:
+        """
+        Score how well the regex pass covered a page (0 = poorly, 1 = fully).
+        
+        Combines two signals from the page's regex results:
+        - completeness: the weighted share of quantity, model number and
+          dimensions filled in across the page's items
+        - coverage: the share of item-like candidate lines (a fixture or
+          quantity together with a model/quantity pattern) that started an
+          item; rows parsed from tables count as covered lines
+        
+        A page without items scores 1 when nothing on it looks like an item
+        (cover sheets, general notes) and 0 otherwise.
+        
+        Args:
+            text: Page text
+            items: Items extracted from the page (extract_items plus parse_tables)
+            
+        Returns:
+            Confidence between 0 and 1
+        """
+        item_lines = {item.get('line_number') for item in items if item.get('line_number')}
+        table_rows = sum(1 for item in items if item.get('table_number') is not None)
+        
+        # Candidate lines that look like items but did not start one
+        missed = 0
+        suspects = 0
+        for line_num, line in enumerate(text.split('\n'), start=1):
+            line = line.strip()
+            if not line or not HAS_DIGIT_RE.search(line) or self.classify_line(line) != LINE_CANDIDATE:
+                continue
+            has_fixture = self.patterns['fixture'].search_first(line) is not None
+            has_quantity = self.patterns['quantity'].search_first(line) is not None
+            has_model = self.patterns['model'].search_first(line) is not None
+            if (has_fixture and (has_quantity or has_model)) or (has_quantity and has_model):
+                suspects += 1
+                if line_num not in item_lines:
+                    missed += 1
+        missed = max(0, missed - table_rows)
+        coverage = 1.0 - missed / suspects if suspects else 1.0
+        
+        if not items:
+            return 0.0 if suspects else 1.0
+        
+        completeness = sum(
+            sum(weight for field, weight in CONFIDENCE_FIELD_WEIGHTS.items() if item.get(field))
+            for item in items
+        ) / len(items)
+        return round(completeness * coverage, 3)
+    
     def _detect_item_line(self, line: str, page_num: int = 0, line_num: int = 0) -> Optional[Dict[str, Any]]:
         """
         Detect if a line contains item information.
         More flexible: accepts lines with quantities, model numbers, or fixture types.
         """
-        # First check: exclude lines that are clearly not items (legal disclaimers, headers, etc.)
-        for exclude_pattern in self.exclude_patterns:
-            if re.search(exclude_pattern, line, re.IGNORECASE):
-                return None  # Skip this line entirely
-        
-        # Check for instruction phrases explicitly (lines that are instructions, not items)
-        line_upper = line.upper().strip()
-        for phrase in self.instruction_phrases:
-            if line_upper.startswith(phrase.upper()):
-                return None  # Skip instruction lines like "UP TO MAU-11", "SEE PAGE 5", etc.
-        
-        # Check for lines that start with action verbs (instructions, not items)
-        if re.match(r'^\s*(up\s+to|see|refer|use|install|mount|connect|note|notice|warning)\s+', line, re.IGNORECASE):
+        # First check: skip lines that are clearly not items (legal disclaimers, headers,
+        # instructions like "UP TO MAU-11" / "SEE PAGE 5", very short noise) in one scan
+        line_category = self.line_classifier.classify(line)
+        if line_category in (LINE_EXCLUDED, LINE_INSTRUCTION):
             return None
         
-        # Skip very short lines or lines that are just noise
-        if len(line.strip()) < 3:
-            return None
+        line_upper = line.upper().strip()
         
         item_data = {}
         has_indicators = False
@@ -244,20 +420,21 @@ class ConstructionParser:
         best_match = None
         best_match_len = 0
         
-        for pattern in self.fixture_patterns:
-            matches = re.finditer(pattern, line, re.IGNORECASE)
-            for match in matches:
-                matched_text = match.group(0).strip()
-                # Prefer longer matches (e.g., "circulating pump" over just "pump")
-                if len(matched_text) > best_match_len:
-                    best_match = matched_text
-                    best_match_len = len(matched_text)
+        fixture_set = self.patterns['fixture']
+        if fixture_set.may_match(line):
+            for pattern in fixture_set:
+                for match in pattern.finditer(line):
+                    matched_text = match.group(0).strip()
+                    # Prefer longer matches (e.g., "circulating pump" over just "pump")
+                    if len(matched_text) > best_match_len:
+                        best_match = matched_text
+                        best_match_len = len(matched_text)
         
         if best_match:
             has_indicators = True
             # Try to extract full item description if it's capitalized or contains model numbers
             # Look for capitalized phrases before the match
-            full_item_match = re.search(r'\b([A-Z][A-Za-z\s]+?)\s*(?:' + re.escape(best_match) + r'|package|equipment|fixture|station|connection)', line, re.IGNORECASE)
+            full_item_match = self._full_item_re(best_match).search(line)
             if full_item_match:
                 fixture_type = full_item_match.group(1).strip() + ' ' + best_match
                 # Fix duplicate words (e.g., "VALVE VALVE PACKAGE" -> "Valve Package")
@@ -275,15 +452,15 @@ class ConstructionParser:
             # If no fixture type found, try to infer from capitalized words or common patterns
             # BUT: Don't infer from dimensions or measurement patterns!
             # Look for capitalized multi-word phrases (likely item descriptions)
-            capitalized_phrase = re.search(r'\b([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)', line)
+            capitalized_phrase = CAPITALIZED_PHRASE_RE.search(line)
             if capitalized_phrase:
                 potential_type = capitalized_phrase.group(1).strip()
                 
                 # CRITICAL: Check if this is actually a dimension pattern (not a fixture type)
                 # Patterns like "0' - 7", "10' 6\"", "25' -1 5/8\"" are dimensions, not fixture types
-                is_dimension_pattern = bool(re.search(r'\d+\s*["\']\s*[-–]?\s*\d+', potential_type))
+                is_dimension_pattern = bool(DIMENSION_LIKE_RE.search(potential_type))
                 # Also check if it's just numbers with units
-                is_numeric_only = bool(re.match(r'^[\d\s\'\"\-\/\.]+$', potential_type.strip()))
+                is_numeric_only = bool(NUMERIC_ONLY_RE.match(potential_type.strip()))
                 
                 # Only use as fixture type if it's NOT a dimension pattern and looks like text
                 if (len(potential_type.split()) >= 2 and len(potential_type) > 10 and 
@@ -293,8 +470,9 @@ class ConstructionParser:
         
         # Check for quantities (handle decimals and multiple references)
         # IMPORTANT: Don't extract quantities that are part of model numbers (e.g., MAU-11 -> don't extract 11 as quantity)
-        for pattern in self.quantity_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        quantity_set = self.patterns['quantity']
+        for pattern in (quantity_set if quantity_set.may_match(line) else ()):
+            match = pattern.search(line)
             if match:
                 try:
                     qty_str = match.group(1)
@@ -302,15 +480,10 @@ class ConstructionParser:
                     
                     # CRITICAL: Check if this number is part of a model number pattern
                     # If line contains patterns like "MAU-11", "CH30", "OM-141", don't extract the number as quantity
-                    model_patterns_in_line = [
-                        r'[A-Z]{2,}-\d+',  # MAU-11, OM-141
-                        r'[A-Z]{1,3}\d{2,}',  # CH30, VP1234
-                    ]
-                    
                     # Check if this quantity appears to be part of a model number
                     is_part_of_model = False
-                    for model_pat in model_patterns_in_line:
-                        model_match = re.search(model_pat, line, re.IGNORECASE)
+                    for model_pat in MODEL_IN_LINE_RES:
+                        model_match = model_pat.search(line)
                         if model_match and qty_str in model_match.group():
                             is_part_of_model = True
                             break
@@ -329,9 +502,9 @@ class ConstructionParser:
                             is_spec_reference = True  # This decimal was already identified as spec reference
                     elif '.' in qty_str:
                         # Decimal numbers without explicit "qty" or "quantity" labels are often spec references
-                        if not re.search(r'\b(qty|quantity)[:\s]*\d+\.\d+', line, re.IGNORECASE):
+                        if not EXPLICIT_DECIMAL_QTY_RE.search(line):
                             # Check if line has dimensions or model numbers - if so, "31.1" is likely a spec ref
-                            if re.search(r'\d+\s*["\']|OM-|MAU-|CH\d+|model|part\s*#', line, re.IGNORECASE):
+                            if SPEC_CONTEXT_RE.search(line):
                                 is_spec_reference = True  # Likely a spec reference, not quantity
                                 # Also add it as spec reference if we haven't found one yet
                                 if not item_data.get('spec'):
@@ -352,9 +525,9 @@ class ConstructionParser:
         
         # Check for model numbers (more strict - avoid matching entire lines and legal text)
         all_models = []
-        for pattern in self.model_patterns:
-            matches = re.finditer(pattern, line, re.IGNORECASE)
-            for match in matches:
+        model_set = self.patterns['model']
+        for pattern in (model_set if model_set.may_match(line) else ()):
+            for match in pattern.finditer(line):
                 groups = match.groups()
                 if groups:
                     # Get the model number from groups
@@ -362,26 +535,26 @@ class ConstructionParser:
                         if group and group.strip():
                             model = group.strip()
                             # Skip if it looks like a quantity, dimension, or is too long (likely not a model)
-                            if not re.match(r'^\d+$', model) and len(model) > 1 and len(model) < 50:
+                            if not DIGITS_ONLY_RE.match(model) and len(model) > 1 and len(model) < 50:
                                 # Must have some structure - letters and numbers
                                 # Exclude very short codes (like L01) if they're in legal/disclaimer text
                                 if len(model) >= 2:
                                     # Skip single letter + number codes if line contains legal text
-                                    if len(model) <= 4 and re.match(r'^[A-Z]\d+$', model):
+                                    if len(model) <= 4 and SHORT_CODE_RE.match(model):
                                         # Check if line has legal disclaimer words
-                                        if any(word in line.upper() for word in ['PROHIBITED', 'COPYRIGHT', 'RESERVED', 'CONFIDENTIAL', 'USE IN']):
+                                        if any(word in line_upper for word in LEGAL_WORDS):
                                             continue  # Skip this model - likely not a real model
                                         
                                         # Skip location codes (L01, A123) unless explicitly marked as model/part
-                                        if not re.search(r'\b(model|part|pn|sku|cat|item\s*#)', line, re.IGNORECASE):
+                                        if not MODEL_LABEL_RE.search(line):
                                             continue  # Likely a location/room code, not a model
                                         
                                         # Additional check: skip if it's in a line that's just the code (likely location label)
-                                        if len(line.strip().split()) <= 2 and model.upper() in line.upper():
+                                        if len(line.strip().split()) <= 2 and model.upper() in line_upper:
                                             # Line is very short and mostly the code - likely a location label
                                             continue
                                         
-                                        if re.search(r'[A-Z]', model) and re.search(r'\d', model):
+                                        if HAS_LETTER_RE.search(model) and HAS_DIGIT_RE.search(model):
                                             if model not in all_models:
                                                 all_models.append(model)
                                     break
@@ -390,12 +563,12 @@ class ConstructionParser:
                     # Be strict - model must be reasonable length and have structure
                     if len(model) >= 3 and len(model) < 30:
                         # Skip very short codes in legal text
-                        if len(model) <= 4 and re.match(r'^[A-Z]\d+$', model):
-                            if any(word in line.upper() for word in ['PROHIBITED', 'COPYRIGHT', 'RESERVED', 'CONFIDENTIAL', 'USE IN']):
+                        if len(model) <= 4 and SHORT_CODE_RE.match(model):
+                            if any(word in line_upper for word in LEGAL_WORDS):
                                 continue  # Skip
                         
                         # Must have letters and numbers or be a known format
-                        if (re.search(r'[A-Z]', model) and re.search(r'\d', model)) or re.match(r'^[A-Z]{2,}-\d+', model):
+                        if (HAS_LETTER_RE.search(model) and HAS_DIGIT_RE.search(model)) or KNOWN_MODEL_FORMAT_RE.match(model):
                             if model not in all_models:
                                 all_models.append(model)
         
@@ -405,8 +578,9 @@ class ConstructionParser:
             item_data['model'] = ', '.join(all_models[:2])  # Limit to 2 to avoid too long
         
         # Check for dimensions (but avoid extracting fractions that are part of model numbers or specs)
-        for pattern in self.dimension_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        dimension_set = self.patterns['dimension']
+        for pattern in (dimension_set if dimension_set.may_match(line) else ()):
+            match = pattern.search(line)
             if match:
                 dims = match.groups()
                 dim_parts = [d for d in dims if d]
@@ -418,37 +592,19 @@ class ConstructionParser:
                         # Skip if it's just a simple fraction and the line contains model number patterns or instruction phrases
                         if '/' in dim and len(dim) <= 4:  # Simple fraction like "1/2", "3/4"
                             # Check if line has model number patterns or instruction phrases
-                            has_model = bool(re.search(r'[A-Z]{2,}-\d+|[A-Z]{1,3}\d{2,}', line, re.IGNORECASE))
-                            has_instruction = any(phrase in line.upper() for phrase in ['UP TO', 'SEE', 'REFER TO'])
+                            has_model = bool(MODEL_IN_LINE_RE.search(line))
+                            has_instruction = any(phrase in line_upper for phrase in ['UP TO', 'SEE', 'REFER TO'])
                             # Only keep if there's clear dimension context (diameter, size, etc.) and no model/instruction
-                            if (has_model or has_instruction) and not re.search(r'(diameter|dia|OD|ID|size|dimension|inch|inches|x\s*\d)', line, re.IGNORECASE):
+                            if (has_model or has_instruction) and not DIMENSION_WORD_RE.search(line):
                                 continue  # Skip simple fractions when model numbers/instructions are present
                         filtered_dims.append(dim)
                     
                     if filtered_dims:
                         # Try to extract the full dimension string from the line (especially for feet-inches formats)
                         # Look for common dimension patterns first
-                        full_dim_patterns = [
-                            # Diameter formats with ø symbol (check FIRST - most specific)
-                            r'(\d+\s+\d+\/\d+\s*["\']?\s*ø)',  # "1 1/2\"ø" or "1 1/2 ø"
-                            r'(\d+[- ]\d+\/\d+\s*["\']?\s*ø)',  # "1-1/2\"ø"
-                            r'(\d+\/\d+\s*["\']?\s*ø)',  # "1/2\"ø"
-                            r'(\d+\s*["\']?\s*ø)',  # "1\"ø" or "1 ø"
-                            # Length dimensions with feet and inches
-                            r'(\d+\s*["\']\s*[-–]\s*\d+\s+\d+\/\d+\s*["\'])',  # "25' -1 5/8\""
-                            r'(\d+\s*["\']\s*[-–]\s*\d+\s*["\'])',  # "25' -1""
-                            r'(\d+\s*["\']\s+\d+\s+\d+\/\d+\s*["\'])',  # "25' 1 5/8\""
-                            r'(\d+\s*["\']\s+\d+\s*["\'])',  # "25' 6\""
-                            r'(\d+\s*["\']\s*[-–]?\s*\d+\s*\d+\/\d+)',  # "25'-1 5/8" (no trailing quote)
-                            r'(\d+\s*["\']\s*[-–]?\s*\d+\s*\d+\/\d+\s*["\']?)',  # Flexible feet-inches
-                            # Also catch patterns like "BE= 25' -1 5/8\"" where dimension follows "=" or ":"
-                            r'(?:[=:]\s*)(\d+\s*["\']\s*[-–]?\s*\d+\s*\d+\/\d+\s*["\']?)',  # "BE= 25' -1 5/8\""
-                            r'(?:[=:]\s*)(\d+\s*["\']\s*[-–]?\s*\d+\s*["\']?)',  # "BE= 25' -1\""
-                        ]
-                        
                         full_dim_found = None
-                        for dim_pattern in full_dim_patterns:
-                            full_match = re.search(dim_pattern, line, re.IGNORECASE)
+                        for dim_pattern in FULL_DIMENSION_RES:
+                            full_match = dim_pattern.search(line)
                             if full_match:
                                 full_dim_found = full_match.group(1).strip()
                                 break
@@ -463,16 +619,13 @@ class ConstructionParser:
                             single_dim = filtered_dims[0]
                             
                             # Skip if it's just a standalone number without units or dimension context
-                            is_standalone_number = bool(re.match(r'^\d+$', single_dim.strip()))
+                            is_standalone_number = bool(DIGITS_ONLY_RE.match(single_dim.strip()))
                             
                             # Check if it's likely a dimension (has quotes, units, diameter symbol, or is part of dimension pattern)
-                            has_dimension_context = bool(re.search(
-                                r'["\']|inch|inches|in|feet|ft|cm|mm|diameter|dia|ø|"|\'|x\s*\d', 
-                                line, re.IGNORECASE
-                            ))
+                            has_dimension_context = bool(DIMENSION_CONTEXT_RE.search(line))
                             
                             # Also check if the dimension pattern itself contains units (like "1 1/2\"ø")
-                            has_units_in_dim = bool(re.search(r'["\']|ø|inch|in|ft|cm|mm', single_dim, re.IGNORECASE))
+                            has_units_in_dim = bool(UNITS_IN_DIMENSION_RE.search(single_dim))
                             
                             # Only extract if:
                             # 1. It has units in the dimension itself, OR
@@ -486,17 +639,16 @@ class ConstructionParser:
                         break
         
         # Check for mounting types
-        for pattern in self.mounting_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                item_data['mounting'] = match.group(0).strip()
-                has_indicators = True
-                break
+        match = self.patterns['mounting'].search_first(line)
+        if match:
+            item_data['mounting'] = match.group(0).strip()
+            has_indicators = True
         
         # Check for specs FIRST (do this BEFORE quantity check to properly categorize decimal references)
         # This ensures "31.1" goes to spec_reference, not quantity
-        for pattern in self.spec_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        spec_set = self.patterns['spec']
+        for pattern in (spec_set if spec_set.may_match(line) else ()):
+            match = pattern.search(line)
             if match:
                 groups = match.groups()
                 if groups:
@@ -508,39 +660,15 @@ class ConstructionParser:
                     item_data['spec'] = spec_str
                     has_indicators = True
                     # If we found a decimal spec reference like "31.1", mark it so quantity extraction skips it
-                    if '.' in spec_str and re.match(r'^\d+\.\d+$', spec_str):
+                    if '.' in spec_str and DECIMAL_RE.match(spec_str):
                         item_data['_has_spec_decimal'] = True  # Internal flag to prevent quantity extraction
                         item_data['_spec_decimal_value'] = spec_str  # Store the value
                     break
         
-        # FINAL VALIDATION: Check if this is actually an instruction/reference, not an item
-        # Even if it passed earlier checks, verify it's not an instruction
-        line_stripped = line.strip().upper()
-        instruction_indicators = [
-            line_stripped.startswith('UP TO'),
-            line_stripped.startswith('SEE '),
-            line_stripped.startswith('REFER '),
-            line_stripped.startswith('USE '),
-            line_stripped.startswith('INSTALL '),
-            line_stripped.startswith('MOUNT '),
-            line_stripped.startswith('CONNECT '),
-            'SEE PAGE' in line_stripped,
-            'SEE DRAWING' in line_stripped,
-            'SEE SPEC' in line_stripped,
-            'REFER TO' in line_stripped,
-        ]
-        if any(instruction_indicators):
-            return None  # This is an instruction, not an item
-        
         # Check if line is a drawing/line reference (e.g., "L01-MP-P.1A", "LINE 1", "DWG-123")
-        # These are drawing references, not actual fixtures
-        drawing_reference_patterns = [
-            r'^[A-Z]\d+[-\.][A-Z]+[-\.]',  # L01-MP-P.1A, A123-DWG-1
-            r'^LINE\s+\d+',  # LINE 1, LINE 2
-            r'^DWG[-\.]\d+',  # DWG-123, DWG.456
-            r'^[A-Z]+\d*[-\.]MP[-\.]',  # L01-MP-P.1A pattern
-        ]
-        if any(re.match(pattern, line_stripped) for pattern in drawing_reference_patterns):
+        # These are drawing references, not actual fixtures (instruction lines were rejected up front)
+        line_stripped = line.strip().upper()
+        if line_category == LINE_DRAWING_REF:
             # This is a drawing/line reference, not a fixture
             # If the entire line is just the reference, extract it as spec_reference instead of fixture_type
             if line_stripped == line.strip().upper():
@@ -588,7 +716,7 @@ class ConstructionParser:
         # Strong indicator 4: Valid quantity pattern with units (not random numbers)
         if item_data.get('quantity'):
             # Check if quantity came from a pattern with units (more reliable)
-            qty_match = re.search(r'\b(\d+)\s*(ea|each|pcs|pieces|qty|quantity)', line, re.IGNORECASE)
+            qty_match = QTY_WITH_UNITS_RE.search(line)
             if qty_match:
                 has_strong_indicators = True
         
@@ -603,9 +731,9 @@ class ConstructionParser:
                     potential_type = ' '.join(words[:3]).strip()
                     
                     # CRITICAL: Check if this looks like a dimension (e.g., "0' - 7", "25' -1 5/8\"")
-                    is_dimension = bool(re.search(r'\d+\s*["\']\s*[-–]?\s*\d+', potential_type))
+                    is_dimension = bool(DIMENSION_LIKE_RE.search(potential_type))
                     # Check if it's just numbers/units (not a real fixture name)
-                    is_numeric = bool(re.match(r'^[\d\s\'\"\-\/\.]+$', potential_type.strip()))
+                    is_numeric = bool(NUMERIC_ONLY_RE.match(potential_type.strip()))
                     
                     # Additional validation: exclude common non-item phrases and dimensions
                     exclude_phrases = [
@@ -648,114 +776,115 @@ class ConstructionParser:
         # Don't create items from weak/no indicators
         return None
     
-    def _enrich_item(self, item: Dict[str, Any], line: str):
+    def _first_match(self, category: str, line: str, cache: Optional[Dict] = None) -> tuple:
+        """Return (pattern index, match) of the first matching pattern in a category, memoized in `cache`."""
+        if cache is None:
+            return self.patterns[category].first(line)
+        key = (category, line)
+        result = cache.get(key)
+        if result is None:
+            result = self.patterns[category].first(line)
+            cache[key] = result
+        return result
+    
+    def _enrich_item(self, item: Dict[str, Any], line: str, cache: Optional[Dict] = None):
         """Enrich an item with additional information from following lines."""
         # Add quantity if missing
         if not item.get('quantity'):
-            for pattern in self.quantity_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    try:
-                        qty_str = match.group(1)
-                        # Handle decimal quantities or take first number from comma-separated
-                        if '.' in qty_str:
-                            item['quantity'] = qty_str  # Keep as string for references like "31.1"
-                        else:
-                            item['quantity'] = int(qty_str)
-                    except (ValueError, IndexError):
-                        pass
-                    break
+            match = self._first_match('quantity', line, cache)[1]
+            if match:
+                try:
+                    qty_str = match.group(1)
+                    # Handle decimal quantities or take first number from comma-separated
+                    if '.' in qty_str:
+                        item['quantity'] = qty_str  # Keep as string for references like "31.1"
+                    else:
+                        item['quantity'] = int(qty_str)
+                except (ValueError, IndexError):
+                    pass
         
         # Add model if missing
         if not item.get('model_number'):
-            for pattern in self.model_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    # Get the last non-empty group
-                    groups = match.groups()
-                    if groups:
-                        # Find the last non-empty group
-                        for group in reversed(groups):
-                            if group and group.strip():
-                                item['model_number'] = group.strip()
-                                break
-                    else:
-                        # If no groups, use the full match
-                        item['model_number'] = match.group(0).strip()
-                    break
+            match = self._first_match('model', line, cache)[1]
+            if match:
+                # Get the last non-empty group
+                groups = match.groups()
+                if groups:
+                    # Find the last non-empty group
+                    for group in reversed(groups):
+                        if group and group.strip():
+                            item['model_number'] = group.strip()
+                            break
+                else:
+                    # If no groups, use the full match
+                    item['model_number'] = match.group(0).strip()
         
         # Add dimensions if missing (try multiple patterns)
         # CRITICAL: Don't extract standalone numbers without units as dimensions
         if not item.get('dimensions'):
-            for pattern in self.dimension_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    dims = match.groups()
-                    # Format dimensions nicely
-                    dim_parts = [d.strip() for d in dims if d and d.strip()]
-                    if dim_parts:
-                        # Join with 'x' for multiple dimensions, or keep single dimension
-                        if len(dim_parts) > 1:
-                            item['dimensions'] = ' x '.join(dim_parts)
-                        else:
-                            # Single dimension - CRITICAL: Only extract if it has units or dimension context
-                            single_dim = dim_parts[0]
-                            
-                            # Skip standalone numbers without units (like "4", "6", "22")
-                            is_standalone_number = bool(re.match(r'^\d+$', single_dim.strip()))
-                            
-                            # Check if dimension has units or context
-                            has_units = bool(re.search(r'["\']|ø|inch|inches|in|ft|feet|cm|mm|diameter|dia', single_dim, re.IGNORECASE))
-                            has_context = bool(re.search(r'(diameter|dia|OD|ID|inch|in|"|\'|ø|x\s*\d)', line, re.IGNORECASE))
-                            
-                            # Only set dimension if:
-                            # 1. It has units in the dimension itself, OR
-                            # 2. It has dimension context AND is NOT just a standalone number
-                            if has_units or (has_context and not is_standalone_number):
-                                item['dimensions'] = single_dim
-                            # Otherwise skip - standalone numbers are not dimensions
-                    break
+            match = self._first_match('dimension', line, cache)[1]
+            if match:
+                dims = match.groups()
+                # Format dimensions nicely
+                dim_parts = [d.strip() for d in dims if d and d.strip()]
+                if dim_parts:
+                    # Join with 'x' for multiple dimensions, or keep single dimension
+                    if len(dim_parts) > 1:
+                        item['dimensions'] = ' x '.join(dim_parts)
+                    else:
+                        # Single dimension - CRITICAL: Only extract if it has units or dimension context
+                        single_dim = dim_parts[0]
+                        
+                        # Skip standalone numbers without units (like "4", "6", "22")
+                        is_standalone_number = bool(DIGITS_ONLY_RE.match(single_dim.strip()))
+                        
+                        # Check if dimension has units or context
+                        has_units = bool(ENRICH_UNITS_RE.search(single_dim))
+                        has_context = bool(ENRICH_CONTEXT_RE.search(line))
+                        
+                        # Only set dimension if:
+                        # 1. It has units in the dimension itself, OR
+                        # 2. It has dimension context AND is NOT just a standalone number
+                        if has_units or (has_context and not is_standalone_number):
+                            item['dimensions'] = single_dim
+                        # Otherwise skip - standalone numbers are not dimensions
         
         # Add mounting type if missing
         if not item.get('mounting_type'):
-            for pattern in self.mounting_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    mounting = match.group(0).strip() if match.group(0) else match.group(1).strip() if match.groups() else ''
-                    if mounting:
-                        # Normalize mounting type
-                        mounting = re.sub(r'[-\s]+', '-', mounting.lower())
-                        mounting = mounting.replace('mounting', 'mount').replace('hung', 'mount')
-                        item['mounting_type'] = mounting.title()
-                    break
+            match = self._first_match('mounting', line, cache)[1]
+            if match:
+                mounting = match.group(0).strip() if match.group(0) else match.group(1).strip() if match.groups() else ''
+                if mounting:
+                    # Normalize mounting type
+                    mounting = MOUNTING_SEPARATORS_RE.sub('-', mounting.lower())
+                    mounting = mounting.replace('mounting', 'mount').replace('hung', 'mount')
+                    item['mounting_type'] = mounting.title()
         
         # Add spec reference if missing (includes page references and decimal spec numbers like "31.1")
         if not item.get('spec_reference'):
-            for pattern in self.spec_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    # Join all groups or use full match
-                    groups = match.groups()
-                    if groups:
-                        spec_str = ' '.join([g for g in groups if g]).strip()
-                    else:
-                        spec_str = match.group(0).strip()
-                    
-                    if spec_str:
-                        item['spec_reference'] = spec_str
-                        # If it's a decimal spec reference like "31.1", store it
-                        if '.' in spec_str and re.match(r'^\d+\.\d+$', spec_str):
-                            item['spec_reference'] = spec_str  # Store decimal spec references
-                    
-                    # Also extract page reference if found
-                    if 'page' in pattern.lower() or 'pg' in pattern.lower():
-                        page_match = re.search(r'\d+', spec_str)
-                        if page_match:
-                            try:
-                                item['page_number'] = int(page_match.group())
-                            except:
-                                pass
-                    break
+            pattern_idx, match = self._first_match('spec', line, cache)
+            if match:
+                # Join all groups or use full match
+                groups = match.groups()
+                if groups:
+                    spec_str = ' '.join([g for g in groups if g]).strip()
+                else:
+                    spec_str = match.group(0).strip()
+                
+                if spec_str:
+                    item['spec_reference'] = spec_str
+                    # If it's a decimal spec reference like "31.1", store it
+                    if '.' in spec_str and DECIMAL_RE.match(spec_str):
+                        item['spec_reference'] = spec_str  # Store decimal spec references
+                
+                # Also extract page reference if found
+                if self._spec_is_page_ref[pattern_idx]:
+                    page_match = FIRST_NUMBER_RE.search(spec_str)
+                    if page_match:
+                        try:
+                            item['page_number'] = int(page_match.group())
+                        except:
+                            pass
     
     def parse_tables(self, tables: List[List[List[str]]], page_num: int) -> List[Dict[str, Any]]:
         """
@@ -810,7 +939,7 @@ class ConstructionParser:
                         # Clean up value based on field type
                         if field == 'quantity' and value:
                             # Extract numeric quantity
-                            qty_match = re.search(r'\d+', value)
+                            qty_match = FIRST_NUMBER_RE.search(value)
                             if qty_match:
                                 item[field] = int(qty_match.group())
                         else:
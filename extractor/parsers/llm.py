@@ -1,51 +1,50 @@
 """
 Optional LLM-based parsing for complex PDF extraction (GPT/Claude).
+
+asyncio, the transport and the provider SDKs are imported when a parser is
+created or sends its first request, not when this module is imported.
 """
+import importlib.util
 import json
-from typing import Dict, Optional, Any
+import re
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple, Union
 from abc import ABC, abstractmethod
 
+from extractor.utils.cache import DiskCache, hash_settings
+from extractor.utils.helpers import estimate_tokens
 
-class LLMParserBase(ABC):
-    """Base class for LLM parsers."""
-    
-    @abstractmethod
-    def parse(self, text: str, schema: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse text using LLM with given schema."""
-        pass
+if TYPE_CHECKING:
+    from extractor.parsers.llm_transport import LLMTransport
 
 
-class OpenAIParser(LLMParserBase):
-    """Parse PDF text using OpenAI GPT models."""
+# Response tokens charged to the rate limiter up front (settled against the provider's usage afterwards)
+RESPONSE_TOKEN_ESTIMATE = 1000
+
+# Default number of requests in flight for one parse_many call
+DEFAULT_PARSE_CONCURRENCY = 4
+
+# Bump when build_prompt changes so cached responses to the old prompt are not reused
+PROMPT_VERSION = 1
+
+# Cached LLM responses older than this are requested again (30 days)
+LLM_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+SYSTEM_PROMPT = "You are an expert construction document analyst specializing in extracting structured data from plumbing, mechanical, and construction PDFs. You understand construction terminology, abbreviations, and specifications."
+
+
+def build_prompt(text: str, schema: Dict[str, Any]) -> str:
+    """
+    Build the extraction prompt for a document (chunk).
     
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
-        """
-        Initialize OpenAI parser.
-        
-        Args:
-            api_key: OpenAI API key
-            model: Model name to use (default: gpt-4o-mini - cheaper and widely available)
-                   Options: gpt-4o-mini, gpt-4o, gpt-3.5-turbo, gpt-4-turbo
-        """
-        try:
-            import openai
-            self.client = openai.OpenAI(api_key=api_key)
-            self.model = model
-        except ImportError:
-            raise ImportError("OpenAI library required. Install with: pip install openai")
+    Args:
+        text: Text to parse
+        schema: JSON schema for desired output structure
     
-    def parse(self, text: str, schema: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Parse text using OpenAI with structured output.
-        
-        Args:
-            text: Text to parse
-            schema: JSON schema for desired output structure
-            
-        Returns:
-            Parsed data matching the schema
-        """
-        prompt = f"""You are an expert at extracting structured data from construction PDF documents (plumbing submittals, mechanical plans, work packages).
+    Returns:
+        Prompt text
+    """
+    return f"""You are an expert at extracting structured data from construction PDF documents (plumbing submittals, mechanical plans, work packages).
 
 Your task is to extract construction items, fixtures, and equipment with:
 - Item/Fixture Types (e.g., "Valve Package", "Circulating Pump", "Eye Wash Station", "Body Repair Shop Fixtures")
@@ -72,84 +71,293 @@ Extract all construction items according to this schema:
 {json.dumps(schema, indent=2)}
 
 Return a JSON object with an "items" array containing all extracted items."""
+
+
+class LLMParserBase(ABC):
+    """
+    Base class for LLM parsers.
+    
+    Subclasses implement one async provider call (`_complete`); every request
+    goes through the provider's shared LLMTransport (connection pool, rate
+    limiter, timeout, retries). `parse` and `parse_many` are blocking wrappers
+    around `aparse` for synchronous callers.
+    """
+    
+    # Provider quota the parser's requests are charged to (see llm_transport.PROVIDER_LIMITS)
+    provider = 'openai'
+    
+    def __init__(self, transport: Optional['LLMTransport'] = None):
+        """
+        Initialize the parser.
+        
+        Args:
+            transport: Transport to send requests through (default: the provider's shared one)
+        """
+        from extractor.parsers.llm_transport import get_transport
+        self.transport = transport or get_transport(self.provider)
+    
+    @abstractmethod
+    async def _complete(self, prompt: str) -> Tuple[str, Optional[int]]:
+        """
+        Send one prompt to the provider.
+        
+        Returns:
+            tuple: (response text, total tokens used or None if unknown)
+        """
+        pass
+    
+    async def aparse(self, text: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse text using LLM with given schema.
+        
+        Args:
+            text: Text to parse
+            schema: JSON schema for desired output structure
+        
+        Returns:
+            Parsed data matching the schema
+        
+        Raises:
+            LLMError: The request failed after retries or the response was not JSON
+        """
+        prompt = build_prompt(text, schema)
+        content = await self.transport.request(
+            lambda: self._complete(prompt),
+            tokens=estimate_tokens(SYSTEM_PROMPT + prompt) + RESPONSE_TOKEN_ESTIMATE
+        )
+        try:
+            return json.loads(content)
+        except (TypeError, ValueError) as e:
+            from extractor.parsers.llm_transport import LLMError
+            raise LLMError(f"LLM response is not valid JSON: {e}") from e
+    
+    def parse(self, text: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Blocking version of `aparse`."""
+        return self.transport.run(self.aparse(text, schema))
+    
+    async def aparse_many(
+        self,
+        texts: List[str],
+        schema: Dict[str, Any],
+        concurrency: int = DEFAULT_PARSE_CONCURRENCY
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Parse several texts concurrently (at most `concurrency` requests in flight).
+        
+        Returns:
+            One entry per text, in order: the parsed data, or the exception that request raised
+        """
+        import asyncio
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def parse_one(text: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aparse(text, schema)
+        
+        return await asyncio.gather(*(parse_one(text) for text in texts), return_exceptions=True)
+    
+    def parse_many(
+        self,
+        texts: List[str],
+        schema: Dict[str, Any],
+        concurrency: int = DEFAULT_PARSE_CONCURRENCY
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Blocking version of `aparse_many`."""
+        return self.transport.run(self.aparse_many(texts, schema, concurrency))
+
+
+class OpenAIParser(LLMParserBase):
+    """Parse PDF text using OpenAI GPT models."""
+    
+    provider = 'openai'
+    
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini", transport: Optional['LLMTransport'] = None):
+        """
+        Initialize OpenAI parser.
         
-        response = self.client.chat.completions.create(
+        Args:
+            api_key: OpenAI API key
+            model: Model name to use (default: gpt-4o-mini - cheaper and widely available)
+                   Options: gpt-4o-mini, gpt-4o, gpt-3.5-turbo, gpt-4-turbo
+            transport: Transport to send requests through (default: the shared OpenAI one)
+        """
+        if importlib.util.find_spec('openai') is None:
+            raise ImportError("OpenAI library required. Install with: pip install openai")
+        super().__init__(transport)
+        self.api_key = api_key
+        self.model = model
+        self._client = None
+    
+    @property
+    def client(self):
+        """AsyncOpenAI client, created (and the SDK imported) on the first request."""
+        if self._client is None:
+            import openai
+            # Retries and timeouts are handled by the transport
+            self._client = openai.AsyncOpenAI(
+                api_key=self.api_key, http_client=self.transport.http_client,
+                max_retries=0, timeout=self.transport.timeout
+            )
+        return self._client
+    
+    async def _complete(self, prompt: str) -> Tuple[str, Optional[int]]:
+        """Send one prompt with JSON-object output."""
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are an expert construction document analyst specializing in extracting structured data from plumbing, mechanical, and construction PDFs. You understand construction terminology, abbreviations, and specifications."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             response_format={"type": "json_object"}
         )
-        
-        return json.loads(response.choices[0].message.content)
+        usage = getattr(response, 'usage', None)
+        return response.choices[0].message.content, getattr(usage, 'total_tokens', None)
 
 
 class ClaudeParser(LLMParserBase):
     """Parse PDF text using Anthropic Claude models."""
     
-    def __init__(self, api_key: str, model: str = "claude-3-sonnet-20240229"):
+    provider = 'anthropic'
+    
+    def __init__(self, api_key: str, model: str = "claude-3-sonnet-20240229", transport: Optional['LLMTransport'] = None):
         """
         Initialize Claude parser.
         
         Args:
             api_key: Anthropic API key
             model: Model name to use
+            transport: Transport to send requests through (default: the shared Anthropic one)
         """
-        try:
-            import anthropic
-            self.client = anthropic.Anthropic(api_key=api_key)
-            self.model = model
-        except ImportError:
+        if importlib.util.find_spec('anthropic') is None:
             raise ImportError("Anthropic library required. Install with: pip install anthropic")
+        super().__init__(transport)
+        self.api_key = api_key
+        self.model = model
+        self._client = None
     
-    def parse(self, text: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    @property
+    def client(self):
+        """AsyncAnthropic client, created (and the SDK imported) on the first request."""
+        if self._client is None:
+            import anthropic
+            # Retries and timeouts are handled by the transport
+            self._client = anthropic.AsyncAnthropic(
+                api_key=self.api_key, http_client=self.transport.http_client,
+                max_retries=0, timeout=self.transport.timeout
+            )
+        return self._client
+    
+    async def _complete(self, prompt: str) -> Tuple[str, Optional[int]]:
+        """Send one prompt; the JSON object is the message text."""
+        message = await self.client.messages.create(
+            model=self.model,
+            max_tokens=4096,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+        usage = getattr(message, 'usage', None)
+        used = (usage.input_tokens + usage.output_tokens) if usage is not None else None
+        return message.content[0].text, used
+
+
+class LocalParser(LLMParserBase):
+    """
+    Offline stand-in for an LLM provider.
+    
+    Runs the regex ConstructionParser over the document text of the prompt
+    and answers in the same JSON shape as the real parsers, through the same
+    transport. Used to exercise chunking, the transport and the response
+    cache without an API key (`--llm local`).
+    """
+    
+    provider = 'local'
+    
+    def __init__(self, delay: float = 0.0, transport: Optional['LLMTransport'] = None):
         """
-        Parse text using Claude with structured output.
+        Initialize the local parser.
         
         Args:
-            text: Text to parse
-            schema: JSON schema for desired output structure
-            
-        Returns:
-            Parsed data matching the schema
+            delay: Simulated response latency in seconds
+            transport: Transport to send requests through (default: the shared local one)
         """
-        prompt = f"""You are an expert at extracting structured data from construction PDF documents (plumbing submittals, mechanical plans, work packages).
-
-Your task is to extract construction items, fixtures, and equipment with:
-- Item/Fixture Types (e.g., "Valve Package", "Circulating Pump", "Eye Wash Station", "Body Repair Shop Fixtures")
-- Quantities (can be integers like 31 or references like "31.1, 31")
-- Model Numbers / Spec References (e.g., "OM-141", "HUH-13", "30.1", "BOILER CIRCULATING PUMP")
-- Page References (if available in text)
-- Associated Dimensions (e.g., "1 1/2\"ø", "2 x 4 x 6")
-- Mounting Type (e.g., "wall-mounted", "floor-mounted")
-
-IMPORTANT INSTRUCTIONS:
-1. Extract ALL construction items, equipment, and fixtures mentioned
-2. Look for items in tables, lists, and free text
-3. Handle abbreviations (e.g., "HHWS" = Heating Hot Water Supply, "CWR" = Cooling Water Return)
-4. Extract quantities even if formatted as references (like "31.1, 31")
-5. Model numbers can be in various formats: OM-141, HUH-13, 30.1, or descriptive like "BOILER CIRCULATING PUMP"
-6. If quantity is a reference like "31.1, 31", keep it as string
-7. Be thorough - extract items from tables, notes, and descriptions
-8. Include context from surrounding text to identify complete item descriptions
-
-Document Text:
-{text}
+        from extractor.parsers.construction import ConstructionParser
+        super().__init__(transport)
+        self.parser = ConstructionParser()
+        self.delay = delay
+        self.model = 'local-regex'
+    
+    async def _complete(self, prompt: str) -> Tuple[str, Optional[int]]:
+        """Extract items from the prompt's document text, per '--- Page N ---' section."""
+        if self.delay:
+            import asyncio
+            await asyncio.sleep(self.delay)
+        text = prompt.split('Document Text:\n', 1)[-1].rsplit('\n\nExtract all construction items', 1)[0]
+        sections = re.split(r'^--- Page (\d+) ---$', text, flags=re.MULTILINE)
+        items = []
+        # re.split yields [before, page, text, page, text, ...]
+        for page_num, page_text in zip(sections[1::2], sections[2::2]):
+            for item in self.parser.extract_items(page_text, int(page_num)):
+                items.append({key: item.get(key) for key in (
+                    'fixture_type', 'quantity', 'model_number', 'dimensions',
+                    'mounting_type', 'spec_reference', 'page_number'
+                )})
+        return json.dumps({'items': items}, default=str), None
 
-Extract all construction items according to this schema:
-{json.dumps(schema, indent=2)}
 
-Return a JSON object with an "items" array containing all extracted items."""
+class CachedLLMParser(LLMParserBase):
+    """
+    Disk-backed response cache in front of another LLM parser.
+    
+    Responses are keyed by a hash of provider, model, prompt version, schema
+    and text, so an unchanged page or chunk is only ever sent once. Entries
+    expire after `ttl` seconds; the DiskCache evicts least recently used
+    entries beyond its size limit. Failed requests are not cached.
+    """
+    
+    def __init__(self, parser: LLMParserBase, cache: DiskCache, ttl: Optional[float] = LLM_CACHE_TTL_SECONDS):
+        """
+        Initialize the cached parser.
         
-        message = self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
+        Args:
+            parser: Parser whose responses are cached
+            cache: DiskCache holding the responses
+            ttl: Maximum age of a cached response in seconds (None = never expires)
+        """
+        super().__init__(parser.transport)
+        self.parser = parser
+        self.provider = parser.provider
+        self.model = getattr(parser, 'model', None)
+        self.cache = cache
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+    
+    def cache_key(self, text: str, schema: Dict[str, Any]) -> str:
+        """Cache key of one request."""
+        return 'llm:' + hash_settings({
+            'provider': self.provider,
+            'model': self.model,
+            'prompt_version': PROMPT_VERSION,
+            'schema': schema,
+            'text': text,
+        })
+    
+    async def _complete(self, prompt: str) -> Tuple[str, Optional[int]]:
+        return await self.parser._complete(prompt)
+    
+    async def aparse(self, text: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the cached response, or parse with the wrapped parser and cache the result."""
+        key = self.cache_key(text, schema)
+        entry = self.cache.get(key)
+        if isinstance(entry, dict) and 'response' in entry:
+            if self.ttl is None or time.time() - entry.get('created', 0) <= self.ttl:
+                self.hits += 1
+                return entry['response']
+            self.cache.delete(key)
         
-        response_text = message.content[0].text
-        return json.loads(response_text)
+        self.misses += 1
+        response = await self.parser.aparse(text, schema)
+        self.cache.set(key, {'created': time.time(), 'response': response})
+        return response
 
@@ -0,0 +1,339 @@
+"""
+Asyncio transport shared by the LLM parsers.
+
+One transport per provider runs an event loop on a daemon thread and owns a
+pooled HTTP client, so every parser, chunk and document in the process reuses
+the same connections and draws from the same rate limit. Requests go through
+a token bucket (requests and tokens per minute), a request-level timeout and
+retries with exponential backoff plus jitter; a 429 pauses the whole bucket
+for the server's Retry-After instead of letting every request hit it again.
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+# Default quotas per provider (lowest paid tier); override with --llm-rpm / --llm-tpm
+PROVIDER_LIMITS = {
+    'openai': {'requests_per_minute': 500, 'tokens_per_minute': 200_000},
+    'anthropic': {'requests_per_minute': 50, 'tokens_per_minute': 40_000},
+    'local': {'requests_per_minute': 1_000_000, 'tokens_per_minute': 1_000_000_000},  # Offline stand-in, no quota
+}
+
+# Wall-time limit of one request attempt in seconds (long extraction responses take a while)
+REQUEST_TIMEOUT_SECONDS = 120.0
+
+# Attempts after the first one before an error is raised
+MAX_RETRIES = 5
+
+# Exponential backoff: base delay and cap in seconds (full jitter is applied below the cap)
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# Connections kept by the pooled HTTP client
+MAX_CONNECTIONS = 32
+
+# HTTP status codes worth retrying (throttling, timeouts, transient server errors)
+RETRY_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class LLMError(RuntimeError):
+    """An LLM request failed for good (not retryable, or out of retries)."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, attempts: int = 1):
+        super().__init__(message)
+        self.status_code = status_code
+        self.attempts = attempts
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """HTTP status of an SDK/httpx error, if it carries one."""
+    code = getattr(error, 'status_code', None)
+    if code is None:
+        code = getattr(getattr(error, 'response', None), 'status_code', None)
+    return code if isinstance(code, int) else None
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the server asked to wait (Retry-After / retry-after-ms headers), if any."""
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000
+        if headers.get('retry-after'):
+            return float(headers['retry-after'])
+    except (TypeError, ValueError):
+        # HTTP-date form - fall back to the computed backoff
+        return None
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed attempt is worth retrying."""
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    code = status_code(error)
+    if code is not None:
+        return code in RETRY_STATUS_CODES
+    # Connection resets / read timeouts raised by the SDKs and httpx carry no status
+    name = type(error).__name__
+    return 'Connection' in name or 'Timeout' in name
+
+
+def backoff_delay(attempt: int, server_delay: Optional[float] = None,
+                  base: float = BACKOFF_BASE_SECONDS, cap: float = BACKOFF_MAX_SECONDS) -> float:
+    """
+    Delay before retry number `attempt` (0-based).
+
+    Full jitter over an exponentially growing window, never shorter than the
+    delay the server asked for.
+    """
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if server_delay is not None:
+        delay = max(delay, min(server_delay, cap))
+    return delay
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `per_minute` tokens per minute (burst = one minute)."""
+
+    def __init__(self, per_minute: float):
+        self.set_rate(per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def set_rate(self, per_minute: float) -> None:
+        self.capacity = max(1.0, float(per_minute))
+        self.rate = self.capacity / 60.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0 if they are now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, amount: float) -> None:
+        """Charge (or refund, if negative) tokens after the fact; the bucket may go into debt."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limits of one provider quota.
+
+    Waiters are served in arrival order, so a large request is not starved
+    by a stream of small ones. Only used from the transport's event loop.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._refunded: Optional[asyncio.Event] = None
+
+    def set_rates(self, requests_per_minute: Optional[float] = None,
+                  tokens_per_minute: Optional[float] = None) -> None:
+        if requests_per_minute:
+            self.requests.set_rate(requests_per_minute)
+        if tokens_per_minute:
+            self.tokens.set_rate(tokens_per_minute)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for `seconds` (server-side throttling)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def settle(self, estimated: int, used: int) -> None:
+        """Replace a request's up-front token estimate with the provider's count."""
+        self.tokens.adjust(used - estimated)
+        if used < estimated and self._refunded is not None:
+            self._refunded.set()
+
+    async def acquire(self, tokens: int) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+            self._refunded = asyncio.Event()
+        async with self._lock:
+            while True:
+                wait = max(
+                    self.paused_until - time.monotonic(),
+                    self.requests.wait_time(1),
+                    self.tokens.wait_time(tokens),
+                )
+                if wait <= 0:
+                    break
+                # Sleep until the tokens refill, or earlier if a finished request refunds some
+                self._refunded.clear()
+                try:
+                    await asyncio.wait_for(self._refunded.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+            self.requests.take(1)
+            self.tokens.take(tokens)
+
+
+class LLMTransport:
+    """Event loop thread, pooled HTTP client and rate limiter shared by one provider's parsers."""
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+        max_retries: int = MAX_RETRIES,
+        max_connections: int = MAX_CONNECTIONS
+    ):
+        """
+        Initialize the transport (the loop thread and HTTP client start lazily).
+
+        Args:
+            requests_per_minute: Provider request quota
+            tokens_per_minute: Provider token quota
+            timeout: Wall-time limit of one request attempt in seconds
+            max_retries: Retries after the first attempt
+            max_connections: Size of the HTTP connection pool
+        """
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_connections = max_connections
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._http_client = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The transport's event loop (started on a daemon thread on first use)."""
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='pdfx-llm', daemon=True)
+                self._thread.start()
+        return self._loop
+
+    @property
+    def http_client(self):
+        """Pooled async HTTP client handed to the provider SDKs (keep-alive connections are reused)."""
+        if self._http_client is None:
+            import httpx
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+                timeout=httpx.Timeout(self.timeout),
+            )
+        return self._http_client
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """
+        Run a coroutine on the transport loop and block until it finishes.
+
+        Safe to call from any thread except the loop's own (use `await` there).
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("LLMTransport.run() called from the transport loop - await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def request(self, call: Callable[[], Awaitable[Tuple[Any, Optional[int]]]], tokens: int) -> Any:
+        """
+        Send one rate-limited request with timeout and retries.
+
+        May be awaited from any event loop; the request itself always runs on
+        the transport loop (where the pooled HTTP client lives).
+
+        Args:
+            call: Factory for the provider request coroutine, returning (result, tokens used or None)
+            tokens: Estimated tokens of the request, charged to the limiter up front
+
+        Returns:
+            The request's result
+
+        Raises:
+            LLMError: The request was not retryable or ran out of retries
+        """
+        loop = self.loop
+        if asyncio.get_running_loop() is loop:
+            return await self._request(call, tokens)
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._request(call, tokens), loop))
+
+    async def _request(self, call, tokens: int) -> Any:
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire(tokens)
+            try:
+                result, used = await asyncio.wait_for(call(), self.timeout)
+            except Exception as e:
+                code = status_code(e)
+                if not is_retryable(e) or attempt == self.max_retries:
+                    reason = 'timed out' if isinstance(e, asyncio.TimeoutError) else str(e) or type(e).__name__
+                    prefix = f"HTTP {code}: " if code else ''
+                    raise LLMError(f"{prefix}{reason} (after {attempt + 1} attempt(s))",
+                                   status_code=code, attempts=attempt + 1) from e
+                delay = backoff_delay(attempt, retry_after(e))
+                if code == 429:
+                    # Shared quota exhausted - hold back every request, not just this one
+                    self.limiter.pause(delay)
+                await asyncio.sleep(delay)
+                continue
+            if used is not None:
+                self.limiter.settle(tokens, used)
+            return result
+
+    def close(self) -> None:
+        """Close the HTTP client and stop the loop thread."""
+        if self._loop is None:
+            return
+        if self._http_client is not None:
+            self.run(self._http_client.aclose())
+            self._http_client = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+
+# Process-wide transports, one per provider quota
+_transports: Dict[str, LLMTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(provider: str, requests_per_minute: Optional[float] = None,
+                  tokens_per_minute: Optional[float] = None) -> LLMTransport:
+    """
+    Return the shared transport of a provider, creating it on first use.
+
+    Args:
+        provider: Provider name ('openai', 'anthropic', ...)
+        requests_per_minute: Override of the provider's request quota
+        tokens_per_minute: Override of the provider's token quota
+
+    Returns:
+        The provider's LLMTransport
+    """
+    with _transports_lock:
+        transport = _transports.get(provider)
+        if transport is None:
+            limits = PROVIDER_LIMITS.get(provider, PROVIDER_LIMITS['openai'])
+            transport = LLMTransport(
+                requests_per_minute or limits['requests_per_minute'],
+                tokens_per_minute or limits['tokens_per_minute'],
+            )
+            _transports[provider] = transport
+        else:
+            transport.limiter.set_rates(requests_per_minute, tokens_per_minute)
+        return transport
@@ -0,0 +1,157 @@
+"""
+Compiled regex registry for the construction parser.
+
+Pattern lists are compiled once per parser instead of being looked up in
+`re`'s cache on every line. Each category also gets an alternation-merged
+"prefilter" so a line that cannot match any pattern of the category is
+rejected with a single scan before the detailed patterns run.
+"""
+import re
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+
+class CompiledPatternSet:
+    """An ordered list of compiled patterns plus a merged prefilter for the category."""
+
+    def __init__(self, patterns: List[str], flags: int = re.IGNORECASE, requires: Optional[str] = None):
+        """
+        Compile a category of patterns.
+
+        Args:
+            patterns: Raw regex strings, in priority order
+            flags: Regex flags applied to every pattern and to the prefilter
+            requires: Optional cheap regex that every pattern in the category needs to
+                      match (e.g. r'\d' when all patterns contain a mandatory digit).
+                      Checked before the merged prefilter.
+        """
+        self.sources = list(patterns)
+        self.compiled = [re.compile(pattern, flags) for pattern in self.sources]
+        # search() on an alternation matches iff at least one alternative matches,
+        # so the prefilter never rejects a line one of the detailed patterns accepts
+        self.prefilter = re.compile('|'.join(f'(?:{pattern})' for pattern in self.sources), flags)
+        self.gate = re.compile(requires) if requires else None
+
+    def may_match(self, line: str) -> bool:
+        """Return True if any pattern in the category can match the line."""
+        if self.gate is not None and not self.gate.search(line):
+            return False
+        return self.prefilter.search(line) is not None
+
+    def first(self, line: str) -> Tuple[int, Optional[re.Match]]:
+        """Return (index, match) for the first pattern (in priority order) that matches, or (-1, None)."""
+        if self.may_match(line):
+            for idx, pattern in enumerate(self.compiled):
+                match = pattern.search(line)
+                if match:
+                    return idx, match
+        return -1, None
+
+    def search_first(self, line: str) -> Optional[re.Match]:
+        """Return the match of the first pattern (in priority order) that matches the line."""
+        return self.first(line)[1]
+
+    def __iter__(self) -> Iterator[Pattern]:
+        return iter(self.compiled)
+
+    def __len__(self) -> int:
+        return len(self.compiled)
+
+
+class PatternRegistry:
+    """Compiled pattern sets for every parser category, keyed by category name."""
+
+    def __init__(
+        self,
+        categories: Dict[str, List[str]],
+        flags: int = re.IGNORECASE,
+        requirements: Optional[Dict[str, str]] = None
+    ):
+        """
+        Build compiled pattern sets.
+
+        Args:
+            categories: Mapping of category name to raw pattern strings
+            flags: Regex flags applied to every category
+            requirements: Optional mapping of category name to a cheap necessary-condition regex
+        """
+        requirements = requirements or {}
+        self._sets = {
+            name: CompiledPatternSet(patterns, flags, requires=requirements.get(name))
+            for name, patterns in categories.items()
+        }
+
+    def __getitem__(self, category: str) -> CompiledPatternSet:
+        return self._sets[category]
+
+    def __contains__(self, category: str) -> bool:
+        return category in self._sets
+
+    def categories(self) -> List[str]:
+        """Return the registered category names."""
+        return list(self._sets)
+
+
+# Line categories returned by LineClassifier.classify()
+LINE_EXCLUDED = 'excluded'
+LINE_INSTRUCTION = 'instruction'
+LINE_DRAWING_REF = 'drawing_ref'
+LINE_CANDIDATE = 'candidate'
+
+
+class LineClassifier:
+    """
+    Classify a text line before item extraction.
+
+    All rejection rules (exclusion patterns, instruction prefixes, action verbs
+    and "see page"-style references) are merged into one compiled regex, so
+    boilerplate and notes are rejected with a single scan. Lines that survive
+    are checked once against the anchored drawing-reference patterns.
+    """
+
+    def __init__(
+        self,
+        exclude_patterns: List[str],
+        instruction_prefixes: List[str],
+        instruction_patterns: List[str],
+        instruction_substrings: List[str],
+        drawing_reference_patterns: List[str],
+        min_length: int = 3
+    ):
+        """
+        Build the classifier.
+
+        Args:
+            exclude_patterns: Regexes (searched, case-insensitive) for non-item text
+            instruction_prefixes: Literal phrases; a line starting with one is an instruction
+            instruction_patterns: Regexes (searched, case-insensitive) marking instruction lines
+            instruction_substrings: Literal phrases; a line containing one is an instruction
+            drawing_reference_patterns: Regexes matched at the start of the upper-cased line
+            min_length: Lines shorter than this (after stripping) are excluded
+        """
+        self.min_length = min_length
+        excluded = '|'.join(f'(?:{pattern})' for pattern in exclude_patterns)
+        instruction = '|'.join(
+            [r'^\s*(?:' + '|'.join(re.escape(phrase) for phrase in instruction_prefixes) + ')']
+            + [f'(?:{pattern})' for pattern in instruction_patterns]
+            + [re.escape(phrase) for phrase in instruction_substrings]
+        )
+        self._reject = re.compile(f'(?P<{LINE_EXCLUDED}>{excluded})|(?P<{LINE_INSTRUCTION}>{instruction})', re.IGNORECASE)
+        self._drawing_reference = re.compile('|'.join(f'(?:{pattern})' for pattern in drawing_reference_patterns))
+
+    def classify(self, line: str) -> str:
+        """
+        Return the category of a line.
+
+        Returns:
+            LINE_EXCLUDED or LINE_INSTRUCTION for lines that can never be items,
+            LINE_DRAWING_REF for drawing/line references, LINE_CANDIDATE otherwise
+        """
+        stripped = line.strip()
+        if len(stripped) < self.min_length:
+            return LINE_EXCLUDED
+        match = self._reject.search(line)
+        if match:
+            return LINE_EXCLUDED if match.group(LINE_EXCLUDED) is not None else LINE_INSTRUCTION
+        if self._drawing_reference.match(stripped.upper()):
+            return LINE_DRAWING_REF
+        return LINE_CANDIDATE
@@ -1,13 +1,38 @@
 """
 Service classes for orchestrating PDF extraction workflows.
 """
-from .extraction_service import (
-    ExtractionStrategy,
-    ConstructionExtractionStrategy,
-    StandardExtractionStrategy,
-    ExtractionService,
-    ExtractionServiceFactory,
-)
+from typing import TYPE_CHECKING
+
+from extractor.utils.lazy import lazy_exports
+
+# Loaded on first access (the server and batch CLIs import only what they run)
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'ExtractionStrategy': '.extraction_service',
+    'ConstructionExtractionStrategy': '.extraction_service',
+    'StandardExtractionStrategy': '.extraction_service',
+    'ExtractionService': '.extraction_service',
+    'ExtractionServiceFactory': '.extraction_service',
+    'PageManifest': '.incremental',
+    'merge_items': '.merge',
+    'BatchRunner': '.batch',
+    'collect_documents': '.batch',
+    'JobQueue': '.job_queue',
+    'ExtractionServer': '.server',
+})
+
+if TYPE_CHECKING:
+    from .extraction_service import (
+        ExtractionStrategy,
+        ConstructionExtractionStrategy,
+        StandardExtractionStrategy,
+        ExtractionService,
+        ExtractionServiceFactory,
+    )
+    from .incremental import PageManifest
+    from .merge import merge_items
+    from .batch import BatchRunner, collect_documents
+    from .job_queue import JobQueue
+    from .server import ExtractionServer
 
 __all__ = [
     'ExtractionStrategy',
@@ -15,5 +40,11 @@ __all__ = [
     'StandardExtractionStrategy',
     'ExtractionService',
     'ExtractionServiceFactory',
+    'PageManifest',
+    'merge_items',
+    'BatchRunner',
+    'collect_documents',
+    'JobQueue',
+    'ExtractionServer',
 ]
 
@@ -0,0 +1,389 @@
+"""
+Batch extraction: many PDFs across a pool of warm worker processes.
+"""
+import glob
+import os
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from extractor.services.job_queue import DONE, FAILED, PENDING, RUNNING, JobQueue, default_owner
+from extractor.utils.events import PAGE_FINISHED
+from extractor.utils.helpers import save_json
+
+
+# Documents a worker process extracts before it is replaced (bounds memory growth on long batches)
+TASKS_PER_WORKER = 50
+
+# Name of the run summary written next to the per-document outputs
+SUMMARY_FILENAME = 'batch_summary.json'
+
+# Name of the job queue (document states and page progress) kept in the output directory
+QUEUE_FILENAME = 'batch_queue.db'
+
+# Characters that make an input spec a glob pattern
+GLOB_CHARS = '*?['
+
+
+def _pdfs_in(directory: Path) -> List[Path]:
+    return sorted(path for path in directory.rglob('*') if path.is_file() and path.suffix.lower() == '.pdf')
+
+
+def collect_documents(specs: List[str]) -> Tuple[List[Path], List[str]]:
+    """
+    Expand batch inputs into a list of PDF files.
+
+    Each spec is a PDF file, a directory (searched recursively), a glob
+    pattern ('**' allowed) or a manifest file listing one spec per line
+    (blank lines and '#' comments are skipped; relative entries are resolved
+    against the manifest's directory).
+
+    Args:
+        specs: Input specs from the command line
+
+    Returns:
+        tuple: (unique PDF paths in input order, specs that matched nothing)
+    """
+    documents = []
+    missing = []
+    seen = set()
+
+    def add(path: Path):
+        key = path.resolve()
+        if key not in seen:
+            seen.add(key)
+            documents.append(path)
+
+    pending = [(spec, None) for spec in specs]
+    while pending:
+        spec, base = pending.pop(0)
+        if base is not None and not os.path.isabs(spec):
+            spec = str(base / spec)
+        path = Path(spec)
+        if any(char in spec for char in GLOB_CHARS):
+            matches = sorted(Path(match) for match in glob.glob(spec, recursive=True))
+            pdfs = [match for match in matches if match.is_file() and match.suffix.lower() == '.pdf']
+            for match in matches:
+                if match.is_dir():
+                    pdfs.extend(_pdfs_in(match))
+            if not pdfs:
+                missing.append(spec)
+            for pdf in pdfs:
+                add(pdf)
+        elif path.is_dir():
+            pdfs = _pdfs_in(path)
+            if not pdfs:
+                missing.append(spec)
+            for pdf in pdfs:
+                add(pdf)
+        elif path.is_file() and path.suffix.lower() == '.pdf':
+            add(path)
+        elif path.is_file():
+            # Manifest: one spec per line, expanded in place
+            lines = path.read_text(encoding='utf-8').splitlines()
+            entries = [line.strip() for line in lines if line.strip() and not line.strip().startswith('#')]
+            pending[:0] = [(entry, path.parent) for entry in entries]
+        else:
+            missing.append(spec)
+
+    return documents, missing
+
+
+def output_paths(documents: List[Path], output_dir: str | Path) -> List[Path]:
+    """
+    Map each document to its output JSON path.
+
+    The directory layout below the inputs' common parent is mirrored into
+    output_dir, so same-named PDFs from different folders do not collide.
+    """
+    output_dir = Path(output_dir)
+    if not documents:
+        return []
+    parents = [str(path.resolve().parent) for path in documents]
+    root = Path(os.path.commonpath(parents))
+    return [
+        output_dir / path.resolve().parent.relative_to(root) / f"{path.stem}_extracted.json"
+        for path in documents
+    ]
+
+
+def create_service(options: Dict[str, Any]):
+    """
+    Build an ExtractionService from batch options.
+
+    Args:
+        options: {'mode': 'construction' | 'standard', **factory keyword arguments}
+    """
+    from extractor.services.extraction_service import ExtractionServiceFactory
+
+    kwargs = dict(options)
+    mode = kwargs.pop('mode', 'construction')
+    if mode == 'standard':
+        return ExtractionServiceFactory.create_standard_service(**kwargs)
+    return ExtractionServiceFactory.create_construction_service(**kwargs)
+
+
+# Per-process service and job queue, opened once by the pool initializer and reused for every document
+_worker_service = None
+_worker_queue: Optional[JobQueue] = None
+
+
+def _init_worker(options: Dict[str, Any], queue_path: Optional[str] = None) -> None:
+    global _worker_service, _worker_queue
+    _worker_service = create_service(options)
+    _worker_queue = JobQueue(queue_path) if queue_path else None
+
+
+def page_recorder(queue: Optional[JobQueue], document_id: Optional[int]):
+    """Event callback counting finished pages of a queued document (None when there is no queue)."""
+    if queue is None or document_id is None:
+        return None
+
+    def record(event) -> None:
+        if event.type == PAGE_FINISHED:
+            queue.page_done(document_id, event.total_pages)
+
+    return record
+
+
+def extract_document(input_path: str, output_path: str, service=None, document_id: Optional[int] = None,
+                     queue: Optional[JobQueue] = None) -> Dict[str, Any]:
+    """
+    Extract one document and write its JSON output; never raises.
+
+    Args:
+        input_path: PDF path
+        output_path: Output JSON path
+        service: ExtractionService to use (default: the worker's warm service)
+        document_id: Job queue id of the document (finished pages are counted)
+        queue: Job queue to count pages in (default: the worker's queue)
+
+    Returns:
+        Per-document result: input, output, status ('ok' or 'failed'), pages,
+        items, seconds and error
+    """
+    started = time.perf_counter()
+    result = {'input': input_path, 'output': output_path, 'status': 'ok',
+              'pages': 0, 'items': None, 'seconds': 0.0, 'error': None}
+    try:
+        on_event = page_recorder(queue or _worker_queue, document_id)
+        output = (service or _worker_service).extract(input_path, show_progress=False, on_event=on_event)
+        # Internal flags are not part of the saved output
+        output = {key: value for key, value in output.items() if not key.startswith('_')}
+        save_json(output, output_path)
+        result['pages'] = len(output.get('pages') or [])
+        result['items'] = output.get('total_items_found')
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def share_llm_quota(options: Dict[str, Any], jobs: int) -> Dict[str, Any]:
+    """
+    Split the LLM quota between worker processes.
+
+    Every process has its own rate limiter, so each gets 1/jobs of the
+    requests and tokens per minute (provider defaults when not given).
+    """
+    llm_type = options.get('llm_type')
+    if not llm_type or jobs <= 1:
+        return options
+    from extractor.parsers.llm_transport import PROVIDER_LIMITS
+    provider = 'anthropic' if llm_type == 'claude' else llm_type
+    limits = PROVIDER_LIMITS.get(provider, PROVIDER_LIMITS['openai'])
+    options = dict(options)
+    rpm = options.get('llm_requests_per_minute') or limits['requests_per_minute']
+    tpm = options.get('llm_tokens_per_minute') or limits['tokens_per_minute']
+    options['llm_requests_per_minute'] = rpm / jobs
+    options['llm_tokens_per_minute'] = tpm / jobs
+    return options
+
+
+class BatchRunner:
+    """
+    Extract many PDFs with a pool of warm worker processes.
+
+    Each worker builds the extraction service (imports, compiled patterns,
+    LLM client) once and then takes documents, largest first, as slots free
+    up, so long files do not end up at the tail of the run. Documents are
+    tracked in a durable job queue (batch_queue.db in the output directory):
+    a batch that is interrupted - reboot, OOM kill, Ctrl+C - continues where
+    it stopped when run again, and documents already extracted are skipped.
+    A failed document is recorded in the summary and never aborts the batch.
+    """
+
+    def __init__(
+        self,
+        options: Dict[str, Any],
+        output_dir: str | Path,
+        jobs: int = 0,
+        on_result: Optional[Callable[[Dict[str, Any], int, int], None]] = None,
+        queue_path: Optional[str | Path] = None,
+        resume: bool = True,
+        retry_failed: bool = False
+    ):
+        """
+        Initialize the batch runner.
+
+        Args:
+            options: Service options ({'mode': ..., **factory keyword arguments})
+            output_dir: Directory receiving one JSON per document and the run summary
+            jobs: Number of worker processes (0 = one per CPU core)
+            on_result: Called with (document result, done count, total) as each document finishes
+            queue_path: Job queue database (default: batch_queue.db in output_dir)
+            resume: Keep the progress recorded by previous runs (False = extract everything again)
+            retry_failed: Queue documents that failed in previous runs again
+        """
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.options = share_llm_quota(options, self.jobs)
+        self.output_dir = Path(output_dir)
+        self.on_result = on_result
+        self.queue_path = Path(queue_path) if queue_path else self.output_dir / QUEUE_FILENAME
+        self.resume = resume
+        self.retry_failed = retry_failed
+
+    def run(self, documents: List[Path]) -> Dict[str, Any]:
+        """
+        Extract every document not already done and write the run summary.
+
+        Args:
+            documents: PDF paths
+
+        Returns:
+            Run summary (also saved as batch_summary.json in output_dir)
+        """
+        started = time.perf_counter()
+        queue = JobQueue(self.queue_path)
+        if not self.resume:
+            queue.reset()
+        elif self.retry_failed:
+            queue.reset((FAILED,))
+        outputs = output_paths(documents, self.output_dir)
+        # Tags this run's documents, so others left in a shared queue file are not claimed
+        run = f"{default_owner()}:{uuid.uuid4().hex[:12]}"
+        ids = queue.enqueue([
+            (str(path.resolve()), str(path), str(output)) for path, output in zip(documents, outputs)
+        ], run=run)
+        wanted = set(ids)
+        resumed = sum(row['id'] in wanted for row in queue.documents(DONE))
+        counts = queue.counts(run)
+        total = counts[PENDING] + counts[RUNNING]
+        jobs = min(self.jobs, total) or 1
+        owner = default_owner()
+        self._pages_extracted = 0
+
+        try:
+            with queue.heartbeat(owner):
+                if jobs == 1:
+                    self._run_serial(queue, owner, run, total)
+                else:
+                    self._run_pool(queue, owner, run, jobs, total)
+        except KeyboardInterrupt:
+            # Hand the documents in flight back; the next run picks them up
+            queue.release_owner(owner)
+            raise
+
+        results = [self._result(queue.get(document_id)) for document_id in ids]
+        queue.close()
+        return self._summarize(results, jobs, resumed, time.perf_counter() - started)
+
+    def _run_serial(self, queue: JobQueue, owner: str, run: str, total: int) -> None:
+        service = None
+        done = 0
+        while True:
+            claimed = queue.claim(owner, run=run)
+            if not claimed:
+                return
+            row = claimed[0]
+            service = service or create_service(self.options)
+            result = extract_document(row['input'], row['output'], service, row['id'], queue)
+            done += 1
+            self._finish(queue, row, result, done, total)
+
+    def _run_pool(self, queue: JobQueue, owner: str, run: str, jobs: int, total: int) -> None:
+        def start_pool() -> ProcessPoolExecutor:
+            return ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                       initargs=(self.options, str(queue.path)),
+                                       max_tasks_per_child=TASKS_PER_WORKER)
+
+        pool = start_pool()
+        running = {}
+        done = 0
+        try:
+            while True:
+                # Claim only as slots free up, so unclaimed documents stay available to other runs
+                for row in queue.claim(owner, jobs - len(running), run) if len(running) < jobs else []:
+                    future = pool.submit(extract_document, row['input'], row['output'], None, row['id'])
+                    running[future] = row
+                if not running:
+                    return
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                broken = None
+                for future in finished:
+                    row = running.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool as e:
+                        broken = e
+                        running[future] = row
+                        continue
+                    done += 1
+                    self._finish(queue, row, result, done, total)
+                if broken is not None:
+                    # A worker died (e.g. out of memory): the documents in flight go back to the
+                    # queue (failed once out of attempts) and a fresh pool takes over
+                    for row in running.values():
+                        queue.release(row['id'], f"worker process died: {broken}")
+                        if queue.get(row['id'])['state'] == FAILED:
+                            done += 1
+                            self._report(self._result(queue.get(row['id'])), done, total)
+                    running.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = start_pool()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, queue: JobQueue, row: Dict[str, Any], result: Dict[str, Any], done: int, total: int) -> None:
+        queue.finish(row['id'], pages=result['pages'], items=result['items'],
+                     seconds=result['seconds'], error=result['error'])
+        self._pages_extracted += result['pages']
+        self._report(dict(result, attempts=row['attempts']), done, total)
+
+    @staticmethod
+    def _result(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-document result from its queue row."""
+        status = {DONE: 'ok', FAILED: 'failed'}.get(row['state'], row['state'])
+        return {'input': row['input'], 'output': row['output'], 'status': status,
+                'pages': row['pages'], 'items': row['items'], 'seconds': row['seconds'] or 0.0,
+                'error': row['error'], 'attempts': row['attempts']}
+
+    def _report(self, result: Dict[str, Any], done: int, total: int) -> None:
+        if self.on_result:
+            self.on_result(result, done, total)
+
+    def _summarize(self, results: List[Dict[str, Any]], jobs: int, resumed: int, seconds: float) -> Dict[str, Any]:
+        succeeded = [result for result in results if result['status'] == 'ok']
+        failed = sum(result['status'] == 'failed' for result in results)
+        pages = sum(result['pages'] for result in succeeded)
+        summary = {
+            'documents': len(results),
+            'succeeded': len(succeeded),
+            'failed': failed,
+            # Left to another run holding their lease
+            'unfinished': len(results) - len(succeeded) - failed,
+            'resumed': resumed,
+            'pages': pages,
+            'items': sum(result['items'] or 0 for result in succeeded),
+            'jobs': jobs,
+            'seconds': round(seconds, 3),
+            # Throughput of this run only (resumed documents were extracted earlier)
+            'pages_per_sec': round(self._pages_extracted / seconds, 2) if seconds > 0 else 0.0,
+            'results': results,
+        }
+        save_json(summary, self.output_dir / SUMMARY_FILENAME)
+        return summary
@@ -1,33 +1,116 @@
 """
 Extraction service that orchestrates PDF extraction using OOP principles.
+
+pdfplumber (PDFTextExtractor) and the pydantic models are imported where they
+are first used, so importing this module - and the CLI - stays cheap.
 """
+from __future__ import annotations
+
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, Callable, Iterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from extractor.extractors import PDFTextExtractor
-from extractor.models import (
-    ConstructionExtractionResult,
-    StandardExtractionResult,
-    ExtractedItem,
-    ConstructionExtractionSummary,
-    ExtractedEntities,
-    PageInfo,
-    Statistics
+from extractor.extractors.tables import TABLE_BUDGET_SECONDS
+from extractor.parsers.llm import LLM_CACHE_TTL_SECONDS
+from extractor.services.incremental import PageManifest
+from extractor.services.merge import merge_items
+from extractor.utils.events import (
+    EventCallback,
+    EventEmitter,
+    ITEMS_FOUND,
+    LLM_STARTED,
+    LLM_FINISHED,
+    STEP_STARTED,
+    STEP_FINISHED,
+    timed,
 )
+from extractor.utils.cache import DiskCache
+from extractor.utils.helpers import DEFAULT_CHUNK_TOKENS
+from extractor.utils.progress import ConsoleProgress
+
+if TYPE_CHECKING:
+    from extractor.extractors import PDFTextExtractor
+    from extractor.models import (
+        ConstructionExtractionSummary,
+        ExtractedItem,
+        PageInfo,
+        Statistics
+    )
+
+
+# Default number of LLM chunk requests in flight at once
+DEFAULT_LLM_CONCURRENCY = 4
+
+# Pages whose regex confidence is below this are sent to the LLM (1 = every page)
+LLM_CONFIDENCE_THRESHOLD = 0.7
+
+# JSON schema of the items requested from the LLM (one request per document chunk)
+LLM_ITEMS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "fixture_type": {
+                        "type": "string",
+                        "description": "Item/fixture type (e.g., 'Valve Package', 'Circulating Pump', 'Eye Wash Station')"
+                    },
+                    "quantity": {
+                        "type": ["integer", "string"],
+                        "description": "Quantity - can be integer (31) or string reference ('31.1, 31')"
+                    },
+                    "model_number": {
+                        "type": "string",
+                        "description": "Model number, spec reference, or catalog number (e.g., 'OM-141', 'HUH-13', 'BOILER CIRCULATING PUMP')"
+                    },
+                    "dimensions": {
+                        "type": "string",
+                        "description": "Associated dimensions if any (e.g., '1 1/2\"ø', '2 x 4 x 6')"
+                    },
+                    "mounting_type": {
+                        "type": "string",
+                        "description": "Mounting type if stated (e.g., 'wall-mounted', 'floor-mounted')"
+                    },
+                    "spec_reference": {
+                        "type": "string",
+                        "description": "Specification reference or page reference if available"
+                    },
+                    "page_number": {
+                        "type": ["integer", "string"],
+                        "description": "Page number from the nearest preceding '--- Page N ---' marker"
+                    }
+                }
+            }
+        }
+    },
+    "required": ["items"]
+}
 
 
 class ExtractionStrategy(ABC):
     """Abstract base class for extraction strategies."""
     
     @abstractmethod
-    def extract(self, pages_data: List[Dict[str, Any]], source_pdf: str) -> Dict[str, Any]:
+    def extract(
+        self,
+        pages_data: List[Dict[str, Any]],
+        source_pdf: str,
+        page_items: Optional[List[Optional[List[Dict[str, Any]]]]] = None,
+        on_event: Optional[EventCallback] = None
+    ) -> Dict[str, Any]:
         """
         Extract data from pages.
         
         Args:
             pages_data: List of page dictionaries
             source_pdf: Path to source PDF
+            page_items: Optional raw items per page (aligned with pages_data) from a
+                        previous `parse_page` run; None entries are parsed again
+            on_event: Optional callback receiving progress ExtractionEvents
             
         Returns:
             Dictionary with extraction results
@@ -38,68 +121,107 @@ class ExtractionStrategy(ABC):
     def get_statistics(self, pages_data: List[Dict[str, Any]]) -> Statistics:
         """Calculate and return statistics."""
         pass
+    
+    def parse_page(self, page_data: Dict[str, Any], events: Optional[EventEmitter] = None) -> List[Dict[str, Any]]:
+        """
+        Parse raw (unvalidated) items from a single page.
+        
+        Strategies that work on the whole document only return an empty list.
+        """
+        return []
 
 
 class ConstructionExtractionStrategy(ExtractionStrategy):
     """Strategy for construction PDF takeoff extraction."""
     
-    def __init__(self, construction_parser, llm_parser: Optional[Any] = None):
+    def __init__(
+        self,
+        construction_parser,
+        llm_parser: Optional[Any] = None,
+        llm_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+        llm_chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+        llm_confidence_threshold: float = LLM_CONFIDENCE_THRESHOLD
+    ):
         """
         Initialize construction extraction strategy.
         
         Args:
             construction_parser: ConstructionParser instance
             llm_parser: Optional LLM parser for enhancement
+            llm_concurrency: Maximum number of LLM chunk requests in flight
+            llm_chunk_tokens: Approximate token budget of one document chunk sent to the LLM
+            llm_confidence_threshold: Only pages whose regex confidence is below this go to the LLM (1 = every page)
         """
         self.construction_parser = construction_parser
         self.llm_parser = llm_parser
+        self.llm_concurrency = max(1, llm_concurrency)
+        self.llm_chunk_tokens = llm_chunk_tokens
+        self.llm_confidence_threshold = llm_confidence_threshold
     
-    def extract(self, pages_data: List[Dict[str, Any]], source_pdf: str) -> Dict[str, Any]:
+    def extract(
+        self,
+        pages_data: List[Dict[str, Any]],
+        source_pdf: str,
+        page_items: Optional[List[Optional[List[Dict[str, Any]]]]] = None,
+        on_event: Optional[EventCallback] = None
+    ) -> Dict[str, Any]:
         """Extract construction items from pages."""
+        events = EventEmitter(on_event)
         all_items = []
         all_tables = []
+        started = time.perf_counter()
         
-        # Extract items from text
-        for page_data in pages_data:
-            items = self.construction_parser.extract_items(
-                page_data.get('text', ''),
-                page_data.get('page_num', 0)
-            )
+        confidences = []
+        
+        # Extract items from text and tables (reusing previously parsed pages when given)
+        for idx, page_data in enumerate(pages_data):
+            items = page_items[idx] if page_items is not None else None
+            if items is None:
+                items = self.parse_page(page_data, events)
             all_items.extend(items)
-            
-            # Extract items from tables
-            tables = page_data.get('tables', [])
-            if tables:
-                table_items = self.construction_parser.parse_tables(
-                    tables,
-                    page_data.get('page_num', 0)
-                )
-                all_tables.extend(tables)
-                all_items.extend(table_items)
+            all_tables.extend(page_data.get('tables') or [])
+            # Only needed to route pages to the LLM (PageInfo.confidence stays None without one)
+            if self.llm_parser:
+                confidences.append(self.construction_parser.page_confidence(page_data.get('text', ''), items))
         
-        print(f"\r  ✓ Found {len(all_items)} items        ", flush=True)
-        print("🔄 Step 2/4: Extracting construction items and quantities... ✓", flush=True)
+        parse_seconds = time.perf_counter() - started
+        events.emit(ITEMS_FOUND, count=len(all_items), total_pages=len(pages_data), duration=parse_seconds)
+        events.emit(STEP_FINISHED, message="Extracting construction items and quantities",
+                    duration=parse_seconds, data={'step': 2, 'total_steps': 4})
         
         # Use LLM for hybrid enhancement if available (merges regex + LLM results)
         llm_success = False
         llm_was_requested = self.llm_parser is not None
+        # Only pages the regex pass handled poorly are worth the LLM's tokens and latency
+        llm_pages = [
+            page_data for page_data, confidence in zip(pages_data, confidences)
+            if self.llm_confidence_threshold >= 1 or confidence < self.llm_confidence_threshold
+        ]
         if self.llm_parser:
             regex_count = len(all_items)
-            print(f"🔄 Step 3/4: Attempting LLM enhancement...", end="", flush=True)
+            llm_step = {'step': 3, 'total_steps': 4, 'pages': len(llm_pages), 'total_pages': len(pages_data)}
+            events.emit(LLM_STARTED, count=regex_count, data=dict(llm_step))
+            started = time.perf_counter()
             try:
-                enhanced_items, llm_actually_worked = self._enhance_with_llm(all_items, pages_data)
+                if not llm_pages:
+                    enhanced_items, llm_actually_worked = all_items, False
+                else:
+                    enhanced_items, llm_actually_worked = self._enhance_with_llm(all_items, llm_pages, events)
                 if llm_actually_worked:
                     llm_success = True
                     all_items = enhanced_items
                     llm_added = len(all_items) - regex_count
-                    if llm_added > 0:
-                        print(f"\r🔄 Step 3/4: LLM enhancement successful! ✓ (+{llm_added} additional items)", flush=True)
-                    else:
-                        print(f"\r🔄 Step 3/4: LLM enhancement successful! ✓ (merged with regex)", flush=True)
+                    events.emit(LLM_FINISHED, count=llm_added, duration=time.perf_counter() - started,
+                                data={**llm_step, 'status': 'success'})
+                elif not llm_pages:
+                    # Regex results were confident on every page - nothing to send
+                    events.emit(LLM_FINISHED, count=0, duration=time.perf_counter() - started,
+                                data={**llm_step, 'status': 'skipped'})
                 else:
                     # LLM was called but returned no items or didn't enhance anything
                     llm_success = False
-                    print(f"\r🔄 Step 3/4: LLM returned no items - processing without LLM... ✓", flush=True)
+                    events.emit(LLM_FINISHED, count=0, duration=time.perf_counter() - started,
+                                data={**llm_step, 'status': 'empty'})
             except Exception as e:
                 # Show clear error message if LLM was requested but failed
                 error_msg = str(e)
@@ -115,43 +237,79 @@ class ConstructionExtractionStrategy(ExtractionStrategy):
                     error_msg = error_msg[:50] if len(error_msg) > 50 else error_msg
                 
                 llm_success = False
-                print(f"\r🔄 Step 3/4: LLM enhancement failed ({error_msg}) - processing without LLM... ✓", flush=True)
+                events.emit(LLM_FINISHED, count=0, duration=time.perf_counter() - started, message=error_msg,
+                            data={**llm_step, 'status': 'failed', 'error': str(e)})
         else:
-            print("🔄 Step 3/4: Summarizing extracted data...", end="", flush=True)
+            events.emit(STEP_STARTED, message="Summarizing extracted data", data={'step': 3, 'total_steps': 4})
+        started = time.perf_counter()
         
         # Validate and create models
-        validated_items = self._validate_items(all_items)
-        summary = self._create_summary(validated_items, len(pages_data), len(all_tables))
-        page_infos = self._create_page_infos(pages_data)
-        statistics = self.get_statistics(pages_data)
-        
-        # Create result model
-        result = ConstructionExtractionResult(
-            source_pdf=str(source_pdf),
-            extraction_mode='construction_takeoff',
-            total_items_found=len(validated_items),
-            items=validated_items,
-            summary=summary,
-            pages=page_infos,
-            statistics=statistics,
-        )
+        from extractor.models import ConstructionExtractionResult
+        with timed(events, 'validate', count=len(all_items)):
+            validated_items = self._validate_items(all_items)
+        with timed(events, 'summary'):
+            summary = self._create_summary(validated_items, len(pages_data), len(all_tables))
+            page_infos = self._create_page_infos(pages_data, confidences)
+            statistics = self.get_statistics(pages_data)
+            
+            # Create result model
+            result = ConstructionExtractionResult(
+                source_pdf=str(source_pdf),
+                extraction_mode='construction_takeoff',
+                total_items_found=len(validated_items),
+                items=validated_items,
+                summary=summary,
+                pages=page_infos,
+                statistics=statistics,
+            )
         
         if not self.llm_parser:
-            print(" ✓", flush=True)
+            events.emit(STEP_FINISHED, message="Summarizing extracted data",
+                        duration=time.perf_counter() - started, data={'step': 3, 'total_steps': 4})
         
         # Remove source_pdf from output
-        output = result.model_dump(mode='json')
+        with timed(events, 'model_dump'):
+            output = result.model_dump(mode='json')
         output.pop('source_pdf', None)
         
         # Add LLM usage flag (will be removed before saving to JSON)
         # Only mark as used if it actually succeeded
         output['_llm_used'] = llm_success
         output['_llm_requested'] = llm_was_requested
+        output['_llm_pages'] = len(llm_pages) if llm_was_requested else 0
         
         return output
     
+    def parse_page(self, page_data: Dict[str, Any], events: Optional[EventEmitter] = None) -> List[Dict[str, Any]]:
+        """
+        Run the regex parser over one page's text and tables.
+        
+        Args:
+            page_data: Page dictionary
+            events: Optional emitter receiving 'extract_items' / 'parse_tables' stage timings
+            
+        Returns:
+            List of raw (unvalidated) item dictionaries
+        """
+        events = events or EventEmitter()
+        page_num = page_data.get('page_num', 0)
+        with timed(events, 'extract_items', page_num=page_num):
+            items = self.construction_parser.extract_items(page_data.get('text', ''), page_num)
+        
+        tables = page_data.get('tables', [])
+        if tables:
+            with timed(events, 'parse_tables', page_num=page_num, count=len(tables)):
+                items.extend(self.construction_parser.parse_tables(tables, page_num))
+        
+        return items
+    
+    def extract_page_items(self, page_data: Dict[str, Any]) -> List[ExtractedItem]:
+        """Extract and validate construction items from a single page (regex only)."""
+        return self._validate_items(self.parse_page(page_data))
+    
     def _validate_items(self, items: List[Dict[str, Any]]) -> List[ExtractedItem]:
         """Validate and convert items to ExtractedItem models."""
+        from extractor.models import ExtractedItem
         validated_items = []
         for item in items:
             try:
@@ -180,6 +338,7 @@ class ConstructionExtractionStrategy(ExtractionStrategy):
         tables_found: int
     ) -> ConstructionExtractionSummary:
         """Create extraction summary."""
+        from extractor.models import ConstructionExtractionSummary
         return ConstructionExtractionSummary(
             total_items=len(items),
             items_with_quantities=sum(1 for item in items if item.quantity is not None),
@@ -190,10 +349,15 @@ class ConstructionExtractionStrategy(ExtractionStrategy):
             tables_found=tables_found,
         )
     
-    def _create_page_infos(self, pages_data: List[Dict[str, Any]]) -> List[PageInfo]:
+    def _create_page_infos(
+        self,
+        pages_data: List[Dict[str, Any]],
+        confidences: Optional[List[float]] = None
+    ) -> List[PageInfo]:
         """Create page info models with proper validation."""
+        from extractor.models import PageInfo
         page_infos = []
-        for p in pages_data:
+        for idx, p in enumerate(pages_data):
             try:
                 text_preview = p.get('text', '')
                 if len(text_preview) > 200:
@@ -201,7 +365,9 @@ class ConstructionExtractionStrategy(ExtractionStrategy):
                 page_info = PageInfo(
                     page_num=p.get('page_num', 1),
                     text_preview=text_preview if text_preview else None,
-                    has_tables=bool(p.get('tables'))
+                    has_tables=bool(p.get('tables')),
+                    table_extraction=(p.get('metadata') or {}).get('table_extraction'),
+                    confidence=confidences[idx] if confidences else None
                 )
                 page_infos.append(page_info)
             except Exception:
@@ -216,85 +382,74 @@ class ConstructionExtractionStrategy(ExtractionStrategy):
     def _enhance_with_llm(
         self,
         items: List[Dict[str, Any]],
-        pages_data: List[Dict[str, Any]]
+        pages_data: List[Dict[str, Any]],
+        events: Optional[EventEmitter] = None
     ) -> tuple:
         """
         Hybrid approach: Enhance regex-extracted items with LLM results.
         Merges both sources intelligently rather than replacing.
         
+        Only the given (routed) pages are sent, and LLM items are merged only
+        into the regex items of those pages; items of the other pages are kept
+        unchanged. The pages are split on page boundaries into
+        token-budgeted chunks which are parsed concurrently through the
+        parser's shared transport (at most llm_concurrency requests in
+        flight), so latency stays close to that of the slowest chunk. A failed
+        chunk only loses its own items and is reported as a warning.
+        
         Returns:
             tuple: (merged_items, llm_actually_worked)
                 - merged_items: The merged list of items
                 - llm_actually_worked: True if LLM returned items and enhanced the results
+        
+        Raises:
+            Exception: The error of the first chunk when every chunk failed
         """
-        # Combine text from pages
-        from extractor.utils.helpers import combine_pages_text
-        full_text = combine_pages_text(pages_data)
+        from extractor.utils.helpers import chunk_pages_text
+        
+        events = events or EventEmitter()
         
         # Start with regex items as base
         regex_items = items.copy()
+        chunks = chunk_pages_text(pages_data, self.llm_chunk_tokens)
+        if not chunks:
+            return regex_items, False
+        
+        results = self.llm_parser.parse_many(
+            [chunk['text'] for chunk in chunks], LLM_ITEMS_SCHEMA, concurrency=self.llm_concurrency
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors and len(errors) == len(chunks):
+            raise errors[0]
+        if errors:
+            events.message(f"  ⚠️  LLM failed on {len(errors)} of {len(chunks)} chunk(s): {str(errors[0])[:80]}",
+                           'warning')
+        
+        # Collect in chunk order so the merge is deterministic
         llm_items = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                continue
+            for item in (result or {}).get('items') or []:
+                if isinstance(item, dict):
+                    item['page_number'] = self._chunk_page_number(item.get('page_number'), chunk['pages'])
+                    llm_items.append(item)
         
-        try:
-            # More flexible schema to match actual requirements
-            schema = {
-                "type": "object",
-                "properties": {
-                    "items": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "fixture_type": {
-                                    "type": "string",
-                                    "description": "Item/fixture type (e.g., 'Valve Package', 'Circulating Pump', 'Eye Wash Station')"
-                                },
-                                "quantity": {
-                                    "type": ["integer", "string"],
-                                    "description": "Quantity - can be integer (31) or string reference ('31.1, 31')"
-                                },
-                                "model_number": {
-                                    "type": "string",
-                                    "description": "Model number, spec reference, or catalog number (e.g., 'OM-141', 'HUH-13', 'BOILER CIRCULATING PUMP')"
-                                },
-                                "dimensions": {
-                                    "type": "string",
-                                    "description": "Associated dimensions if any (e.g., '1 1/2\"ø', '2 x 4 x 6')"
-                                },
-                                "mounting_type": {
-                                    "type": "string",
-                                    "description": "Mounting type if stated (e.g., 'wall-mounted', 'floor-mounted')"
-                                },
-                                "spec_reference": {
-                                    "type": "string",
-                                    "description": "Specification reference or page reference if available"
-                                },
-                                "page_number": {
-                                    "type": ["integer", "string"],
-                                    "description": "Page reference if mentioned in text"
-                                }
-                            }
-                        }
-                    }
-                },
-                "required": ["items"]
-            }
-            # Send more text to LLM (increase from 8000 to allow better context)
-            # LLMs can handle more context now
-            text_for_llm = full_text[:16000] if len(full_text) > 16000 else full_text
-            enhanced = self.llm_parser.parse(text_for_llm, schema)
-            
-            if enhanced.get('items') and len(enhanced['items']) > 0:
-                llm_items = enhanced['items']
-            else:
-                # LLM returned empty or no items
-                return regex_items, False
-        except Exception:
-            # Exception occurred - LLM failed
+        if not llm_items:
+            # LLM failed or returned no items
             return regex_items, False
         
-        # Merge regex and LLM results intelligently
-        merged_items = self._merge_regex_and_llm_items(regex_items, llm_items)
+        # Merge regex and LLM results intelligently, only on the pages the LLM saw
+        routed_pages = {page_data.get('page_num') for page_data in pages_data}
+        routed_items = [item for item in regex_items if item.get('page_number') in routed_pages]
+        merged_routed = self._merge_regex_and_llm_items(routed_items, llm_items)
+        enriched = iter(merged_routed[:len(routed_items)])
+        merged_items = [
+            next(enriched) if item.get('page_number') in routed_pages else item
+            for item in regex_items
+        ]
+        # New discoveries from the LLM go last, as before
+        merged_items.extend(merged_routed[len(routed_items):])
         
         # Check if merge actually changed anything
         # Compare before and after - if items are the same, LLM didn't help
@@ -315,6 +470,22 @@ class ConstructionExtractionStrategy(ExtractionStrategy):
         
         return merged_items, True
     
+    @staticmethod
+    def _chunk_page_number(page_number: Any, chunk_pages: List[int]) -> int:
+        """
+        Map an LLM item's page reference back to a real page of its chunk.
+        
+        Args:
+            page_number: Page reference returned by the LLM (int, 'Page 3', None, ...)
+            chunk_pages: Page numbers contained in the chunk
+            
+        Returns:
+            The referenced page if it belongs to the chunk, else the chunk's first page
+        """
+        match = re.search(r'\d+', str(page_number)) if page_number is not None else None
+        page = int(match.group()) if match else None
+        return page if page in chunk_pages else chunk_pages[0]
+    
     def _merge_regex_and_llm_items(
         self,
         regex_items: List[Dict[str, Any]],
@@ -328,127 +499,17 @@ class ConstructionExtractionStrategy(ExtractionStrategy):
         2. For each regex item, try to enrich with matching LLM item
         3. Add LLM items that don't match any regex item (new discoveries)
         4. Prefer more complete data (fill missing fields from LLM)
-        """
-        merged_items = []
-        used_llm_indices = set()
         
-        # Step 1: Enrich regex items with LLM data when they match
-        for regex_item in regex_items:
-            enriched_item = regex_item.copy()
-            
-            # Try to find matching LLM item
-            best_match_idx = self._find_best_match(regex_item, llm_items, used_llm_indices)
-            
-            if best_match_idx is not None:
-                # Merge: keep regex metadata, enrich with LLM data
-                llm_item = llm_items[best_match_idx]
-                enriched_item = self._merge_item_data(enriched_item, llm_item)
-                used_llm_indices.add(best_match_idx)
-            
-            merged_items.append(enriched_item)
-        
-        # Step 2: Add LLM items that weren't matched (new discoveries)
-        for idx, llm_item in enumerate(llm_items):
-            if idx not in used_llm_indices:
-                # This is a new item LLM found that regex missed
-                # Ensure it has required fields
-                if llm_item.get('page_number') or llm_item.get('fixture_type'):
-                    merged_items.append(llm_item)
-        
-        return merged_items
-    
-    def _find_best_match(
-        self,
-        regex_item: Dict[str, Any],
-        llm_items: List[Dict[str, Any]],
-        used_indices: set
-    ) -> Optional[int]:
-        """
-        Find the best matching LLM item for a regex item.
-        Matches based on fixture_type, model_number, page_number, or similar text.
+        Matching goes through indexes on fixture type, model number and page
+        (see extractor.services.merge) rather than scoring every LLM item for
+        every regex item.
         """
-        regex_fixture = (regex_item.get('fixture_type') or '').lower()
-        regex_model = (regex_item.get('model_number') or '').lower()
-        regex_page = regex_item.get('page_number')
-        
-        best_score = 0
-        best_idx = None
-        
-        for idx, llm_item in enumerate(llm_items):
-            if idx in used_indices:
-                continue
-            
-            llm_fixture = (llm_item.get('fixture_type') or '').lower()
-            llm_model = (llm_item.get('model_number') or '').lower()
-            llm_page = llm_item.get('page_number')
-            
-            score = 0
-            
-            # Match on fixture type (strongest indicator)
-            if regex_fixture and llm_fixture:
-                if regex_fixture == llm_fixture:
-                    score += 10
-                elif regex_fixture in llm_fixture or llm_fixture in regex_fixture:
-                    score += 5
-            
-            # Match on model number
-            if regex_model and llm_model:
-                if regex_model == llm_model:
-                    score += 8
-                elif regex_model in llm_model or llm_model in regex_model:
-                    score += 4
-            
-            # Match on page number
-            if regex_page and llm_page and regex_page == llm_page:
-                score += 3
-            
-            # Prefer matches with more information
-            if score > best_score:
-                best_score = score
-                best_idx = idx
-        
-        # Only return match if score is significant enough
-        return best_idx if best_score >= 3 else None
-    
-    def _merge_item_data(
-        self,
-        base_item: Dict[str, Any],
-        enhancement_item: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        Merge enhancement data into base item.
-        Prefers non-empty values, keeps base metadata (page_number, line_number, raw_text).
-        """
-        merged = base_item.copy()
-        
-        # Always preserve regex metadata
-        preserved_fields = ['page_number', 'table_number', 'row_number', 
-                          'line_number', 'raw_text']
-        
-        # Merge fields: use enhancement if base is missing or empty
-        enhancement_fields = ['fixture_type', 'quantity', 'model_number', 
-                             'dimensions', 'mounting_type', 'spec_reference']
-        
-        for field in enhancement_fields:
-            base_value = base_item.get(field)
-            enh_value = enhancement_item.get(field)
-            
-            # Prefer enhancement if base is missing/empty and enhancement has value
-            if not base_value and enh_value:
-                merged[field] = enh_value
-            # If both exist, prefer the more complete one
-            elif base_value and enh_value:
-                # Keep base if it's more detailed, otherwise use enhancement
-                if len(str(base_value)) > len(str(enh_value)):
-                    merged[field] = base_value
-                else:
-                    merged[field] = enh_value
-        
-        return merged
+        return merge_items(regex_items, llm_items)
     
     def get_statistics(self, pages_data: List[Dict[str, Any]]) -> Statistics:
         """Calculate statistics."""
         from extractor.utils.helpers import get_statistics
+        from extractor.models import Statistics
         stats_dict = get_statistics(pages_data)
         return Statistics(**stats_dict)
 
@@ -465,16 +526,26 @@ class StandardExtractionStrategy(ExtractionStrategy):
         """
         self.parser_rules = parser_rules
     
-    def extract(self, pages_data: List[Dict[str, Any]], source_pdf: str) -> Dict[str, Any]:
-        """Extract standard entities from pages."""
+    def extract(
+        self,
+        pages_data: List[Dict[str, Any]],
+        source_pdf: str,
+        page_items: Optional[List[Optional[List[Dict[str, Any]]]]] = None,
+        on_event: Optional[EventCallback] = None
+    ) -> Dict[str, Any]:
+        """Extract standard entities from pages (entities are document-level, page_items is unused)."""
         from extractor.utils.helpers import combine_pages_text, normalize_table_cells
-        from extractor.models import ExtractedEntities, PageData
+        from extractor.models import ExtractedEntities, PageData, StandardExtractionResult
+        events = EventEmitter(on_event)
         full_text = combine_pages_text(pages_data)
         
-        print("🔄 Step 2/4: Processing extracted data...", end="", flush=True)
-        entities_dict = self.parser_rules.extract_entities(full_text)
+        events.emit(STEP_STARTED, message="Processing extracted data", data={'step': 2, 'total_steps': 4})
+        started = time.perf_counter()
+        with timed(events, 'extract_entities'):
+            entities_dict = self.parser_rules.extract_entities(full_text)
         statistics = self.get_statistics(pages_data)
-        print(" ✓", flush=True)
+        events.emit(STEP_FINISHED, message="Processing extracted data",
+                    duration=time.perf_counter() - started, data={'step': 2, 'total_steps': 4})
         
         # Convert entities dict to ExtractedEntities model
         entities = ExtractedEntities.from_dict(entities_dict)
@@ -487,11 +558,13 @@ class StandardExtractionStrategy(ExtractionStrategy):
                 text=page_dict.get('text', ''),
                 width=page_dict.get('width'),
                 height=page_dict.get('height'),
-                tables=normalize_table_cells(page_dict.get('tables'))
+                tables=normalize_table_cells(page_dict.get('tables')),
+                table_extraction=(page_dict.get('metadata') or {}).get('table_extraction')
             )
             validated_pages.append(page_data)
         
-        print("🔄 Step 3/4: Summarizing extracted data...", end="", flush=True)
+        events.emit(STEP_STARTED, message="Summarizing extracted data", data={'step': 3, 'total_steps': 4})
+        started = time.perf_counter()
         # Create result with all validated models
         result = StandardExtractionResult(
             source_pdf=str(source_pdf),
@@ -501,10 +574,12 @@ class StandardExtractionStrategy(ExtractionStrategy):
             statistics=statistics,  # Statistics model
             entities=entities  # ExtractedEntities model
         )
-        print(" ✓", flush=True)
+        events.emit(STEP_FINISHED, message="Summarizing extracted data",
+                    duration=time.perf_counter() - started, data={'step': 3, 'total_steps': 4})
         
         # Serialize to JSON - Pydantic will handle nested model serialization
-        output = result.model_dump(mode='json')
+        with timed(events, 'model_dump'):
+            output = result.model_dump(mode='json')
         # Remove source_pdf from output as requested
         output.pop('source_pdf', None)
         
@@ -514,6 +589,7 @@ class StandardExtractionStrategy(ExtractionStrategy):
     def get_statistics(self, pages_data: List[Dict[str, Any]]) -> Statistics:
         """Calculate statistics."""
         from extractor.utils.helpers import get_statistics
+        from extractor.models import Statistics
         stats_dict = get_statistics(pages_data)
         return Statistics(**stats_dict)
 
@@ -524,7 +600,8 @@ class ExtractionService:
     def __init__(
         self,
         extractor: PDFTextExtractor,
-        strategy: ExtractionStrategy
+        strategy: ExtractionStrategy,
+        on_event: Optional[EventCallback] = None
     ):
         """
         Initialize extraction service.
@@ -532,29 +609,177 @@ class ExtractionService:
         Args:
             extractor: PDFTextExtractor instance
             strategy: ExtractionStrategy to use
+            on_event: Default callback receiving ExtractionEvents for every run
         """
         self.extractor = extractor
         self.strategy = strategy
+        self.on_event = on_event
+    
+    def _subscriber(
+        self,
+        show_progress: bool,
+        on_event: Optional[EventCallback]
+    ) -> Tuple[Optional[EventCallback], Optional[ConsoleProgress]]:
+        """
+        Pick the event callback for a run.
+        
+        An explicit callback (per call, then per service) wins; otherwise
+        show_progress renders events to the console and no callback at all
+        means no progress output.
+        
+        Returns:
+            (callback, console) - console is set when it was created here and must be closed
+        """
+        callback = on_event or self.on_event
+        if callback is None and show_progress:
+            console = ConsoleProgress()
+            return console, console
+        return callback, None
     
-    def extract(self, pdf_path: str | Path, show_progress: bool = True) -> Dict[str, Any]:
+    def extract(
+        self,
+        pdf_path: str | Path,
+        show_progress: bool = True,
+        on_event: Optional[EventCallback] = None
+    ) -> Dict[str, Any]:
         """
         Extract data from PDF.
         
         Args:
             pdf_path: Path to PDF file
-            show_progress: Whether to show progress indicators
+            show_progress: Whether to show progress indicators (ignored when a callback is set)
+            on_event: Optional callback receiving ExtractionEvents for this run
             
         Returns:
             Dictionary with extraction results
         """
-        # Extract pages using PDF extractor
-        pages_data = self.extractor.extract_text(pdf_path, show_progress=show_progress)
-        
-        # Use strategy to process pages
-        result = self.strategy.extract(pages_data, pdf_path)
+        callback, console = self._subscriber(show_progress, on_event)
+        try:
+            # Extract pages using PDF extractor
+            pages_data = self.extractor.extract_text(pdf_path, show_progress=False, on_event=callback)
+            
+            # Use strategy to process pages
+            result = self.strategy.extract(pages_data, pdf_path, on_event=callback)
+        finally:
+            if console:
+                console.close()
         
         return result
     
+    def extract_incremental(
+        self,
+        pdf_path: str | Path,
+        manifest_path: str | Path,
+        show_progress: bool = True,
+        on_event: Optional[EventCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract data from a revised PDF, redoing only pages that changed.
+        
+        Every page is fingerprinted (content streams, images, page box and
+        extractor settings) and looked up in the manifest of a previous run.
+        Only new or changed pages are extracted and parsed again; unchanged
+        pages reuse the stored page data and parsed items, renumbered when
+        sheets were inserted or removed before them. Document-level steps
+        (LLM enhancement, summary, statistics) still run on the full result.
+        The manifest is created on the first run and updated on every run.
+        
+        Args:
+            pdf_path: Path to PDF file
+            manifest_path: Path to the page manifest JSON file
+            show_progress: Whether to show progress indicators (ignored when a callback is set)
+            on_event: Optional callback receiving ExtractionEvents for this run
+            
+        Returns:
+            Dictionary with extraction results (same format as `extract()`)
+        """
+        callback, console = self._subscriber(show_progress, on_event)
+        events = EventEmitter(callback)
+        try:
+            fingerprints = self.extractor.page_fingerprints(pdf_path)
+            manifest = PageManifest.load(manifest_path, type(self.strategy).__name__)
+            changed = manifest.changed_pages(fingerprints)
+            
+            reused = len(fingerprints) - len(changed)
+            events.message(f"  ♻️  {reused} unchanged page(s) reused, {len(changed)} page(s) to extract")
+            
+            # Degraded pages (OCR or table budget fell back) are used for this run only: their
+            # fingerprint does not change, so storing them would reuse the fallback forever
+            degraded = {}
+            if changed:
+                for page_data in self.extractor.iter_pages(pdf_path, show_progress=False, pages=changed, on_event=callback):
+                    page_num = page_data['page_num']
+                    items = self.strategy.parse_page(page_data, events)
+                    if self.extractor.is_degraded(page_data):
+                        degraded[page_num] = (page_data, items)
+                    else:
+                        manifest.update(page_num, fingerprints[page_num - 1], page_data, items)
+            if changed or manifest.renumbered:
+                # Saved before the strategy runs: LLM merging may modify item dicts in place
+                manifest.save(manifest_path)
+            
+            page_numbers = range(1, len(fingerprints) + 1)
+            pages_data = [degraded[page_num][0] if page_num in degraded else manifest.page_data(page_num)
+                          for page_num in page_numbers]
+            page_items = [list(degraded[page_num][1] if page_num in degraded else manifest.page_items(page_num))
+                          for page_num in page_numbers]
+            
+            return self.strategy.extract(pages_data, pdf_path, page_items=page_items, on_event=callback)
+        finally:
+            if console:
+                console.close()
+    
+    def extract_stream(
+        self,
+        pdf_path: str | Path,
+        show_progress: bool = False,
+        on_event: Optional[EventCallback] = None
+    ) -> Iterator[Tuple[int, List[ExtractedItem]]]:
+        """
+        Stream extraction results page by page.
+        
+        Pages are pulled from the extractor one at a time and parsed as soon as
+        they are available, so the first batch arrives after the first page and
+        memory does not grow with document size. Only the per-page regex/table
+        pass runs here; whole-document steps (LLM enhancement, summary) require
+        `extract()`. Strategies that work on the whole document only (standard
+        mode) cannot stream.
+        
+        Args:
+            pdf_path: Path to PDF file
+            show_progress: Whether to show progress indicators (ignored when a callback is set)
+            on_event: Optional callback receiving ExtractionEvents for this run
+            
+        Yields:
+            (page_num, items) tuples, in page order
+            
+        Raises:
+            ValueError: If the strategy has no per-page extraction (raised before
+                        the PDF is opened)
+        """
+        extract_page_items = getattr(self.strategy, 'extract_page_items', None)
+        if extract_page_items is None:
+            raise ValueError(
+                f"{type(self.strategy).__name__} extracts whole documents only and cannot stream; use extract()"
+            )
+        return self._stream_pages(pdf_path, extract_page_items, show_progress, on_event)
+    
+    def _stream_pages(
+        self,
+        pdf_path: str | Path,
+        extract_page_items: Callable[[Dict[str, Any]], List[ExtractedItem]],
+        show_progress: bool,
+        on_event: Optional[EventCallback]
+    ) -> Iterator[Tuple[int, List[ExtractedItem]]]:
+        """Generator behind `extract_stream` (separate so the strategy check runs on call)."""
+        callback, console = self._subscriber(show_progress, on_event)
+        try:
+            for page_data in self.extractor.iter_pages(pdf_path, show_progress=False, on_event=callback):
+                yield page_data['page_num'], extract_page_items(page_data)
+        finally:
+            if console:
+                console.close()
+    
     def get_summary(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Get summary information from extraction result."""
         if result.get('extraction_mode') == 'construction_takeoff':
@@ -572,67 +797,117 @@ class ExtractionServiceFactory:
     @staticmethod
     def create_construction_service(
         use_ocr: bool = False,  # Optional - requires system dependencies (poppler). Use LLM with vision instead for platform independence
-        llm_type: Optional[str] = None
+        llm_type: Optional[str] = None,
+        workers: int = 1,
+        cache_dir: Optional[str] = None,
+        table_budget: Optional[float] = TABLE_BUDGET_SECONDS,
+        ocr_regions: bool = False,
+        llm_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+        llm_requests_per_minute: Optional[float] = None,
+        llm_tokens_per_minute: Optional[float] = None,
+        llm_cache_ttl: Optional[float] = LLM_CACHE_TTL_SECONDS,
+        llm_confidence_threshold: float = LLM_CONFIDENCE_THRESHOLD
     ) -> ExtractionService:
         """
         Create extraction service for construction PDFs.
         
         Args:
             use_ocr: Whether to use OCR
-            llm_type: LLM type ('openai' or 'claude') for enhancement
+            llm_type: LLM type ('openai', 'claude' or the offline stand-in 'local') for enhancement
+            workers: Number of page extraction worker processes (0 = one per CPU core)
+            cache_dir: Directory for the extracted-page and LLM response cache (None disables caching)
+            table_budget: Per-page table extraction time limit in seconds (None or 0 = no limit)
+            ocr_regions: OCR only the text blocks of scanned pages instead of whole sheets
+            llm_concurrency: Maximum number of LLM chunk requests in flight
+            llm_requests_per_minute: Provider request quota shared by all LLM calls (None = provider default)
+            llm_tokens_per_minute: Provider token quota shared by all LLM calls (None = provider default)
+            llm_cache_ttl: Maximum age of a cached LLM response in seconds (None = never expires)
+            llm_confidence_threshold: Only pages whose regex confidence is below this go to the LLM (1 = every page)
             
         Returns:
             ExtractionService configured for construction extraction
         """
-        extractor = PDFTextExtractor(use_ocr=use_ocr)
+        from extractor.extractors import PDFTextExtractor
+        extractor = PDFTextExtractor(
+            use_ocr=use_ocr, workers=workers, cache_dir=cache_dir, table_budget=table_budget,
+            ocr_regions=ocr_regions
+        )
         construction_parser = ConstructionParser()
         
         llm_parser = None
         if llm_type:
-            llm_parser = ExtractionServiceFactory._create_llm_parser(llm_type)
+            llm_parser = ExtractionServiceFactory._create_llm_parser(
+                llm_type, llm_requests_per_minute, llm_tokens_per_minute
+            )
+            if llm_parser is not None and cache_dir:
+                # Unchanged pages/chunks are answered from disk instead of the API
+                from extractor.parsers.llm import CachedLLMParser
+                llm_parser = CachedLLMParser(llm_parser, DiskCache(cache_dir), ttl=llm_cache_ttl)
         
         strategy = ConstructionExtractionStrategy(
             construction_parser=construction_parser,
-            llm_parser=llm_parser
+            llm_parser=llm_parser,
+            llm_concurrency=llm_concurrency,
+            llm_confidence_threshold=llm_confidence_threshold
         )
         
         return ExtractionService(extractor=extractor, strategy=strategy)
     
     @staticmethod
-    def create_standard_service(use_ocr: bool = False) -> ExtractionService:
+    def create_standard_service(
+        use_ocr: bool = False,
+        workers: int = 1,
+        cache_dir: Optional[str] = None,
+        table_budget: Optional[float] = TABLE_BUDGET_SECONDS,
+        ocr_regions: bool = False
+    ) -> ExtractionService:
         """
         Create extraction service for standard text extraction.
         
         Args:
             use_ocr: Whether to use OCR
+            workers: Number of page extraction worker processes (0 = one per CPU core)
+            cache_dir: Directory for the extracted-page cache (None disables caching)
+            table_budget: Per-page table extraction time limit in seconds (None or 0 = no limit)
+            ocr_regions: OCR only the text blocks of scanned pages instead of whole sheets
             
         Returns:
             ExtractionService configured for standard extraction
         """
-        extractor = PDFTextExtractor(use_ocr=use_ocr)
+        from extractor.extractors import PDFTextExtractor
+        extractor = PDFTextExtractor(
+            use_ocr=use_ocr, workers=workers, cache_dir=cache_dir, table_budget=table_budget,
+            ocr_regions=ocr_regions
+        )
         parser_rules = ParserRules()
         strategy = StandardExtractionStrategy(parser_rules=parser_rules)
         
         return ExtractionService(extractor=extractor, strategy=strategy)
     
     @staticmethod
-    def _create_llm_parser(llm_type: str):
-        """Create LLM parser instance."""
+    def _create_llm_parser(
+        llm_type: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ):
+        """Create LLM parser instance (on the provider's shared, rate-limited transport)."""
         import os
+        from extractor.parsers.llm_transport import get_transport
         
         if llm_type == 'openai':
             from extractor.parsers.llm import OpenAIParser
             api_key = os.getenv('OPENAI_API_KEY')
             if not api_key:
                 return None
+            transport = get_transport('openai', requests_per_minute, tokens_per_minute)
             try:
                 # Try gpt-4o-mini first (cheaper, widely available)
                 # Fallback to gpt-3.5-turbo if needed
                 try:
-                    return OpenAIParser(api_key=api_key, model="gpt-4o-mini")
+                    return OpenAIParser(api_key=api_key, model="gpt-4o-mini", transport=transport)
                 except Exception:
                     # Fallback to gpt-3.5-turbo if gpt-4o-mini fails
-                    return OpenAIParser(api_key=api_key, model="gpt-3.5-turbo")
+                    return OpenAIParser(api_key=api_key, model="gpt-3.5-turbo", transport=transport)
             except Exception:
                 # Silently fail if initialization fails
                 return None
@@ -642,12 +917,17 @@ class ExtractionServiceFactory:
             api_key = os.getenv('ANTHROPIC_API_KEY')
             if not api_key:
                 return None
+            transport = get_transport('anthropic', requests_per_minute, tokens_per_minute)
             try:
-                return ClaudeParser(api_key=api_key)
+                return ClaudeParser(api_key=api_key, transport=transport)
             except Exception:
                 # Silently fail if initialization fails
                 return None
         
+        elif llm_type == 'local':
+            from extractor.parsers.llm import LocalParser
+            return LocalParser(transport=get_transport('local', requests_per_minute, tokens_per_minute))
+        
         return None
 
 
@@ -0,0 +1,133 @@
+"""
+Page manifest for incremental re-extraction of revised PDFs.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from extractor.utils.helpers import save_json, load_json
+
+
+# Bump when the stored page/item format changes, to invalidate old manifests
+MANIFEST_VERSION = 1
+
+
+class PageManifest:
+    """
+    Per-page record of a previous extraction run.
+
+    For every page the manifest keeps the page fingerprint (see
+    `PDFTextExtractor.page_fingerprints`), the extracted page dictionary and
+    the raw items the strategy parsed from it. A later run on a revised PDF
+    only re-extracts pages whose fingerprint is not in the manifest and reuses
+    the rest, wherever they moved to.
+    """
+
+    def __init__(self, strategy_name: str, pages: Optional[Dict[int, Dict[str, Any]]] = None):
+        """
+        Initialize a manifest.
+
+        Args:
+            strategy_name: Name of the strategy that produced the items
+            pages: Mapping of page number to {'hash', 'page', 'items'} records
+        """
+        self.strategy_name = strategy_name
+        self.pages = pages or {}
+        self.renumbered = False
+
+    @classmethod
+    def load(cls, manifest_path: str | Path, strategy_name: str) -> 'PageManifest':
+        """
+        Load a manifest, returning an empty one if it is missing, unreadable or stale.
+
+        Args:
+            manifest_path: Path to the manifest JSON file
+            strategy_name: Strategy the caller will run (items from another strategy are not reused)
+
+        Returns:
+            PageManifest instance
+        """
+        manifest_path = Path(manifest_path)
+        if not manifest_path.exists():
+            return cls(strategy_name)
+        try:
+            data = load_json(manifest_path)
+        except (OSError, ValueError):
+            return cls(strategy_name)
+        if data.get('version') != MANIFEST_VERSION or data.get('strategy') != strategy_name:
+            return cls(strategy_name)
+        pages = {int(page_num): record for page_num, record in data.get('pages', {}).items()}
+        return cls(strategy_name, pages)
+
+    def save(self, manifest_path: str | Path) -> None:
+        """Write the manifest to disk."""
+        save_json({
+            'version': MANIFEST_VERSION,
+            'strategy': self.strategy_name,
+            'pages': {str(page_num): record for page_num, record in sorted(self.pages.items())},
+        }, manifest_path)
+
+    def changed_pages(self, fingerprints: List[str]) -> List[int]:
+        """
+        Match stored pages to the current ones by fingerprint.
+
+        Stored records are looked up by fingerprint rather than by position, so
+        a sheet inserted into or removed from a revised set only costs that
+        sheet: every other page is found under its fingerprint and moved to
+        its new position (its page data and items renumbered). Records of
+        pages that are gone are dropped; `renumbered` tells whether any record
+        moved, i.e. whether the manifest needs saving even with nothing new.
+
+        Args:
+            fingerprints: Current fingerprints, in page order
+
+        Returns:
+            1-indexed numbers of pages that are new or changed
+        """
+        by_hash = {}
+        for _, record in sorted(self.pages.items()):
+            by_hash.setdefault(record.get('hash'), record)
+
+        pages = {}
+        changed = []
+        self.renumbered = len(self.pages) != len(fingerprints)
+        for page_num, fingerprint in enumerate(fingerprints, start=1):
+            record = self.pages.get(page_num)
+            if record is None or record.get('hash') != fingerprint:
+                record = by_hash.get(fingerprint)
+                if record is None:
+                    changed.append(page_num)
+                    continue
+                record = self._renumber(record, page_num)
+                self.renumbered = True
+            pages[page_num] = record
+        self.pages = pages
+        return changed
+
+    @staticmethod
+    def _renumber(record: Dict[str, Any], page_num: int) -> Dict[str, Any]:
+        """
+        Copy of a stored record moved to another page number.
+
+        Only items numbered with the page they were found on move with it; a
+        page_number taken from a reference in the text (e.g. "see page 12")
+        is kept.
+        """
+        old_page_num = record['page'].get('page_num')
+        page = dict(record['page'], page_num=page_num)
+        items = [
+            dict(item, page_number=page_num) if item.get('page_number') == old_page_num else item
+            for item in record['items']
+        ]
+        return {'hash': record['hash'], 'page': page, 'items': items}
+
+    def page_data(self, page_num: int) -> Dict[str, Any]:
+        """Return the stored page dictionary."""
+        return self.pages[page_num]['page']
+
+    def page_items(self, page_num: int) -> List[Dict[str, Any]]:
+        """Return the stored raw items of a page."""
+        return self.pages[page_num]['items']
+
+    def update(self, page_num: int, fingerprint: str, page_data: Dict[str, Any], items: List[Dict[str, Any]]) -> None:
+        """Record the result of (re-)extracting a page."""
+        self.pages[page_num] = {'hash': fingerprint, 'page': page_data, 'items': items}
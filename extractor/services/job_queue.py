@@ -0,0 +1,361 @@
+"""
+Durable SQLite job queue shared by `pdfx batch` and `pdfx serve`.
+
+Every document is a row with its state (pending, running, done, failed),
+attempt count and lease; a running document counts its finished pages as
+progress. A coordinator claims documents under a lease it renews while they run, so a
+queue left behind by a reboot, an OOM kill or Ctrl+C is picked up by the next
+run: finished documents are skipped, documents whose lease expired (or whose
+owner process is gone) are claimed again, up to MAX_ATTEMPTS times.
+Resume is per document: a document claimed again is extracted from its
+first page (with `--cache`, pages finished before the interruption come
+from the page cache).
+"""
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Seconds a claim stays valid without renewal (renewed every LEASE_SECONDS / 3 while running)
+LEASE_SECONDS = 120.0
+
+# Claims of one document before it is given up on (crashed workers, expired leases)
+MAX_ATTEMPTS = 3
+
+# Seconds to wait for another process's write transaction
+BUSY_TIMEOUT_SECONDS = 30.0
+
+# Document states
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    run TEXT,
+    input TEXT NOT NULL,
+    output TEXT,
+    size INTEGER NOT NULL DEFAULT 0,
+    mtime REAL NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    pages INTEGER NOT NULL DEFAULT 0,
+    pages_total INTEGER,
+    items INTEGER,
+    seconds REAL,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_state ON documents (state, size);
+CREATE INDEX IF NOT EXISTS documents_run ON documents (run, state, size);
+"""
+
+
+def default_owner() -> str:
+    """Lease owner name of this process ('host:pid')."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_gone(owner: Optional[str]) -> bool:
+    """Whether a lease owner is a process on this host that no longer exists."""
+    host, _, pid = (owner or '').rpartition(':')
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        # Exists but belongs to someone else
+        return False
+    return False
+
+
+def _file_stat(path: str) -> Tuple[int, float]:
+    try:
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime
+    except OSError:
+        return 0, 0.0
+
+
+class JobQueue:
+    """
+    Documents, their states, leases and page progress in one SQLite file.
+
+    Safe to share between threads; every process opens its own JobQueue on
+    the same path (WAL mode lets workers record pages while the coordinator
+    claims and finishes documents).
+    """
+
+    def __init__(self, path: str | Path, lease_seconds: float = LEASE_SECONDS, max_attempts: int = MAX_ATTEMPTS):
+        """
+        Open (or create) a queue.
+
+        Args:
+            path: SQLite database file
+            lease_seconds: Seconds a claim stays valid without renewal
+            max_attempts: Claims of one document before it is marked failed
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), timeout=BUSY_TIMEOUT_SECONDS,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction (BEGIN IMMEDIATE: the write lock is taken up front, so claims never race)."""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(self, documents: List[Tuple[str, str, Optional[str]]], run: Optional[str] = None) -> List[int]:
+        """
+        Add documents, keeping the state of ones already queued.
+
+        A finished document is queued again when its file changed (size or
+        modification time) or its output file is gone.
+
+        Args:
+            documents: (key, input path, output path or None) per document
+            run: Run tag stored on every given document (claim and counts can
+                 filter on it; the latest run to enqueue a document owns it)
+
+        Returns:
+            Document ids, in input order
+        """
+        now = time.time()
+        ids = []
+        with self._transaction() as conn:
+            for key, input_path, output_path in documents:
+                size, mtime = _file_stat(input_path)
+                row = conn.execute('SELECT id, state, size, mtime, output FROM documents WHERE key = ?',
+                                   (key,)).fetchone()
+                if row is None:
+                    cursor = conn.execute(
+                        'INSERT INTO documents (key, run, input, output, size, mtime, created, updated) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                        (key, run, input_path, output_path, size, mtime, now, now)
+                    )
+                    ids.append(cursor.lastrowid)
+                    continue
+                changed = (row['size'], row['mtime']) != (size, mtime)
+                output_gone = row['output'] is not None and not os.path.exists(row['output'])
+                if row['state'] == DONE and (changed or output_gone):
+                    self._reset(conn, row['id'], now)
+                conn.execute('UPDATE documents SET run = ?, size = ?, mtime = ? WHERE id = ?',
+                             (run, size, mtime, row['id']))
+                ids.append(row['id'])
+        return ids
+
+    @staticmethod
+    def _reset(conn: sqlite3.Connection, document_id: int, now: float) -> None:
+        conn.execute(
+            "UPDATE documents SET state = 'pending', attempts = 0, lease_owner = NULL, lease_expires = NULL, "
+            "pages = 0, pages_total = NULL, items = NULL, seconds = NULL, error = NULL, updated = ? WHERE id = ?",
+            (now, document_id)
+        )
+
+    @staticmethod
+    def _filter(run: Optional[str] = None, document_id: Optional[int] = None) -> Tuple[str, Tuple[Any, ...]]:
+        """SQL condition (appended with AND) and parameters selecting a run and/or one document."""
+        conditions, params = '', ()
+        if run is not None:
+            conditions, params = conditions + ' AND run = ?', params + (run,)
+        if document_id is not None:
+            conditions, params = conditions + ' AND id = ?', params + (document_id,)
+        return conditions, params
+
+    def claim(self, owner: str, limit: Optional[int] = 1, run: Optional[str] = None,
+              document_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Lease runnable documents to `owner`, largest first.
+
+        Runnable: pending, or running under a lease that expired or whose
+        owner process is gone. Documents out of attempts are marked failed
+        instead of being claimed.
+
+        Args:
+            owner: Lease owner (see default_owner)
+            limit: Maximum number of documents (None = all runnable)
+            run: Only consider documents enqueued under this run tag
+            document_id: Only consider this document
+
+        Returns:
+            Claimed documents (attempts already incremented)
+        """
+        now = time.time()
+        claimed = []
+        only, params = self._filter(run, document_id)
+        with self._transaction() as conn:
+            # Abandoned claims first (they were started earlier), then pending documents
+            rows = [
+                row for row in conn.execute(f"SELECT * FROM documents WHERE state = 'running'{only}", params)
+                if row['lease_expires'] <= now or _owner_gone(row['lease_owner'])
+            ]
+            query = f"SELECT * FROM documents WHERE state = 'pending'{only} ORDER BY size DESC, id"
+            if limit is not None:
+                query += f" LIMIT {int(limit)}"
+            rows += conn.execute(query, params).fetchall()
+            for row in rows:
+                if limit is not None and len(claimed) >= limit:
+                    break
+                if row['attempts'] >= self.max_attempts:
+                    conn.execute(
+                        "UPDATE documents SET state = 'failed', lease_owner = NULL, lease_expires = NULL, "
+                        "error = COALESCE(error, ?), updated = ? WHERE id = ?",
+                        (f"gave up after {row['attempts']} attempt(s) (worker crashed or lease expired)",
+                         now, row['id'])
+                    )
+                    continue
+                # The page count restarts: the document is extracted from its first page again
+                conn.execute(
+                    "UPDATE documents SET state = 'running', attempts = attempts + 1, lease_owner = ?, "
+                    "lease_expires = ?, pages = 0, pages_total = NULL, updated = ? WHERE id = ?",
+                    (owner, now + self.lease_seconds, now, row['id'])
+                )
+                claimed.append(dict(row, state=RUNNING, attempts=row['attempts'] + 1, lease_owner=owner))
+        return claimed
+
+    def renew(self, owner: str) -> int:
+        """Extend every lease held by `owner`; returns the number renewed."""
+        now = time.time()
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE documents SET lease_expires = ? WHERE state = 'running' AND lease_owner = ?",
+                (now + self.lease_seconds, owner)
+            ).rowcount
+
+    @contextmanager
+    def heartbeat(self, owner: str) -> Iterator[None]:
+        """Renew `owner`'s leases on a background thread for the duration of the block."""
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(self.lease_seconds / 3):
+                self.renew(owner)
+
+        thread = threading.Thread(target=beat, name='pdfx-lease', daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def page_done(self, document_id: int, total_pages: Optional[int] = None) -> None:
+        """Count a finished page of a running document (progress only)."""
+        with self._transaction() as conn:
+            conn.execute(
+                'UPDATE documents SET pages = pages + 1, pages_total = COALESCE(?, pages_total), updated = ? '
+                'WHERE id = ?',
+                (total_pages, time.time(), document_id)
+            )
+
+    def finish(self, document_id: int, pages: Optional[int] = None, items: Optional[int] = None,
+               seconds: Optional[float] = None, error: Optional[str] = None) -> None:
+        """
+        Record a document's outcome and release its lease.
+
+        Args:
+            document_id: Document id
+            pages: Pages extracted
+            items: Items found (construction mode)
+            seconds: Extraction wall time
+            error: Error message (marks the document failed; extraction errors are not retried)
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                'UPDATE documents SET state = ?, lease_owner = NULL, lease_expires = NULL, '
+                'pages = COALESCE(?, pages), items = ?, seconds = ?, error = ?, updated = ? WHERE id = ?',
+                (FAILED if error else DONE, pages, items, seconds, error, time.time(), document_id)
+            )
+
+    def release(self, document_id: int, error: Optional[str] = None) -> None:
+        """
+        Put a claimed document back in the queue (worker crash, shutdown).
+
+        The attempt still counts, so a document that keeps killing its worker
+        ends up failed after MAX_ATTEMPTS claims.
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE documents SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "lease_owner = NULL, lease_expires = NULL, error = ?, updated = ? WHERE id = ? AND state = 'running'",
+                (self.max_attempts, error, time.time(), document_id)
+            )
+
+    def release_owner(self, owner: str) -> None:
+        """Return every document leased by `owner` to the queue without charging the attempt (clean shutdown)."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE documents SET state = 'pending', attempts = MAX(attempts - 1, 0), lease_owner = NULL, "
+                "lease_expires = NULL, updated = ? WHERE state = 'running' AND lease_owner = ?",
+                (time.time(), owner)
+            )
+
+    def reset(self, states: Tuple[str, ...] = (DONE, FAILED, RUNNING)) -> int:
+        """Queue documents in the given states again from scratch; returns the number reset."""
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT id FROM documents WHERE state IN ({', '.join('?' * len(states))})", states
+            ).fetchall()
+            for row in rows:
+                self._reset(conn, row['id'], now)
+        return len(rows)
+
+    def get(self, document_id: Optional[int] = None, key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """One document by id or key."""
+        with self._lock:
+            if document_id is not None:
+                row = self._conn.execute('SELECT * FROM documents WHERE id = ?', (document_id,)).fetchone()
+            else:
+                row = self._conn.execute('SELECT * FROM documents WHERE key = ?', (key,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def documents(self, state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """All documents (optionally only one state), in insertion order."""
+        with self._lock:
+            if state is None:
+                rows = self._conn.execute('SELECT * FROM documents ORDER BY id').fetchall()
+            else:
+                rows = self._conn.execute('SELECT * FROM documents WHERE state = ? ORDER BY id', (state,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def counts(self, run: Optional[str] = None) -> Dict[str, int]:
+        """Number of documents per state (optionally only those enqueued under `run`)."""
+        only, params = self._filter(run)
+        with self._lock:
+            rows = self._conn.execute(f'SELECT state, COUNT(*) FROM documents WHERE 1{only} GROUP BY state',
+                                      params).fetchall()
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        counts.update({state: count for state, count in rows})
+        return counts
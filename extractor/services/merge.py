@@ -0,0 +1,320 @@
+"""
+Indexed merge of regex and LLM extracted items.
+
+Each regex item is matched to at most one LLM item by the scores below;
+the highest score wins, ties go to the LLM item listed first, and a match
+needs at least MATCH_THRESHOLD. Instead of scoring every LLM item for every
+regex item, LLM items are hashed by their normalized fixture type, model
+number and page (n-gram indexes find the substring cases) and each regex
+item looks up only the groups that can reach a given score, best score
+first - a handful of dictionary lookups per item instead of a scan.
+"""
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+# Match scores (fixture type is the strongest indicator)
+FIXTURE_EXACT_SCORE = 10
+FIXTURE_SUBSTRING_SCORE = 5
+MODEL_EXACT_SCORE = 8
+MODEL_SUBSTRING_SCORE = 4
+PAGE_SCORE = 3
+
+# Minimum score of an accepted match
+MATCH_THRESHOLD = 3
+
+# Longest n-gram indexed for substring lookups (shorter strings are indexed whole)
+NGRAM_SIZE = 3
+
+# Fields copied from the LLM item when the regex item lacks them (or has a shorter value)
+ENHANCEMENT_FIELDS = ['fixture_type', 'quantity', 'model_number',
+                      'dimensions', 'mounting_type', 'spec_reference']
+
+# (fixture type, model number, page) after normalization
+MatchKey = Tuple[str, str, Any]
+
+
+def _text(value: Any) -> str:
+    return str(value).lower() if value else ''
+
+
+def _page(value: Any) -> Any:
+    # Falsy pages never match; unhashable ones cannot be indexed
+    return value if value and isinstance(value, Hashable) else None
+
+
+def match_key(item: Dict[str, Any]) -> MatchKey:
+    """Normalized fields an item is matched on."""
+    return _text(item.get('fixture_type')), _text(item.get('model_number')), _page(item.get('page_number'))
+
+
+def match_score(regex_key: MatchKey, llm_key: MatchKey) -> int:
+    """
+    Score of matching a regex item with an LLM item.
+
+    Fixture type: exact 10, one contained in the other 5; model number: exact
+    8, contained 4; same page 3. Empty fields never score.
+    """
+    regex_fixture, regex_model, regex_page = regex_key
+    llm_fixture, llm_model, llm_page = llm_key
+    score = 0
+    if regex_fixture and llm_fixture:
+        if regex_fixture == llm_fixture:
+            score += FIXTURE_EXACT_SCORE
+        elif regex_fixture in llm_fixture or llm_fixture in regex_fixture:
+            score += FIXTURE_SUBSTRING_SCORE
+    if regex_model and llm_model:
+        if regex_model == llm_model:
+            score += MODEL_EXACT_SCORE
+        elif regex_model in llm_model or llm_model in regex_model:
+            score += MODEL_SUBSTRING_SCORE
+    if regex_page is not None and regex_page == llm_page:
+        score += PAGE_SCORE
+    return score
+
+
+class ContainmentIndex:
+    """
+    Finds the indexed strings that contain a query or are contained in it.
+
+    Every string is indexed under all its n-grams (n = 1..NGRAM_SIZE) to find
+    the strings containing a query; the strings inside a query are its slices
+    of an indexed length.
+    """
+
+    def __init__(self, strings: Iterable[str]):
+        self._strings = set(strings)
+        self._lengths = sorted({len(string) for string in self._strings})
+        self._grams: Dict[str, Set[str]] = defaultdict(set)
+        for string in self._strings:
+            for size in range(1, NGRAM_SIZE + 1):
+                for start in range(len(string) - size + 1):
+                    self._grams[string[start:start + size]].add(string)
+
+    def matches(self, query: str) -> Set[str]:
+        """Indexed strings s with `query in s` or `s in query` (including query itself)."""
+        return self._containing(query) | self._contained(query)
+
+    def _containing(self, query: str) -> Set[str]:
+        # Every n-gram of the query occurs in a string containing it: intersect, smallest first
+        size = min(NGRAM_SIZE, len(query))
+        postings = sorted((self._grams.get(query[start:start + size], set())
+                           for start in range(len(query) - size + 1)), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return {string for string in candidates if query in string}
+
+    def _contained(self, query: str) -> Set[str]:
+        found = set()
+        for length in self._lengths:
+            if length > len(query):
+                break
+            for start in range(len(query) - length + 1):
+                if query[start:start + length] in self._strings:
+                    found.add(query[start:start + length])
+        return found
+
+
+class _Group:
+    """LLM item indices sharing some match fields, lowest unused first."""
+
+    __slots__ = ('indices', 'next')
+
+    def __init__(self):
+        self.indices: List[int] = []
+        self.next = 0
+
+    def first_unused(self, used: Set[int]) -> Optional[int]:
+        while self.next < len(self.indices) and self.indices[self.next] in used:
+            self.next += 1
+        return self.indices[self.next] if self.next < len(self.indices) else None
+
+
+def _score_levels() -> List[Tuple[int, List[Tuple[int, int, int]]]]:
+    """
+    Every (fixture, model, page) score combination that reaches MATCH_THRESHOLD,
+    grouped by total score, highest first.
+    """
+    by_score = defaultdict(list)
+    for fixture in (FIXTURE_EXACT_SCORE, FIXTURE_SUBSTRING_SCORE, 0):
+        for model in (MODEL_EXACT_SCORE, MODEL_SUBSTRING_SCORE, 0):
+            for page in (PAGE_SCORE, 0):
+                if fixture + model + page >= MATCH_THRESHOLD:
+                    by_score[fixture + model + page].append((fixture, model, page))
+    return sorted(by_score.items(), reverse=True)
+
+
+# Score levels searched by ItemMatcher.match
+SCORE_LEVELS = _score_levels()
+
+
+class ItemMatcher:
+    """
+    Matches regex items to LLM items; every LLM item is matched at most once.
+
+    LLM item indices are grouped by every subset of their (fixture type,
+    model number, page) fields. A match searches the score levels from the
+    highest down: a level is a set of (fixture, model, page) score
+    combinations, and each combination names the groups whose items can
+    score it - the exact or contained fixture types and model numbers, the
+    regex item's page, or any value for a field that scores 0 there. A
+    group may also hold items that would score more, but those were all
+    used when the higher levels came up empty, so the first unused index of
+    each group is an item scoring exactly that level. The first level with
+    any unused item wins, with the lowest index among its groups - the same
+    result as scoring every LLM item, ties going to the one listed first.
+    """
+
+    def __init__(self, llm_items: List[Dict[str, Any]]):
+        """
+        Index the LLM items.
+
+        Args:
+            llm_items: Items returned by the LLM
+        """
+        self.used: Set[int] = set()
+        # (fixture or None, model or None, page or None) -> group; None = any value
+        self._groups: Dict[Tuple[Optional[str], Optional[str], Any], _Group] = defaultdict(_Group)
+        # (fixture or None, page or None) -> model numbers listed with them, and the
+        # reverse, to skip field pairs that never occur
+        self._models_with: Dict[Tuple[Optional[str], Any], Set[str]] = defaultdict(set)
+        self._fixtures_with: Dict[Tuple[Optional[str], Any], Set[str]] = defaultdict(set)
+        fixtures, models = set(), set()
+        for idx, item in enumerate(llm_items):
+            fixture, model, page = match_key(item)
+            fixture = fixture or None
+            model = model or None
+            for with_fixture in ((fixture, None) if fixture else (None,)):
+                for with_model in ((model, None) if model else (None,)):
+                    for with_page in ((page, None) if page is not None else (None,)):
+                        if with_fixture or with_model or with_page is not None:
+                            self._groups[(with_fixture, with_model, with_page)].indices.append(idx)
+            for with_page in ((page, None) if page is not None else (None,)):
+                if fixture and model:
+                    self._models_with[(fixture, with_page)].add(model)
+                    self._fixtures_with[(model, with_page)].add(fixture)
+                if with_page is not None:
+                    if model:
+                        self._models_with[(None, with_page)].add(model)
+                    if fixture:
+                        self._fixtures_with[(None, with_page)].add(fixture)
+            if fixture:
+                fixtures.add(fixture)
+            if model:
+                models.add(model)
+        self._fixtures = ContainmentIndex(fixtures)
+        self._models = ContainmentIndex(models)
+        self._choices_cache: Dict[Tuple[str, str], Dict[int, Set[Optional[str]]]] = {}
+
+    def _choices(self, field: str, value: str) -> Dict[int, Set[Optional[str]]]:
+        """Indexed values per score for one field (None: any value, the 0 score)."""
+        choices = self._choices_cache.get((field, value))
+        if choices is None:
+            if field == 'fixture':
+                index, exact_score, substring_score = self._fixtures, FIXTURE_EXACT_SCORE, FIXTURE_SUBSTRING_SCORE
+            else:
+                index, exact_score, substring_score = self._models, MODEL_EXACT_SCORE, MODEL_SUBSTRING_SCORE
+            choices = {exact_score: set(), substring_score: set(), 0: {None}}
+            if value:
+                for match in index.matches(value):
+                    choices[exact_score if match == value else substring_score].add(match)
+            self._choices_cache[(field, value)] = choices
+        return choices
+
+    @staticmethod
+    def _listed(wanted: Set[Optional[str]], listed_with: Dict[Tuple[Optional[str], Any], Set[str]],
+                other: Optional[str], page: Any) -> Set[Optional[str]]:
+        """The wanted values that occur together with `other` on page."""
+        if None in wanted or (other is None and page is None):
+            return wanted
+        listed = listed_with.get((other, page), set())
+        return listed & wanted if len(listed) > len(wanted) else wanted & listed
+
+    def _first_unused(self, fixtures: Set[Optional[str]], models: Set[Optional[str]], page: Any) -> Optional[int]:
+        """Lowest unused index over the groups of every (fixture, model) pair on page."""
+        if len(fixtures) <= len(models):
+            pairs = ((fixture, model) for fixture in fixtures
+                     for model in self._listed(models, self._models_with, fixture, page))
+        else:
+            pairs = ((fixture, model) for model in models
+                     for fixture in self._listed(fixtures, self._fixtures_with, model, page))
+        best_idx = None
+        for fixture, model in pairs:
+            group = self._groups.get((fixture, model, page))
+            idx = group.first_unused(self.used) if group is not None else None
+            if idx is not None and (best_idx is None or idx < best_idx):
+                best_idx = idx
+        return best_idx
+
+    def match(self, regex_item: Dict[str, Any]) -> Optional[int]:
+        """
+        Find and claim the best unused LLM item for a regex item.
+
+        Returns:
+            Index of the LLM item, or None if nothing scores MATCH_THRESHOLD
+        """
+        fixture, model, page = match_key(regex_item)
+        fixtures = self._choices('fixture', fixture)
+        models = self._choices('model', model)
+        pages = {PAGE_SCORE: [page] if page is not None else [], 0: [None]}
+
+        for _, combinations in SCORE_LEVELS:
+            best_idx = None
+            for fixture_score, model_score, page_score in combinations:
+                for with_page in pages[page_score]:
+                    idx = self._first_unused(fixtures[fixture_score], models[model_score], with_page)
+                    if idx is not None and (best_idx is None or idx < best_idx):
+                        best_idx = idx
+            if best_idx is not None:
+                self.used.add(best_idx)
+                return best_idx
+        return None
+
+
+def merge_item_data(base_item: Dict[str, Any], enhancement_item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge enhancement data into base item.
+
+    Prefers non-empty values, keeps base metadata (page_number, table_number,
+    row_number, line_number, raw_text).
+    """
+    merged = base_item.copy()
+    for field in ENHANCEMENT_FIELDS:
+        base_value = base_item.get(field)
+        enh_value = enhancement_item.get(field)
+        # Prefer enhancement if base is missing/empty and enhancement has value
+        if not base_value and enh_value:
+            merged[field] = enh_value
+        # If both exist, keep base if it's more detailed, otherwise use enhancement
+        elif base_value and enh_value:
+            merged[field] = base_value if len(str(base_value)) > len(str(enh_value)) else enh_value
+    return merged
+
+
+def merge_items(regex_items: List[Dict[str, Any]], llm_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge regex and LLM extracted items.
+
+    1. Regex items are the base (they have page numbers, line numbers, raw text)
+    2. Each regex item, in order, is enriched with its best matching unused LLM item
+    3. LLM items that matched nothing are appended (new discoveries), if they
+       have a page number or fixture type
+
+    Args:
+        regex_items: Items from the regex pass
+        llm_items: Items from the LLM
+
+    Returns:
+        Merged items
+    """
+    matcher = ItemMatcher(llm_items)
+    merged_items = []
+    for regex_item in regex_items:
+        idx = matcher.match(regex_item)
+        merged_items.append(merge_item_data(regex_item, llm_items[idx]) if idx is not None else regex_item.copy())
+    for idx, llm_item in enumerate(llm_items):
+        if idx not in matcher.used and (llm_item.get('page_number') or llm_item.get('fixture_type')):
+            merged_items.append(llm_item)
+    return merged_items
@@ -0,0 +1,509 @@
+"""
+Local HTTP extraction server with warm worker processes (`pdfx serve`).
+
+Worker processes import everything and build the extraction service once at
+startup, so each request only pays for the extraction itself. Jobs are
+accepted as PDF uploads or local paths and run asynchronously; progress and
+results can be streamed as NDJSON. With a state directory, jobs are kept in a
+durable job queue: a restarted server finishes the jobs it was running and
+still answers for the ones it completed.
+
+Endpoints (JSON unless noted):
+    POST /jobs                PDF bytes (Content-Type: application/pdf) or {"path": "..."}
+                              -> 202 {"job_id": ..., "status": "queued"}
+    GET  /jobs                Recent jobs
+    GET  /jobs/<id>           Job status
+    GET  /jobs/<id>/result    Full extraction result (once done)
+    GET  /jobs/<id>/stream    NDJSON: progress events as they happen, one line per item,
+                              then a final "done" or "failed" line
+    GET  /health              Worker and queue status
+"""
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from extractor.services import batch
+from extractor.services.job_queue import DONE, FAILED, PENDING, JobQueue, default_owner
+from extractor.utils import events as ev
+from extractor.utils.helpers import load_json, save_json
+
+
+# Default address (localhost only: the server reads any path it is given)
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Largest accepted upload (512 MB)
+MAX_UPLOAD_BYTES = 512 * 1024 * 1024
+
+# Upload read size
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Finished jobs kept in memory for status/result requests
+MAX_FINISHED_JOBS = 1000
+
+# Seconds between keep-alive lines on an idle NDJSON stream
+STREAM_KEEPALIVE_SECONDS = 15.0
+
+# Progress events forwarded from the workers (per-stage timings are too chatty for a stream)
+STREAMED_EVENTS = {
+    ev.PAGE_FINISHED, ev.TABLES_EXTRACTED, ev.ITEMS_FOUND, ev.LLM_STARTED,
+    ev.LLM_FINISHED, ev.STEP_STARTED, ev.STEP_FINISHED, ev.MESSAGE,
+}
+
+# Job states
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+
+# Per-process event queue back to the server, set by the pool initializer
+_event_queue = None
+
+
+def _init_server_worker(options: Dict[str, Any], queue, queue_path: Optional[str] = None) -> None:
+    global _event_queue
+    _event_queue = queue
+    batch._init_worker(options, queue_path)
+
+
+def _warm() -> int:
+    return os.getpid()
+
+
+def _run_job(job_id: str, input_path: str, document_id: Optional[int] = None,
+             output_path: Optional[str] = None) -> Dict[str, Any]:
+    """Extract one document in a worker, forwarding progress events to the server."""
+    record_page = batch.page_recorder(batch._worker_queue, document_id)
+
+    def forward(event: ev.ExtractionEvent) -> None:
+        if record_page is not None:
+            record_page(event)
+        if event.type in STREAMED_EVENTS:
+            _event_queue.put((job_id, asdict(event)))
+
+    _event_queue.put((job_id, {'type': JOB_RUNNING, 'timestamp': time.time()}))
+    try:
+        output = batch._worker_service.extract(input_path, show_progress=False, on_event=forward)
+    finally:
+        # End-of-events marker: everything this job emitted is ahead of it in the queue
+        _event_queue.put((job_id, None))
+    output = {key: value for key, value in output.items() if not key.startswith('_')}
+    if output_path:
+        save_json(output, output_path)
+    return output
+
+
+class Job:
+    """One extraction request and everything known about it."""
+
+    def __init__(self, job_id: str, input_path: str, upload: bool):
+        self.id = job_id
+        self.input_path = input_path
+        self.upload = upload
+        self.document_id: Optional[int] = None
+        self.output_path: Optional[str] = None
+        self.status = JOB_QUEUED
+        self.events: List[Dict[str, Any]] = []
+        self.events_closed = False
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.changed = threading.Condition()
+
+    @property
+    def complete(self) -> bool:
+        """Finished and all of its events received."""
+        return self.status in (JOB_DONE, JOB_FAILED) and self.events_closed
+
+    def info(self) -> Dict[str, Any]:
+        info = {
+            'job_id': self.id,
+            'status': self.status,
+            'input': None if self.upload else self.input_path,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'error': self.error,
+        }
+        if self.result is not None:
+            info['pages'] = len(self.result.get('pages') or [])
+            info['total_items_found'] = self.result.get('total_items_found')
+        return info
+
+
+class ExtractionServer:
+    """Job table, warm worker pool and HTTP front end."""
+
+    def __init__(
+        self,
+        options: Dict[str, Any],
+        jobs: int = 0,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        spool_dir: Optional[str | Path] = None,
+        state_dir: Optional[str | Path] = None
+    ):
+        """
+        Initialize the server (nothing starts until `start()`).
+
+        Args:
+            options: Service options ({'mode': ..., **factory keyword arguments})
+            jobs: Number of worker processes (0 = one per CPU core)
+            host: Address to bind
+            port: Port to bind (0 = any free port)
+            spool_dir: Directory for uploaded PDFs (default: a temporary directory)
+            state_dir: Directory for the job queue, uploads and results (None = jobs live in memory only)
+        """
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.options = batch.share_llm_quota(options, self.jobs)
+        self.host = host
+        self.port = port
+        self.queue: Optional[JobQueue] = None
+        self.results_dir: Optional[Path] = None
+        if state_dir is not None:
+            state_dir = Path(state_dir)
+            self.queue = JobQueue(state_dir / 'jobs.db')
+            self.results_dir = state_dir / 'results'
+            spool_dir = spool_dir or state_dir / 'uploads'
+        self._temporary_spool = spool_dir is None
+        self.spool_dir = Path(spool_dir or tempfile.mkdtemp(prefix='pdfx-serve-'))
+        self.owner = default_owner()
+        self._stack = ExitStack()
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._events = multiprocessing.Queue()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._dispatcher: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> None:
+        """Start and warm the workers, the event dispatcher and the HTTP listener."""
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self._start_pool()
+        if self.queue is not None:
+            self.results_dir.mkdir(parents=True, exist_ok=True)
+            self._stack.enter_context(self.queue.heartbeat(self.owner))
+        self._dispatcher = threading.Thread(target=self._dispatch_events, name='pdfx-events', daemon=True)
+        self._dispatcher.start()
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.app = self
+        self.port = self._httpd.server_address[1]
+        if self.queue is not None:
+            self._resume()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def close(self) -> None:
+        """Stop accepting requests, stop the workers and remove uploads."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._events.put(None)
+        if self.queue is not None:
+            self._stack.close()
+            # Jobs in flight are picked up again by the next start, without charging the attempt
+            self.queue.release_owner(self.owner)
+            self.queue.close()
+        if self._temporary_spool:
+            shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+    def _start_pool(self) -> None:
+        queue_path = str(self.queue.path) if self.queue is not None else None
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.jobs, initializer=_init_server_worker, initargs=(self.options, self._events, queue_path)
+        )
+        # One no-op task per worker spawns them all now, so the first request finds them warm
+        for future in [self._pool.submit(_warm) for _ in range(self.jobs)]:
+            future.result()
+
+    def submit(self, input_path: str, upload: bool = False) -> Job:
+        """
+        Queue a document for extraction.
+
+        Args:
+            input_path: PDF path
+            upload: Whether the file is a spooled upload (deleted when the job ends)
+
+        Returns:
+            The new job
+        """
+        job = Job(uuid.uuid4().hex[:12], input_path, upload)
+        if self.queue is not None:
+            job.output_path = str(self.results_dir / f"{job.id}.json")
+            job.document_id = self.queue.enqueue([(job.id, input_path, job.output_path)])[0]
+            self.queue.claim(self.owner, document_id=job.document_id)
+        self._submit(job)
+        return job
+
+    def _submit(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+            future = self._pool.submit(_run_job, job.id, job.input_path, job.document_id, job.output_path)
+        future.add_done_callback(lambda done: self._finish(job, done))
+
+    def _resume(self) -> None:
+        """Run the queued jobs a previous server process did not finish."""
+        for row in self.queue.claim(self.owner, limit=None):
+            job = Job(row['key'], row['input'], upload=Path(row['input']).parent == self.spool_dir)
+            job.document_id = row['id']
+            job.output_path = row['output']
+            job.created = row['created']
+            self._submit(job)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None and self.queue is not None:
+            row = self.queue.get(key=job_id)
+            job = self._load_job(row) if row is not None else None
+        return job
+
+    def _load_job(self, row: Dict[str, Any]) -> Job:
+        """Job finished (or queued) by an earlier server process, from its queue row."""
+        job = Job(row['key'], row['input'], upload=Path(row['input']).parent == self.spool_dir)
+        job.document_id = row['id']
+        job.output_path = row['output']
+        job.created = row['created']
+        job.status = {DONE: JOB_DONE, FAILED: JOB_FAILED, PENDING: JOB_QUEUED}.get(row['state'], JOB_RUNNING)
+        job.error = row['error']
+        job.finished = row['updated'] if job.status in (JOB_DONE, JOB_FAILED) else None
+        job.events_closed = job.finished is not None
+        if job.status == JOB_DONE:
+            try:
+                job.result = load_json(job.output_path)
+            except (OSError, ValueError):
+                job.status = JOB_FAILED
+                job.error = f"result file is gone: {job.output_path}"
+        return job
+
+    def list_jobs(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def spool_path(self) -> Path:
+        return self.spool_dir / f"{uuid.uuid4().hex}.pdf"
+
+    def _finish(self, job: Job, future) -> None:
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool) and self._retry(job, error):
+            return
+        with job.changed:
+            job.finished = time.time()
+            if error is None:
+                job.result = future.result()
+                job.status = JOB_DONE
+            else:
+                job.error = f"{type(error).__name__}: {error}"
+                job.status = JOB_FAILED
+                if isinstance(error, BrokenProcessPool):
+                    # The worker died before it could close its event stream
+                    job.events_closed = True
+            job.changed.notify_all()
+        if job.document_id is not None:
+            self.queue.finish(job.document_id, pages=len((job.result or {}).get('pages') or []),
+                              items=(job.result or {}).get('total_items_found'),
+                              seconds=job.finished - (job.started or job.created),
+                              error=job.error)
+        if job.upload:
+            try:
+                os.unlink(job.input_path)
+            except OSError:
+                pass
+        if isinstance(error, BrokenProcessPool):
+            # A worker died (e.g. out of memory): replace the pool for the jobs that follow
+            self._replace_broken_pool()
+
+    def _retry(self, job: Job, error: BaseException) -> bool:
+        """Put a job whose worker died back in the queue and resubmit it, unless it is out of attempts."""
+        if job.document_id is None:
+            return False
+        self._replace_broken_pool()
+        self.queue.release(job.document_id, f"worker process died: {error}")
+        if not self.queue.claim(self.owner, document_id=job.document_id):
+            return False
+        with job.changed:
+            job.status = JOB_QUEUED
+            job.events_closed = False
+            job.changed.notify_all()
+        self._submit(job)
+        return True
+
+    def _replace_broken_pool(self) -> None:
+        with self._lock:
+            if self._pool is not None and getattr(self._pool, '_broken', False):
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._start_pool()
+
+    def _dispatch_events(self) -> None:
+        while True:
+            message = self._events.get()
+            if message is None:
+                return
+            job_id, event = message
+            job = self.get(job_id)
+            if job is None:
+                continue
+            with job.changed:
+                if event is None:
+                    job.events_closed = True
+                elif event['type'] == JOB_RUNNING:
+                    job.status = JOB_RUNNING if job.status == JOB_QUEUED else job.status
+                    job.started = event['timestamp']
+                    job.events.append(event)
+                else:
+                    job.events.append(event)
+                job.changed.notify_all()
+
+    def _prune(self) -> None:
+        finished = [job for job in self._jobs.values() if job.status in (JOB_DONE, JOB_FAILED)]
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.id]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP request handler; the ExtractionServer is `self.server.app`."""
+
+    server_version = 'pdfx'
+
+    @property
+    def app(self) -> ExtractionServer:
+        return self.server.app
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, message: str) -> None:
+        self._send_json(status, {'error': message})
+
+    def do_GET(self):
+        parts = [part for part in self.path.split('?', 1)[0].split('/') if part]
+        if parts == ['health']:
+            jobs = self.app.list_jobs()
+            return self._send_json(200, {
+                'status': 'ok',
+                'workers': self.app.jobs,
+                'queued': sum(job.status == JOB_QUEUED for job in jobs),
+                'running': sum(job.status == JOB_RUNNING for job in jobs),
+            })
+        if parts == ['jobs']:
+            return self._send_json(200, {'jobs': [job.info() for job in self.app.list_jobs()]})
+        if len(parts) in (2, 3) and parts[0] == 'jobs':
+            job = self.app.get(parts[1])
+            if job is None:
+                return self._error(404, f"unknown job: {parts[1]}")
+            if len(parts) == 2:
+                return self._send_json(200, job.info())
+            if parts[2] == 'result':
+                if job.status == JOB_FAILED:
+                    return self._send_json(500, job.info())
+                if job.status != JOB_DONE:
+                    return self._send_json(409, job.info())
+                return self._send_json(200, job.result)
+            if parts[2] == 'stream':
+                return self._stream(job)
+        self._error(404, f"not found: {self.path}")
+
+    def do_POST(self):
+        if self.path.split('?', 1)[0].rstrip('/') != '/jobs':
+            return self._error(404, f"not found: {self.path}")
+        length = int(self.headers.get('Content-Length') or 0)
+        content_type = (self.headers.get('Content-Type') or '').split(';')[0].strip()
+
+        if content_type == 'application/json':
+            try:
+                payload = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                return self._error(400, 'invalid JSON body')
+            path = payload.get('path') if isinstance(payload, dict) else None
+            if not path or not Path(path).is_file():
+                return self._error(400, f"not a file: {path}")
+            job = self.app.submit(str(Path(path).resolve()))
+        else:
+            # Raw PDF upload, spooled to disk in chunks
+            if length <= 0:
+                return self._error(411, 'PDF upload needs a Content-Length')
+            if length > MAX_UPLOAD_BYTES:
+                return self._error(413, f"upload larger than {MAX_UPLOAD_BYTES} bytes")
+            spool_path = self.app.spool_path()
+            remaining = length
+            with open(spool_path, 'wb') as f:
+                while remaining > 0:
+                    chunk = self.rfile.read(min(UPLOAD_CHUNK_BYTES, remaining))
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    remaining -= len(chunk)
+            if remaining:
+                os.unlink(spool_path)
+                return self._error(400, 'upload ended early')
+            job = self.app.submit(str(spool_path), upload=True)
+
+        self._send_json(202, {'job_id': job.id, 'status': job.status,
+                              'stream': f"/jobs/{job.id}/stream", 'result': f"/jobs/{job.id}/result"})
+
+    def _stream(self, job: Job) -> None:
+        """Write the job's events, then its items and a final status line, as NDJSON."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        def write(record: Dict[str, Any]) -> None:
+            self.wfile.write(json.dumps(record, ensure_ascii=False, default=str).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+        sent = 0
+        try:
+            while True:
+                idle = False
+                with job.changed:
+                    if sent == len(job.events) and not job.complete:
+                        idle = not job.changed.wait(STREAM_KEEPALIVE_SECONDS)
+                    pending = job.events[sent:]
+                    complete = job.complete
+                for event in pending:
+                    write({'job_id': job.id, **event})
+                sent += len(pending)
+                if complete and sent == len(job.events):
+                    break
+                if idle:
+                    write({'job_id': job.id, 'type': 'keepalive'})
+
+            if job.status == JOB_DONE:
+                for item in job.result.get('items') or []:
+                    write({'job_id': job.id, 'type': 'item', 'item': item})
+            write({'type': job.status, **job.info()})
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away; the job keeps running
+            pass
+        # The response has no length: the stream ends when the connection closes
+        self.close_connection = True
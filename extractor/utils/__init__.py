@@ -6,16 +6,36 @@ from .helpers import (
     load_json,
     format_page_reference,
     combine_pages_text,
+    chunk_pages_text,
+    estimate_tokens,
     get_statistics,
     normalize_table_cells,
 )
+from .cache import (
+    DiskCache,
+    default_cache_dir,
+    hash_file,
+)
+from .events import ExtractionEvent, EventEmitter
+from .progress import ProgressReporter, ConsoleProgress
+from .profiling import Profiler
 
 __all__ = [
     'save_json',
     'load_json',
     'format_page_reference',
     'combine_pages_text',
+    'chunk_pages_text',
+    'estimate_tokens',
     'get_statistics',
     'normalize_table_cells',
+    'DiskCache',
+    'default_cache_dir',
+    'hash_file',
+    'ExtractionEvent',
+    'EventEmitter',
+    'ProgressReporter',
+    'ConsoleProgress',
+    'Profiler',
 ]
 
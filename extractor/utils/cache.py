@@ -0,0 +1,194 @@
+"""
+Size-bounded on-disk JSON cache with LRU eviction.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+
+# Default cache size limit (512 MB)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return the default cache directory ($PDFX_CACHE_DIR or ~/.cache/pdfx)."""
+    env_dir = os.getenv('PDFX_CACHE_DIR')
+    if env_dir:
+        return Path(env_dir)
+    return Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'pdfx'
+
+
+def hash_file(path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's content.
+
+    Args:
+        path: File path
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_settings(settings: Any) -> str:
+    """Return a short, stable hash of JSON-serializable settings."""
+    payload = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class DiskCache:
+    """
+    JSON values stored as one file per key, evicted least-recently-used first.
+
+    Reads refresh a file's modification time, so the oldest mtime is always the
+    least recently used entry. When the total size exceeds `max_bytes`, the
+    oldest entries are removed until the cache is back under 90% of the limit.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+            max_bytes: Maximum total size of cached files
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._size = None  # Computed lazily on first write
+
+    def _path(self, key: str) -> Path:
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.directory / name[:2] / f"{name}.json"
+
+    def contains(self, key: str) -> bool:
+        """Return True if the key is cached."""
+        return self._path(key).exists()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Load a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or unreadable entry
+
+        Returns:
+            Cached value or default
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return default
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting old entries if the size limit is exceeded.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+        previous = path.stat().st_size if path.exists() else 0
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(data) - previous
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def delete(self, key: str) -> None:
+        """Remove a cached value if present."""
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+            if self._size is not None:
+                self._size -= size
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        for path in self._entries():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._size = 0
+
+    def evict(self, target_bytes: Optional[int] = None) -> None:
+        """
+        Remove least recently used entries until the cache fits.
+
+        Args:
+            target_bytes: Size to shrink to (default: 90% of max_bytes)
+        """
+        if target_bytes is None:
+            target_bytes = int(self.max_bytes * 0.9)
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= target_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        self._size = total
+
+    def _entries(self):
+        if not self.directory.exists():
+            return []
+        return self.directory.glob('*/*.json')
+
+    def _scan_size(self) -> int:
+        total = 0
+        for path in self._entries():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
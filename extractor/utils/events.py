@@ -0,0 +1,129 @@
+"""
+Structured progress events emitted during extraction.
+
+Extractors and strategies report what they are doing through an
+`EventEmitter` instead of printing. Any callable taking an
+`ExtractionEvent` can subscribe: the CLI renders events to the console
+(`ConsoleProgress`), the Streamlit demo drives a progress bar, and batch
+workers pass no callback at all, so nothing is formatted or written.
+"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+# Event types
+PAGE_STARTED = 'page_started'
+PAGE_FINISHED = 'page_finished'
+TABLES_EXTRACTED = 'tables_extracted'
+ITEMS_FOUND = 'items_found'
+LLM_STARTED = 'llm_started'
+LLM_FINISHED = 'llm_finished'
+STEP_STARTED = 'step_started'
+STEP_FINISHED = 'step_finished'
+STAGE_FINISHED = 'stage_finished'  # Timing of one named hot-path stage (message = stage name)
+MESSAGE = 'message'
+
+
+@dataclass
+class ExtractionEvent:
+    """
+    One progress event.
+
+    Attributes:
+        type: Event type (one of the constants in this module)
+        page_num: Page the event refers to (1-indexed), if any
+        total_pages: Total number of pages in the document, if known
+        count: Number of things produced (items, tables, pages), if any
+        duration: Seconds spent on the finished work, for *_finished/extracted events
+        message: Human-readable text (step name, warning, error)
+        data: Extra event-specific fields
+        timestamp: time.time() when the event was created
+    """
+    type: str
+    page_num: Optional[int] = None
+    total_pages: Optional[int] = None
+    count: Optional[int] = None
+    duration: Optional[float] = None
+    message: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+
+EventCallback = Callable[[ExtractionEvent], None]
+
+
+class EventEmitter:
+    """Sends events to an optional callback; a no-op when there is no subscriber."""
+
+    def __init__(self, callback: Optional[EventCallback] = None):
+        """
+        Initialize the emitter.
+
+        Args:
+            callback: Function called with every ExtractionEvent (None = discard events)
+        """
+        self.callback = callback
+
+    def __bool__(self) -> bool:
+        return self.callback is not None
+
+    def emit(self, event_type: str, **fields) -> None:
+        """
+        Create and deliver an event.
+
+        Args:
+            event_type: Event type constant
+            **fields: ExtractionEvent fields (page_num, count, duration, message, data, ...)
+        """
+        if self.callback is not None:
+            self.callback(ExtractionEvent(event_type, **fields))
+
+    def message(self, text: str, level: str = 'info') -> None:
+        """Emit a MESSAGE event ('info' or 'warning')."""
+        self.emit(MESSAGE, message=text, data={'level': level})
+
+
+def combine_callbacks(*callbacks: Optional[EventCallback]) -> Optional[EventCallback]:
+    """
+    Fan one event stream out to several subscribers.
+
+    Args:
+        *callbacks: Event callbacks (None entries are skipped)
+
+    Returns:
+        A single callback, or None if no callbacks were given
+    """
+    callbacks = [callback for callback in callbacks if callback is not None]
+    if not callbacks:
+        return None
+    if len(callbacks) == 1:
+        return callbacks[0]
+
+    def dispatch(event: ExtractionEvent) -> None:
+        for callback in callbacks:
+            callback(event)
+    return dispatch
+
+
+@contextmanager
+def timed(events: EventEmitter, stage: str, **fields) -> Iterator[None]:
+    """
+    Time a block and emit a STAGE_FINISHED event for it.
+
+    Does nothing (not even reading the clock) when the emitter has no subscriber.
+
+    Args:
+        events: Event emitter
+        stage: Stage name, e.g. 'extract_items' or 'validate'
+        **fields: Extra ExtractionEvent fields (page_num, count, ...)
+    """
+    if not events:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        events.emit(STAGE_FINISHED, message=stage, duration=time.perf_counter() - started, **fields)
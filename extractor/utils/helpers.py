@@ -6,6 +6,13 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 
 
+# Rough characters per token for English/spec text (avoids a tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+# Default token budget of one LLM chunk (prompt and response need headroom on top)
+DEFAULT_CHUNK_TOKENS = 4000
+
+
 def save_json(data: Dict[str, Any], output_path: str | Path) -> None:
     """
     Save data to JSON file.
@@ -64,6 +71,83 @@ def combine_pages_text(pages_data: List[Dict[str, Any]]) -> str:
     return '\n\n'.join(texts)
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text.
+    
+    Args:
+        text: Text to measure
+        
+    Returns:
+        Approximate token count
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def chunk_pages_text(
+    pages_data: List[Dict[str, Any]],
+    max_tokens: int = DEFAULT_CHUNK_TOKENS
+) -> List[Dict[str, Any]]:
+    """
+    Split the text of a document into token-budgeted chunks on page boundaries.
+    
+    Each page is prefixed with a '--- Page N ---' marker so page references
+    survive the split. Consecutive pages are packed into a chunk until the
+    budget is reached; a single page larger than the budget is split on line
+    boundaries into several chunks of its own.
+    
+    Args:
+        pages_data: List of page dictionaries with 'text' and 'page_num' keys
+        max_tokens: Approximate token budget per chunk
+        
+    Returns:
+        List of chunk dictionaries with 'text' and 'pages' (page numbers in the chunk)
+    """
+    max_chars = max(1, max_tokens) * CHARS_PER_TOKEN
+    chunks = []
+    parts: List[str] = []
+    pages: List[int] = []
+    size = 0
+    
+    def flush():
+        nonlocal parts, pages, size
+        if parts:
+            chunks.append({'text': '\n\n'.join(parts), 'pages': pages})
+        parts, pages, size = [], [], 0
+    
+    for idx, page in enumerate(pages_data, start=1):
+        page_num = page.get('page_num') or idx
+        text = (page.get('text') or '').strip()
+        if not text:
+            continue
+        block = f"--- Page {page_num} ---\n{text}"
+        
+        if len(block) > max_chars:
+            # Oversized page: split on lines, repeating the marker in every piece
+            flush()
+            marker = f"--- Page {page_num} ---"
+            piece = [marker]
+            piece_size = len(marker)
+            for line in text.split('\n'):
+                if piece_size + len(line) + 1 > max_chars and len(piece) > 1:
+                    chunks.append({'text': '\n'.join(piece), 'pages': [page_num]})
+                    piece, piece_size = [marker], len(marker)
+                piece.append(line[:max_chars])
+                piece_size += min(len(line), max_chars) + 1
+            if len(piece) > 1:
+                chunks.append({'text': '\n'.join(piece), 'pages': [page_num]})
+            continue
+        
+        if parts and size + len(block) + 2 > max_chars:
+            flush()
+        parts.append(block)
+        pages.append(page_num)
+        size += len(block) + 2
+    flush()
+    
+    return chunks
+
+
 def get_statistics(pages_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Calculate statistics for extracted pages.
@@ -0,0 +1,36 @@
+"""
+Deferred package exports (PEP 562).
+
+Package `__init__` modules map their public names to the submodule defining
+them; a submodule is imported the first time one of its names is accessed,
+so `import extractor` (and the CLI's --help) does not pay for pdfplumber,
+pydantic or the LLM SDKs.
+"""
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build a package's module-level `__getattr__` and `__dir__`.
+
+    Args:
+        package: The package's `__name__`
+        exports: Public name -> relative submodule defining it (e.g. '.construction')
+
+    Returns:
+        tuple: (__getattr__, __dir__) to assign in the package's namespace
+    """
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Cache in the package namespace: later lookups do not come through here
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(importlib.import_module(package))) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,123 @@
+"""
+Per-stage timing profile of an extraction run.
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from . import events as ev
+
+
+class Profiler:
+    """
+    Event subscriber that aggregates wall time and call counts per stage.
+
+    Stages come from the events the pipeline already emits: page text / OCR /
+    table timings (PAGE_FINISHED), parser stages such as 'extract_items',
+    'parse_tables', 'validate' and 'model_dump' (STAGE_FINISHED) and LLM
+    calls (LLM_FINISHED). Code outside the pipeline (e.g. saving the JSON
+    output) can be timed with `timed()`.
+    """
+
+    def __init__(self):
+        """Initialize an empty profile; the wall clock starts now."""
+        self.started = time.perf_counter()
+        self.finished = None
+        self.stages = defaultdict(lambda: {'calls': 0, 'total': 0.0, 'max': 0.0})
+        self.pages = defaultdict(lambda: defaultdict(float))
+
+    def __call__(self, event: ev.ExtractionEvent) -> None:
+        if event.type == ev.PAGE_FINISHED:
+            for stage, seconds in event.data.get('timings', {}).items():
+                self.record(f"page.{stage}", seconds, event.page_num)
+        elif event.type == ev.STAGE_FINISHED:
+            self.record(event.message, event.duration, event.page_num)
+        elif event.type == ev.LLM_FINISHED:
+            self.record('llm', event.duration)
+
+    def record(self, stage: str, seconds: float, page_num: Optional[int] = None) -> None:
+        """
+        Add one timed call to a stage.
+
+        Args:
+            stage: Stage name
+            seconds: Wall time of the call
+            page_num: Page the call belongs to, if any
+        """
+        stats = self.stages[stage]
+        stats['calls'] += 1
+        stats['total'] += seconds
+        if seconds > stats['max']:
+            stats['max'] = seconds
+        if page_num is not None:
+            self.pages[page_num][stage] += seconds
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """Time a block of code as one call of `stage`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def stop(self) -> None:
+        """Stop the wall clock (otherwise the report uses the current time)."""
+        self.finished = time.perf_counter()
+
+    def report(self, slowest_pages: int = 10) -> Dict[str, Any]:
+        """
+        Build the profile as a JSON-serializable dictionary.
+
+        Args:
+            slowest_pages: Number of slowest pages to list
+
+        Returns:
+            Dictionary with 'wall_time', 'stages' (sorted by total time) and 'slowest_pages'
+        """
+        wall_time = (self.finished or time.perf_counter()) - self.started
+        stages = []
+        for stage, stats in sorted(self.stages.items(), key=lambda entry: -entry[1]['total']):
+            stages.append({
+                'stage': stage,
+                'calls': stats['calls'],
+                'total_seconds': round(stats['total'], 6),
+                'mean_ms': round(stats['total'] / stats['calls'] * 1000, 3) if stats['calls'] else 0.0,
+                'max_ms': round(stats['max'] * 1000, 3),
+                'percent_of_wall': round(stats['total'] / wall_time * 100, 1) if wall_time else 0.0,
+            })
+        pages = sorted(self.pages.items(), key=lambda entry: -sum(entry[1].values()))[:slowest_pages]
+        return {
+            'wall_time': round(wall_time, 6),
+            'stages': stages,
+            'slowest_pages': [
+                {
+                    'page_num': page_num,
+                    'total_seconds': round(sum(timings.values()), 6),
+                    'stages': {stage: round(seconds, 6) for stage, seconds in timings.items()},
+                }
+                for page_num, timings in pages
+            ],
+        }
+
+    def format_table(self, report: Optional[Dict[str, Any]] = None) -> str:
+        """Render the stage breakdown as a plain-text table."""
+        report = report or self.report()
+        lines = [
+            f"{'Stage':<22}{'Calls':>8}{'Total (s)':>12}{'Mean (ms)':>12}{'Max (ms)':>12}{'% wall':>9}",
+            '-' * 75,
+        ]
+        for row in report['stages']:
+            lines.append(
+                f"{row['stage']:<22}{row['calls']:>8}{row['total_seconds']:>12.3f}"
+                f"{row['mean_ms']:>12.2f}{row['max_ms']:>12.2f}{row['percent_of_wall']:>8.1f}%"
+            )
+        lines.append('-' * 75)
+        lines.append(f"{'Wall time':<22}{'':>8}{report['wall_time']:>12.3f}")
+        if report['slowest_pages']:
+            slowest = ', '.join(
+                f"p{page['page_num']} ({page['total_seconds'] * 1000:.0f} ms)" for page in report['slowest_pages'][:5]
+            )
+            lines.append(f"Slowest pages: {slowest}")
+        return '\n'.join(lines)
@@ -0,0 +1,152 @@
+"""
+Console progress reporting for page-by-page work.
+"""
+import sys
+import threading
+from typing import Optional, TextIO
+
+from . import events as ev
+
+
+SPINNER_CHARS = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+
+
+class ProgressReporter:
+    """
+    Spinner plus per-item completion lines.
+
+    On a terminal one long-lived renderer thread redraws the spinner for the
+    current step; the worker only swaps the label string, so it never sleeps,
+    waits or starts threads. When the stream is not a terminal (logs, pipes,
+    batch jobs) there is no renderer at all and only completion lines are
+    written.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, interval: float = 0.1):
+        """
+        Initialize the reporter.
+
+        Args:
+            stream: Output stream (default: sys.stdout)
+            interval: Spinner redraw interval in seconds (terminal only)
+        """
+        self.stream = stream or sys.stdout
+        self.interval = interval
+        self.animated = hasattr(self.stream, 'isatty') and self.stream.isatty()
+        self._label = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self, label: str) -> None:
+        """Show a spinner with the given label until `done()` or the next `start()`."""
+        if not self.animated:
+            return
+        self._label = label
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._render, daemon=True)
+            self._thread.start()
+
+    def done(self, message: str) -> None:
+        """Replace the spinner line with a completion line."""
+        self._label = None
+        with self._lock:
+            self.stream.write(f"\r  ✓ {message}        \n")
+            self.stream.flush()
+
+    def close(self) -> None:
+        """Stop the renderer thread (safe to call more than once)."""
+        self._label = None
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+            self._thread = None
+
+    def _render(self) -> None:
+        frame = 0
+        while not self._stopped.is_set():
+            label = self._label
+            if label is not None:
+                with self._lock:
+                    # Re-check under the lock so a finished step is never redrawn
+                    if self._label is label:
+                        self.stream.write(f"\r  {SPINNER_CHARS[frame % len(SPINNER_CHARS)]} {label}...")
+                        self.stream.flush()
+                frame += 1
+            self._stopped.wait(self.interval)
+
+    def __enter__(self) -> 'ProgressReporter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ConsoleProgress:
+    """
+    Event subscriber that renders extraction events as the CLI's console output.
+
+    Pass an instance as `on_event` (it is callable); call `close()` when the
+    run is finished to stop the spinner thread.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Initialize the console subscriber.
+
+        Args:
+            stream: Output stream (default: sys.stdout)
+        """
+        self.stream = stream or sys.stdout
+        self.reporter = ProgressReporter(self.stream)
+        self._step_open = False
+
+    def __call__(self, event: ev.ExtractionEvent) -> None:
+        if event.type == ev.PAGE_STARTED:
+            self.reporter.start(f"{event.message or 'Processing page'} {event.page_num}/{event.total_pages}")
+        elif event.type == ev.PAGE_FINISHED:
+            done = 'OCR completed page' if event.data.get('ocr') else 'Processed page'
+            self.reporter.done(f"{done} {event.page_num}/{event.total_pages}")
+        elif event.type == ev.ITEMS_FOUND:
+            self._write(f"\r  ✓ Found {event.count} items        \n")
+        elif event.type == ev.STEP_STARTED:
+            self._write(f"{self._step(event)}: {event.message}...")
+            self._step_open = True
+        elif event.type == ev.STEP_FINISHED:
+            if self._step_open:
+                self._write(" ✓\n")
+            else:
+                self._write(f"{self._step(event)}: {event.message}... ✓\n")
+            self._step_open = False
+        elif event.type == ev.LLM_STARTED:
+            pages = event.data.get('pages')
+            scope = f" ({pages} of {event.data['total_pages']} low-confidence page(s))" if pages is not None else ""
+            self._write(f"{self._step(event)}: Attempting LLM enhancement{scope}...")
+        elif event.type == ev.LLM_FINISHED:
+            status = event.data.get('status')
+            if status == 'success':
+                added = event.count or 0
+                detail = f"+{added} additional items" if added > 0 else "merged with regex"
+                self._write(f"\r{self._step(event)}: LLM enhancement successful! ✓ ({detail})\n")
+            elif status == 'skipped':
+                self._write(f"\r{self._step(event)}: LLM skipped - regex results are confident on every page ✓\n")
+            elif status == 'empty':
+                self._write(f"\r{self._step(event)}: LLM returned no items - processing without LLM... ✓\n")
+            else:
+                self._write(f"\r{self._step(event)}: LLM enhancement failed ({event.message}) - processing without LLM... ✓\n")
+        elif event.type == ev.MESSAGE:
+            end = "" if event.data.get('inline') else "\n"
+            self._write(f"\r{event.message}{end}")
+
+    def close(self) -> None:
+        """Stop the spinner renderer."""
+        self.reporter.close()
+
+    @staticmethod
+    def _step(event: ev.ExtractionEvent) -> str:
+        return f"🔄 Step {event.data.get('step')}/{event.data.get('total_steps')}"
+
+    def _write(self, text: str) -> None:
+        with self.reporter._lock:
+            self.stream.write(text)
+            self.stream.flush()
@@ -18,10 +18,17 @@ os.environ['PYTHONUNBUFFERED'] = '1'
 # Replacing stdout with buffered streams causes \r-based spinner updates to be buffered.
 
 # Now import everything else
+# (only light modules here: pdfplumber, pydantic and the LLM SDKs load when their stage runs,
+# so --help and small jobs do not pay for them - see benchmarks/import_time.py)
 import argparse
 from pathlib import Path
-from extractor.services import ExtractionServiceFactory
-from extractor.utils import save_json
+from typing import Any, Dict, List, Optional
+from extractor.extractors.tables import TABLE_BUDGET_SECONDS
+from extractor.services.extraction_service import DEFAULT_LLM_CONCURRENCY, LLM_CONFIDENCE_THRESHOLD
+from extractor.parsers.llm import LLM_CACHE_TTL_SECONDS
+from extractor.utils import save_json, default_cache_dir
+from extractor.utils.events import combine_callbacks
+from extractor.utils.progress import ConsoleProgress
 
 
 def generate_output_filename(input_path: str) -> str:
@@ -39,7 +46,108 @@ def generate_output_filename(input_path: str) -> str:
     return f"{base_name}_extracted.json"
 
 
-def main():
+def add_service_arguments(parser: argparse.ArgumentParser, page_workers: bool = True) -> None:
+    """
+    Add the extraction mode and service options shared by single-file and batch runs.
+    
+    Args:
+        parser: Argument parser to extend
+        page_workers: Whether to offer -w/--workers (page-level worker processes)
+    """
+    parser.add_argument('--standard', action='store_true',
+                        help='Use standard text extraction mode (default is construction takeoff mode)')
+    parser.add_argument('--construction', action='store_true',
+                        help='Enable construction PDF takeoff mode (default, extracts items, quantities, model numbers, etc.)')
+    parser.add_argument('--llm', type=str, choices=['openai', 'claude', 'local'], default=None,
+                        help='Use LLM for enhanced extraction (requires API key in environment; '
+                             "'local' is an offline stand-in for testing)")
+    parser.add_argument('--llm-concurrency', type=int, default=DEFAULT_LLM_CONCURRENCY, metavar='N',
+                        help='Maximum number of document chunks sent to the LLM at once '
+                             f'(default: {DEFAULT_LLM_CONCURRENCY})')
+    parser.add_argument('--llm-rpm', type=float, default=None, metavar='N',
+                        help='LLM requests per minute allowed by your provider quota (default: lowest paid tier)')
+    parser.add_argument('--llm-tpm', type=float, default=None, metavar='N',
+                        help='LLM tokens per minute allowed by your provider quota (default: lowest paid tier)')
+    parser.add_argument('--llm-cache-ttl', type=float, default=LLM_CACHE_TTL_SECONDS / 86400, metavar='DAYS',
+                        help='With --cache, reuse LLM responses for unchanged chunks for this many days '
+                             f'(default: {LLM_CACHE_TTL_SECONDS / 86400:g}, 0 = never expire)')
+    parser.add_argument('--llm-threshold', type=float, default=LLM_CONFIDENCE_THRESHOLD, metavar='SCORE',
+                        help='Only send pages whose regex confidence (0-1) is below SCORE to the LLM '
+                             f'(default: {LLM_CONFIDENCE_THRESHOLD:g}, 1 = every page)')
+    if page_workers:
+        parser.add_argument('-w', '--workers', type=int, default=1,
+                            help='Number of worker processes for page extraction (default: 1, 0 = one per CPU core)')
+    parser.add_argument('--cache', type=str, nargs='?', const=str(default_cache_dir()), default=None,
+                        metavar='DIR',
+                        help='Cache extracted pages on disk so unchanged PDFs are not re-extracted '
+                             'and LLM responses are not re-requested (default dir: $PDFX_CACHE_DIR or ~/.cache/pdfx)')
+    parser.add_argument('--table-budget', type=float, default=TABLE_BUDGET_SECONDS, metavar='SECONDS',
+                        help='Per-page time limit for table extraction; past it a page falls back to '
+                             f'text-based tables, then none (default: {TABLE_BUDGET_SECONDS:g}, 0 = no limit)')
+    parser.add_argument('--ocr-regions', action='store_true',
+                        help='OCR only the text blocks (schedules, notes, title blocks) of scanned pages '
+                             'instead of whole sheets - much faster on large drawings')
+
+
+def check_llm_keys(args: argparse.Namespace) -> None:
+    """Disable --llm (with a message) when the provider's API key is not set."""
+    if args.llm:
+        if args.llm == 'openai':
+            api_key = os.getenv('OPENAI_API_KEY')
+            if not api_key:
+                print(f"\n⚠️  Error: --llm {args.llm} requires OPENAI_API_KEY environment variable")
+                print(f"   Set it with: export OPENAI_API_KEY=your_key_here")
+                print(f"   Continuing without LLM enhancement...")
+                args.llm = None  # Disable LLM if no key
+        elif args.llm == 'claude':
+            api_key = os.getenv('ANTHROPIC_API_KEY')
+            if not api_key:
+                print(f"\n⚠️  Error: --llm {args.llm} requires ANTHROPIC_API_KEY environment variable")
+                print(f"   Set it with: export ANTHROPIC_API_KEY=your_key_here")
+                print(f"   Continuing without LLM enhancement...")
+                args.llm = None  # Disable LLM if no key
+
+
+def service_options(args: argparse.Namespace, workers: int = 1) -> Dict[str, Any]:
+    """
+    Collect the extraction service options from parsed arguments.
+    
+    Args:
+        args: Parsed arguments (see add_service_arguments)
+        workers: Page-level worker processes
+        
+    Returns:
+        {'mode': 'construction' | 'standard', **ExtractionServiceFactory keyword arguments}
+    """
+    options = {
+        'use_ocr': False,  # OCR disabled by default (requires system dependencies)
+        'workers': workers,
+        'cache_dir': args.cache,
+        'table_budget': args.table_budget,
+        'ocr_regions': args.ocr_regions,
+    }
+    if args.standard:
+        return {'mode': 'standard', **options}
+    return {
+        'mode': 'construction',
+        **options,
+        'llm_type': args.llm,  # Use --llm flag for vision models (platform-independent solution)
+        'llm_concurrency': args.llm_concurrency,
+        'llm_requests_per_minute': args.llm_rpm,
+        'llm_tokens_per_minute': args.llm_tpm,
+        'llm_cache_ttl': args.llm_cache_ttl * 86400 if args.llm_cache_ttl else None,
+        'llm_confidence_threshold': args.llm_threshold,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    # Subcommands (a PDF literally named "batch" in the working directory still wins)
+    if argv and argv[0] == 'batch' and not Path(argv[0]).exists():
+        return batch_main(argv[1:])
+    if argv and argv[0] == 'serve' and not Path(argv[0]).exists():
+        return serve_main(argv[1:])
+    
     parser = argparse.ArgumentParser(
         description='Extract and parse text from PDF files',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -49,6 +157,17 @@ Examples:
   pdfx plumbing_submittal.pdf
   pdfx plumbing_submittal.pdf --llm openai
   pdfx plumbing_submittal.pdf -o takeoff.json
+  pdfx large_submittal_set.pdf --workers 0   # one worker process per CPU core
+  pdfx plumbing_submittal.pdf --cache        # reuse extracted pages on re-runs
+  pdfx submittal_rev2.pdf --incremental set.manifest.json   # only re-extract changed sheets
+  pdfx plumbing_submittal.pdf --profile      # per-stage timing table + <output>.profile.json
+  
+  # Many documents: directories, globs or manifest files across a worker pool
+  pdfx batch submittals/ -o takeoffs/
+  pdfx batch "projects/**/*.pdf" --jobs 8
+  
+  # Local HTTP server with warm workers (uploads or paths in, NDJSON results out)
+  pdfx serve --port 8765
   
   # Standard text extraction (for general documents)
   pdfx document.pdf --standard
@@ -65,14 +184,15 @@ Examples:
     parser.add_argument('input', type=str, help='Input PDF file path (required)')
     parser.add_argument('-o', '--output', type=str, default=None, 
                         help='Output JSON file path (optional, auto-generated if not provided)')
-    parser.add_argument('--standard', action='store_true',
-                        help='Use standard text extraction mode (default is construction takeoff mode)')
-    parser.add_argument('--construction', action='store_true',
-                        help='Enable construction PDF takeoff mode (default, extracts items, quantities, model numbers, etc.)')
-    parser.add_argument('--llm', type=str, choices=['openai', 'claude'], default=None,
-                        help='Use LLM for enhanced extraction (requires API key in environment)')
+    add_service_arguments(parser)
+    parser.add_argument('--incremental', type=str, nargs='?', const='', default=None,
+                        metavar='MANIFEST',
+                        help='Only re-extract pages that changed since the run recorded in MANIFEST '
+                             '(default: <output>.manifest.json, created on first run)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print a per-stage timing breakdown and write it to <output>.profile.json')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Validate input file exists
     input_path = Path(args.input)
@@ -93,35 +213,31 @@ Examples:
     print(f"🔄 Step 1/4: Extracting text and tables from PDF{mode_str}...", flush=True)
     
     # Check for LLM flag and API keys
-    if args.llm:
-        import os
-        if args.llm == 'openai':
-            api_key = os.getenv('OPENAI_API_KEY')
-            if not api_key:
-                print(f"\n⚠️  Error: --llm {args.llm} requires OPENAI_API_KEY environment variable")
-                print(f"   Set it with: export OPENAI_API_KEY=your_key_here")
-                print(f"   Continuing without LLM enhancement...")
-                args.llm = None  # Disable LLM if no key
-        elif args.llm == 'claude':
-            api_key = os.getenv('ANTHROPIC_API_KEY')
-            if not api_key:
-                print(f"\n⚠️  Error: --llm {args.llm} requires ANTHROPIC_API_KEY environment variable")
-                print(f"   Set it with: export ANTHROPIC_API_KEY=your_key_here")
-                print(f"   Continuing without LLM enhancement...")
-                args.llm = None  # Disable LLM if no key
+    check_llm_keys(args)
     
     # Use factory to create appropriate extraction service
     # Note: For image-based PDFs, use --llm flag with vision models instead of OCR (platform-independent)
-    if use_construction_mode:
-        service = ExtractionServiceFactory.create_construction_service(
-            use_ocr=False,  # OCR disabled by default (requires system dependencies)
-            llm_type=args.llm  # Use --llm flag for vision models (platform-independent solution)
-        )
-    else:
-        service = ExtractionServiceFactory.create_standard_service(use_ocr=False)
+    from extractor.services.batch import create_service
+    service = create_service(service_options(args, workers=args.workers))
+    
+    # Progress goes to the console; with --profile the same events also feed the profiler
+    profiler = None
+    console = ConsoleProgress()
+    on_event = console
+    if args.profile:
+        from extractor.utils.profiling import Profiler
+        profiler = Profiler()
+        on_event = combine_callbacks(console, profiler)
     
     # Perform extraction using service (this will show page-by-page progress)
-    output_data = service.extract(args.input, show_progress=True)
+    try:
+        if args.incremental is not None:
+            manifest_path = args.incremental or str(Path(args.output).with_suffix('.manifest.json'))
+            output_data = service.extract_incremental(args.input, manifest_path, on_event=on_event)
+        else:
+            output_data = service.extract(args.input, on_event=on_event)
+    finally:
+        console.close()
     
     # Step 2 and 3 are handled inside the service/strategy
     # Just show that we're moving to final step
@@ -131,7 +247,13 @@ Examples:
     output_for_save = output_data.copy()
     output_for_save.pop('_llm_used', None)  # Remove internal flag before saving
     output_for_save.pop('_llm_requested', None)  # Remove internal flag before saving
-    save_json(output_for_save, args.output)
+    output_for_save.pop('_llm_pages', None)  # Remove internal flag before saving
+    if profiler:
+        with profiler.timed('save_json'):
+            save_json(output_for_save, args.output)
+        profiler.stop()
+    else:
+        save_json(output_for_save, args.output)
     print(f" ✓", flush=True)
     print(f"\n✅ Done! Results saved to: {args.output}")
     
@@ -148,7 +270,9 @@ Examples:
         print(f"  - Pages processed: {summary.get('pages_processed', 0)}")
         # Show LLM status based on usage
         if output_data.get('_llm_used'):
-            print(f"  - LLM Enhancement: ✅ Enabled")
+            print(f"  - LLM Enhancement: ✅ Enabled ({output_data.get('_llm_pages', 0)} low-confidence page(s))")
+        elif output_data.get('_llm_requested') and not output_data.get('_llm_pages'):
+            print(f"  - LLM Enhancement: ⏭️  Skipped (regex results confident on every page)")
         elif output_data.get('_llm_requested'):
             print(f"  - LLM Enhancement: ❌ Failed (using regex-only)")
     else:
@@ -158,6 +282,155 @@ Examples:
             for entity_type, values in entities.items():
                 print(f"  - {entity_type}: {len(values)} found")
     
+    if profiler:
+        report = profiler.report()
+        profile_path = Path(args.output).with_suffix('.profile.json')
+        save_json(report, profile_path)
+        print(f"\n⏱️  Profile:")
+        print(profiler.format_table(report))
+        print(f"\n   Profile saved to: {profile_path}")
+    
+    return 0
+
+
+def batch_main(argv: List[str]) -> int:
+    """
+    `pdfx batch`: extract many PDFs with a pool of worker processes.
+    
+    Args:
+        argv: Arguments after 'batch'
+        
+    Returns:
+        Exit code (1 if any document failed)
+    """
+    parser = argparse.ArgumentParser(
+        prog='pdfx batch',
+        description='Extract many PDFs with a pool of warm worker processes',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  pdfx batch submittals/                          # every PDF below the directory
+  pdfx batch "projects/**/*.pdf" -o takeoffs/     # glob (quote it so the shell does not expand it)
+  pdfx batch project_files.txt --jobs 8           # manifest: one file, directory or glob per line
+  
+  Interrupted batches resume: run the same command again and only unfinished documents are
+  extracted (progress is kept in <output-dir>/batch_queue.db).
+        """
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help='PDF files, directories, glob patterns or manifest files (one entry per line)')
+    parser.add_argument('-o', '--output-dir', type=str, default='pdfx_output',
+                        help='Directory for the per-document JSON files and batch_summary.json (default: pdfx_output)')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='Documents extracted in parallel (default: 0 = one worker process per CPU core)')
+    parser.add_argument('--queue', type=str, default=None, metavar='PATH',
+                        help='Job queue database recording progress (default: <output-dir>/batch_queue.db)')
+    parser.add_argument('--restart', action='store_true',
+                        help='Ignore progress from previous runs and extract every document again')
+    parser.add_argument('--retry-failed', action='store_true',
+                        help='Extract documents that failed in previous runs again')
+    add_service_arguments(parser, page_workers=False)
+    args = parser.parse_args(argv)
+    
+    from extractor.services.batch import SUMMARY_FILENAME, BatchRunner, collect_documents
+    
+    check_llm_keys(args)
+    documents, missing = collect_documents(args.inputs)
+    for spec in missing:
+        print(f"⚠️  No PDF files found for: {spec}")
+    if not documents:
+        print("Error: No PDF files to process")
+        return 1
+    
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    print(f"📚 Batch: {len(documents)} document(s) with {min(jobs, len(documents))} worker(s) -> {args.output_dir}",
+          flush=True)
+    
+    def on_result(result: Dict[str, Any], done: int, total: int) -> None:
+        attempt = f", attempt {result['attempts']}" if result.get('attempts', 1) > 1 else ""
+        if result['status'] == 'ok':
+            items = f", {result['items']} items" if result['items'] is not None else ""
+            print(f"  ✓ [{done}/{total}] {result['input']} "
+                  f"({result['pages']} pages{items}, {result['seconds']:.1f}s{attempt})", flush=True)
+        else:
+            print(f"  ✗ [{done}/{total}] {result['input']}: {result['error']}", flush=True)
+    
+    # Documents are the parallel unit: one page worker per document process
+    runner = BatchRunner(service_options(args, workers=1), args.output_dir, jobs=jobs, on_result=on_result,
+                         queue_path=args.queue, resume=not args.restart, retry_failed=args.retry_failed)
+    try:
+        summary = runner.run(documents)
+    except KeyboardInterrupt:
+        print(f"\n🛑 Interrupted - run the same command again to continue where it stopped", flush=True)
+        return 130
+    
+    print(f"\n📊 Batch Summary:")
+    print(f"  - Documents: {summary['succeeded']} succeeded, {summary['failed']} failed")
+    if summary['resumed']:
+        print(f"  - Resumed: {summary['resumed']} already extracted by a previous run")
+    if summary['unfinished']:
+        print(f"  - Unfinished: {summary['unfinished']} still held by another run")
+    print(f"  - Pages: {summary['pages']} ({summary['pages_per_sec']} pages/s)")
+    if not args.standard:
+        print(f"  - Items found: {summary['items']}")
+    print(f"  - Time: {summary['seconds']:.1f}s")
+    print(f"\n✅ Summary saved to: {Path(args.output_dir) / SUMMARY_FILENAME}")
+    return 1 if summary['failed'] else 0
+
+
+
+def serve_main(argv: List[str]) -> int:
+    """
+    `pdfx serve`: local HTTP extraction server with warm worker processes.
+    
+    Args:
+        argv: Arguments after 'serve'
+        
+    Returns:
+        Exit code
+    """
+    from extractor.services.server import DEFAULT_HOST, DEFAULT_PORT, ExtractionServer
+    
+    parser = argparse.ArgumentParser(
+        prog='pdfx serve',
+        description='Serve extractions over HTTP from a pool of warm worker processes',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  pdfx serve                                       # http://127.0.0.1:8765, one worker per CPU core
+  pdfx serve --port 9000 --jobs 4 --cache
+  pdfx serve --state-dir /var/lib/pdfx              # jobs survive a restart (unfinished ones are resumed)
+  
+  curl --data-binary @submittal.pdf -H 'Content-Type: application/pdf' localhost:8765/jobs
+  curl -d '{"path": "/data/submittal.pdf"}' -H 'Content-Type: application/json' localhost:8765/jobs
+  curl -N localhost:8765/jobs/<job_id>/stream      # NDJSON: progress events, items, final status
+  curl localhost:8765/jobs/<job_id>/result         # full JSON result once done
+        """
+    )
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST,
+                        help=f'Address to bind (default: {DEFAULT_HOST}; the server reads any local path it is sent)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'Port to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='Documents extracted in parallel (default: 0 = one worker process per CPU core)')
+    parser.add_argument('--state-dir', type=str, default=None, metavar='DIR',
+                        help='Keep jobs, uploads and results in DIR (SQLite job queue) so they survive a restart '
+                             '(default: in memory only)')
+    add_service_arguments(parser, page_workers=False)
+    args = parser.parse_args(argv)
+    
+    check_llm_keys(args)
+    server = ExtractionServer(service_options(args, workers=1), jobs=args.jobs, host=args.host, port=args.port,
+                              state_dir=args.state_dir)
+    print(f"🔥 Warming {server.jobs} worker(s)...", flush=True)
+    server.start()
+    print(f"🚀 Serving on {server.url} (Ctrl+C to stop)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Shutting down...", flush=True)
+    finally:
+        server.close()
     return 0
 
 